@@ -24,6 +24,39 @@ namespace Python.EmbeddingTest
             var f = new NestedTestContainer().ToPython();
             f.GetAttr(nameof(NestedTestContainer.Bar));
         }
+
+        [Test]
+        public void LazyClassMembers()
+        {
+            bool lazy = PythonEngine.InteropConfiguration.LazyClassMembers;
+            PythonEngine.InteropConfiguration.LazyClassMembers = true;
+            try
+            {
+                using var target = new LazyMembersTarget().ToPython();
+                using var type = target.GetPythonType();
+                using var dir = type.Dir();
+                Assert.IsTrue(dir.Contains(nameof(LazyMembersTarget.Increment).ToPython()));
+                Assert.IsTrue(dir.Contains(nameof(LazyMembersTarget.Value).ToPython()));
+
+                target.SetAttr(nameof(LazyMembersTarget.Value), 41.ToPython());
+                target.InvokeMethod(nameof(LazyMembersTarget.Increment)).Dispose();
+                Assert.AreEqual(42, target.GetAttr(nameof(LazyMembersTarget.Value)).As<int>());
+
+                using var dict = type.GetAttr("__dict__");
+                using var method = dict[nameof(LazyMembersTarget.Increment)];
+                StringAssert.StartsWith("<method", method.Repr());
+            }
+            finally
+            {
+                PythonEngine.InteropConfiguration.LazyClassMembers = lazy;
+            }
+        }
+    }
+
+    public class LazyMembersTarget
+    {
+        public int Value { get; set; }
+        public void Increment() => Value++;
     }
 
     public class NestedTestParent
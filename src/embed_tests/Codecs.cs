@@ -284,6 +284,40 @@ namespace Python.EmbeddingTest {
             CollectionAssert.AreEqual(intEnumerable, new List<object> { 1, 2, 3 });
         }
 
+        [TestCase("list(range(200))")]
+        [TestCase("tuple(range(200))")]
+        [TestCase("(x for x in range(200))")]
+        public void IterableDecoderReadsChunks(string iterable)
+        {
+            var config = PythonEngine.InteropConfiguration;
+            int chunkSize = config.EnumerationChunkSize;
+            config.EnumerationChunkSize = 7;
+            try
+            {
+                using var pyIterable = PythonEngine.Eval(iterable);
+                Assert.IsTrue(IterableDecoder.Instance.TryDecode(pyIterable, out IEnumerable<int> items));
+                CollectionAssert.AreEqual(Enumerable.Range(0, 200), items);
+            }
+            finally
+            {
+                config.EnumerationChunkSize = chunkSize;
+            }
+        }
+
+        [Test]
+        public void IterableDecoderReturnsItemsBeforeFailure()
+        {
+            using var pyList = PythonEngine.Eval("[1, 2, 'three', 4]");
+            Assert.IsTrue(IterableDecoder.Instance.TryDecode(pyList, out IEnumerable<int> items));
+
+            var read = new List<int>();
+            Assert.Throws<InvalidCastException>(() =>
+            {
+                foreach (int item in items) read.Add(item);
+            });
+            CollectionAssert.AreEqual(new[] { 1, 2 }, read);
+        }
+
         // regression for https://github.com/pythonnet/pythonnet/issues/1427
         [Test]
         public void PythonRegisteredDecoder_NoStackOverflowOnSystemType()
@@ -0,0 +1,76 @@
+using System;
+using System.IO;
+using System.Linq;
+
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestAssemblyIndexCache
+    {
+        string cachePath;
+
+        [SetUp]
+        public void SetUp()
+        {
+            cachePath = Path.Combine(Path.GetTempPath(), Path.GetRandomFileName());
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            File.Delete(cachePath);
+        }
+
+        [Test]
+        public void RoundTrip()
+        {
+            var assembly = typeof(TestAssemblyIndexCache).Assembly;
+            var cache = AssemblyIndexCache.Load(cachePath);
+            var expected = cache.GetIndex(assembly, AssemblyIndex.FromAssembly);
+            cache.Save();
+            Assert.IsTrue(File.Exists(cachePath));
+
+            var actual = AssemblyIndexCache.Load(cachePath).GetIndex(assembly, AssemblyIndex.FromAssembly);
+            Assert.AreNotSame(expected, actual);
+            CollectionAssert.AreEquivalent(expected.Namespaces, actual.Namespaces);
+            CollectionAssert.AreEquivalent(
+                expected.TypeNames[typeof(TestAssemblyIndexCache).Namespace],
+                actual.TypeNames[typeof(TestAssemblyIndexCache).Namespace]);
+            CollectionAssert.AreEquivalent(
+                expected.GenericTypes.Select(t => t.Namespace + "." + t.Name),
+                actual.GenericTypes.Select(t => t.Namespace + "." + t.Name));
+        }
+
+        [TestCase(typeof(TestAssemblyIndexCache))]
+        [TestCase(typeof(PythonEngine))]
+        [TestCase(typeof(object))]
+        public void MetadataMatchesReflection(Type typeFromAssembly)
+        {
+            var expected = AssemblyIndex.FromAssembly(typeFromAssembly.Assembly);
+            var actual = AssemblyIndex.FromMetadata(typeFromAssembly.Assembly);
+
+            CollectionAssert.AreEquivalent(expected.Namespaces, actual.Namespaces);
+            CollectionAssert.AreEquivalent(expected.TypeNames.Keys, actual.TypeNames.Keys);
+            foreach (var entry in expected.TypeNames)
+            {
+                CollectionAssert.AreEquivalent(entry.Value, actual.TypeNames[entry.Key], entry.Key);
+            }
+            CollectionAssert.AreEquivalent(
+                expected.GenericTypes.Select(t => t.Namespace + "." + t.Name),
+                actual.GenericTypes.Select(t => t.Namespace + "." + t.Name));
+        }
+
+        [Test]
+        public void CorruptedFileIsIgnored()
+        {
+            File.WriteAllText(cachePath, "not a cache");
+            var cache = AssemblyIndexCache.Load(cachePath);
+            var index = cache.GetIndex(typeof(TestAssemblyIndexCache).Assembly, AssemblyIndex.FromAssembly);
+            Assert.Contains(nameof(TestAssemblyIndexCache),
+                            index.TypeNames[typeof(TestAssemblyIndexCache).Namespace]);
+        }
+    }
+}
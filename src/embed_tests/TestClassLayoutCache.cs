@@ -0,0 +1,79 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Reflection;
+
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestClassLayoutCache
+    {
+        string cachePath;
+
+        [SetUp]
+        public void SetUp()
+        {
+            cachePath = Path.Combine(Path.GetTempPath(), Path.GetRandomFileName());
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            File.Delete(cachePath);
+        }
+
+        static List<MemberInfo> GetMembers(Type type)
+            => type.GetMembers(ClassManager.BindingFlags).ToList();
+
+        [TestCase(typeof(LayoutTarget))]
+        [TestCase(typeof(PythonEngine))]
+        [TestCase(typeof(string))]
+        public void RoundTrip(Type type)
+        {
+            var expected = GetMembers(type);
+            var cache = ClassLayoutCache.Load(cachePath);
+            cache.Add(type, expected);
+            cache.Save();
+            Assert.IsTrue(File.Exists(cachePath));
+
+            var actual = ClassLayoutCache.Load(cachePath).TryGetMembers(type);
+            Assert.IsNotNull(actual);
+            CollectionAssert.AreEqual(
+                expected.Select(m => (m.Module, m.MetadataToken)),
+                actual.Select(m => (m.Module, m.MetadataToken)));
+        }
+
+        [Test]
+        public void GenericTypesAreNotCached()
+        {
+            var type = typeof(List<int>);
+            var cache = ClassLayoutCache.Load(cachePath);
+            cache.Add(type, GetMembers(type));
+            Assert.IsNull(cache.TryGetMembers(type));
+        }
+
+        [Test]
+        public void CorruptedFileIsIgnored()
+        {
+            File.WriteAllText(cachePath, "not a cache");
+            var cache = ClassLayoutCache.Load(cachePath);
+            Assert.IsNull(cache.TryGetMembers(typeof(LayoutTarget)));
+        }
+
+        public class LayoutTarget
+        {
+            public int Field;
+            public int Property { get; set; }
+            public event EventHandler Event;
+            public void Method() { }
+            public void Method(int value) { }
+            public class Nested { }
+
+            public override string ToString() => base.ToString();
+        }
+    }
+}
@@ -0,0 +1,75 @@
+using System;
+using System.Threading.Tasks;
+
+using NUnit.Framework;
+
+using Python.Runtime;
+
+namespace Python.EmbeddingTest
+{
+    public class TestCoroutines
+    {
+        [OneTimeSetUp]
+        public void SetUp()
+        {
+            PythonEngine.Initialize();
+        }
+
+        [OneTimeTearDown]
+        public void Dispose()
+        {
+            PythonEngine.Shutdown();
+        }
+
+        static Task<PyObject> Run(string code)
+        {
+            using (Py.GIL())
+            {
+                using var scope = Py.CreateScope();
+                scope.Exec("import asyncio\n" + code);
+                using var coroutine = scope.Eval("main()");
+                return Py.RunCoroutine(coroutine);
+            }
+        }
+
+        static void Wait(Task task)
+        {
+            // the event loop thread needs the GIL to run the coroutine
+            IntPtr ts = PythonEngine.BeginAllowThreads();
+            try
+            {
+                Assert.IsTrue(((IAsyncResult)task).AsyncWaitHandle.WaitOne(TimeSpan.FromSeconds(10)));
+            }
+            finally
+            {
+                PythonEngine.EndAllowThreads(ts);
+            }
+        }
+
+        [Test]
+        public void RunCoroutineReturnsResult()
+        {
+            var task = Run("async def main():\n    await asyncio.sleep(0.01)\n    return 42\n");
+            Wait(task);
+            using (Py.GIL())
+            using (PyObject result = task.Result)
+            {
+                Assert.AreEqual(42, result.As<int>());
+            }
+        }
+
+        [Test]
+        public void RunCoroutinePropagatesExceptions()
+        {
+            var task = Run("async def main():\n    raise ValueError('failed')\n");
+            Wait(task);
+            Assert.IsTrue(task.IsFaulted);
+            var error = task.Exception!.InnerException as PythonException;
+            Assert.IsNotNull(error);
+            using (Py.GIL())
+            {
+                Assert.AreEqual("ValueError", error!.Type.Name);
+            }
+        }
+    }
+}
@@ -114,6 +114,83 @@ namespace Python.EmbeddingTest
             }
         }
 
+        [Test]
+        [Obsolete("GC tests are not guaranteed")]
+        public void CollectMetrics()
+        {
+            Finalizer.CollectedArgs collected = null;
+            EventHandler<Finalizer.CollectedArgs> handler = (s, e) => collected = e;
+            Finalizer.Instance.AfterCollect += handler;
+            try
+            {
+                Finalizer.Instance.Collect();
+                var before = Finalizer.Instance.GetMetrics();
+
+                MakeAGarbage(out var shortWeak, out _);
+                FullGCCollect();
+                Assert.IsFalse(shortWeak.IsAlive);
+
+                var pending = Finalizer.Instance.GetMetrics();
+                Assert.GreaterOrEqual(pending.ObjectQueueLength, 1);
+                Assert.Greater(pending.EnqueuedCount, before.EnqueuedCount);
+
+                Finalizer.Instance.Collect();
+                var after = Finalizer.Instance.GetMetrics();
+                Assert.AreEqual(0, after.ObjectQueueLength);
+                Assert.Greater(after.CollectedCount, before.CollectedCount);
+                Assert.Greater(after.CollectionCount, before.CollectionCount);
+                Assert.GreaterOrEqual(after.LargestBatch, 1);
+                Assert.GreaterOrEqual(after.TotalCollectDuration, before.TotalCollectDuration);
+
+                Assert.IsNotNull(collected, "AfterCollect was not raised");
+                Assert.GreaterOrEqual(collected.ObjectCount, 1);
+            }
+            finally
+            {
+                Finalizer.Instance.AfterCollect -= handler;
+            }
+        }
+
+        [Test]
+        [Obsolete("GC tests are not guaranteed")]
+        public void CollectInBackground()
+        {
+            long collectedBefore = Finalizer.Instance.CollectedCount;
+            Finalizer.Instance.BackgroundCollectInterval = TimeSpan.FromMilliseconds(10);
+            Finalizer.Instance.CollectInBackground = true;
+            try
+            {
+                IntPtr op = MakeAGarbage(out var shortWeak, out var longWeak);
+                FullGCCollect();
+                Assert.IsFalse(shortWeak.IsAlive);
+
+                // the background thread needs the GIL to release objects
+                IntPtr threadState = PythonEngine.BeginAllowThreads();
+                try
+                {
+                    var timeout = Stopwatch.StartNew();
+                    while (Finalizer.Instance.GetCollectedObjects().Contains(op)
+                           && timeout.Elapsed < TimeSpan.FromSeconds(5))
+                    {
+                        Thread.Sleep(10);
+                    }
+                }
+                finally
+                {
+                    PythonEngine.EndAllowThreads(threadState);
+                }
+
+                Assert.IsFalse(Finalizer.Instance.GetCollectedObjects().Contains(op),
+                    "The garbage object should be released by the background thread");
+                Assert.Greater(Finalizer.Instance.CollectedCount, collectedBefore);
+            }
+            finally
+            {
+                Finalizer.Instance.CollectInBackground = false;
+                Finalizer.Instance.BackgroundCollectInterval = TimeSpan.FromSeconds(1);
+            }
+        }
+
         [MethodImpl(MethodImplOptions.NoInlining | MethodImplOptions.NoOptimization)] // ensure lack of references to obj
         [Obsolete("GC tests are not guaranteed")]
         private static IntPtr MakeAGarbage(out WeakReference shortWeak, out WeakReference longWeak)
@@ -1,5 +1,7 @@
 namespace Python.EmbeddingTest
 {
+    using System;
+
     using NUnit.Framework;
     using Python.Runtime;
 
@@ -18,6 +20,131 @@ namespace Python.EmbeddingTest
             }
         }
 
+        [Test]
+        public void NestedAcquisitionsReleaseOnce()
+        {
+            IntPtr ts = PythonEngine.BeginAllowThreads();
+            try
+            {
+                Assert.IsFalse(Py.IsGILHeld);
+                using (Py.GIL())
+                {
+                    using (Py.GIL())
+                    {
+                        Assert.IsTrue(Py.IsGILHeld);
+                    }
+                    Assert.IsTrue(Py.IsGILHeld);
+                }
+                Assert.IsFalse(Py.IsGILHeld);
+            }
+            finally
+            {
+                PythonEngine.EndAllowThreads(ts);
+            }
+        }
+
+        [Test]
+        public void AllowThreadsSuspendsNestedAcquisitions()
+        {
+            using (Py.GIL())
+            {
+                IntPtr ts = PythonEngine.BeginAllowThreads();
+                try
+                {
+                    Assert.IsFalse(Py.IsGILHeld);
+                    using (Py.GIL())
+                    {
+                        Assert.IsTrue(Py.IsGILHeld);
+                    }
+                    Assert.IsFalse(Py.IsGILHeld);
+                }
+                finally
+                {
+                    PythonEngine.EndAllowThreads(ts);
+                }
+                Assert.IsTrue(Py.IsGILHeld);
+            }
+        }
+
+        [Test]
+        public void MustReleaseInReverseOrder()
+        {
+            var outer = Py.GIL();
+            var inner = Py.GIL();
+            Assert.Throws<InvalidOperationException>(() => outer.Dispose());
+            inner.Dispose();
+            outer.Dispose();
+        }
+
+        [Test]
+        public void StaleCopyDoesNotReleaseLaterAcquisition()
+        {
+            IntPtr ts = PythonEngine.BeginAllowThreads();
+            try
+            {
+                var first = Py.GIL();
+                var copy = first;
+                first.Dispose();
+
+                using (Py.GIL())
+                {
+                    using (Py.GIL())
+                    {
+                        copy.Dispose();
+                        Assert.IsTrue(Py.IsGILHeld);
+                    }
+                    copy.Dispose();
+                    Assert.IsTrue(Py.IsGILHeld);
+                }
+                Assert.IsFalse(Py.IsGILHeld);
+            }
+            finally
+            {
+                PythonEngine.EndAllowThreads(ts);
+            }
+        }
+
+        [Test]
+        public void CanNotReleaseWhileThreadsAreAllowed()
+        {
+            var outer = Py.GIL();
+            IntPtr ts = PythonEngine.BeginAllowThreads();
+            try
+            {
+                Assert.Throws<InvalidOperationException>(() => outer.Dispose());
+            }
+            finally
+            {
+                PythonEngine.EndAllowThreads(ts);
+            }
+            outer.Dispose();
+        }
+
+        public class RegisteredProperties
+        {
+            public bool GILHeld => Py.IsGILHeld;
+        }
+
+        [Test]
+        public void RegisteredPropertiesReleaseGIL()
+        {
+            var members = PythonEngine.InteropConfiguration.ReleaseGILMembers;
+            members.Add(typeof(RegisteredProperties));
+            try
+            {
+                using (Py.GIL())
+                {
+                    using var ob = new RegisteredProperties().ToPython();
+                    using var held = ob.GetAttr(nameof(RegisteredProperties.GILHeld));
+                    Assert.IsFalse(held.As<bool>());
+                }
+            }
+            finally
+            {
+                members.Remove(typeof(RegisteredProperties));
+            }
+        }
+
         [OneTimeSetUp]
         public void SetUp()
         {
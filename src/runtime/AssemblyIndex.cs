@@ -0,0 +1,396 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using System.Reflection;
+using System.Reflection.Metadata;
+using System.Reflection.PortableExecutable;
+using System.Runtime.CompilerServices;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Names exported to Python by an assembly: its namespaces, top-level type
+    /// names and generic type definitions.
+    /// </summary>
+    internal sealed class AssemblyIndex
+    {
+        public static readonly AssemblyIndex Empty = new(
+            Array.Empty<string>(), new Dictionary<string, string[]>(), Array.Empty<GenericTypeName>());
+
+        /// <summary>Namespaces of all exported types, including nested ones</summary>
+        public IReadOnlyList<string> Namespaces { get; }
+        /// <summary>Maps namespace to the names of exported top-level types in it</summary>
+        public IReadOnlyDictionary<string, string[]> TypeNames { get; }
+        public IReadOnlyList<GenericTypeName> GenericTypes { get; }
+
+        public readonly struct GenericTypeName
+        {
+            public readonly string Namespace;
+            public readonly string Name;
+
+            public GenericTypeName(string ns, string name)
+            {
+                Namespace = ns;
+                Name = name;
+            }
+        }
+
+        AssemblyIndex(IReadOnlyList<string> namespaces, IReadOnlyDictionary<string, string[]> typeNames,
+                      IReadOnlyList<GenericTypeName> genericTypes)
+        {
+            Namespaces = namespaces;
+            TypeNames = typeNames;
+            GenericTypes = genericTypes;
+        }
+
+        /// <summary>
+        /// Builds the index of an assembly from its types with reflection.
+        /// </summary>
+        public static AssemblyIndex FromAssembly(Assembly assembly)
+        {
+            if (assembly.GetCustomAttribute<PyExportAttribute>()?.Export == false)
+            {
+                return Empty;
+            }
+
+            var namespaces = new HashSet<string>();
+            var typeNames = new Dictionary<string, List<string>>();
+            var genericTypes = new List<GenericTypeName>();
+            foreach (Type t in AssemblyManager.GetTypes(assembly))
+            {
+                string ns = t.Namespace ?? "";
+                namespaces.Add(ns);
+
+                if (!t.IsNested)
+                {
+                    if (!typeNames.TryGetValue(ns, out var names))
+                    {
+                        names = new List<string>();
+                        typeNames.Add(ns, names);
+                    }
+                    names.Add(t.Name);
+                }
+
+                if (t.Namespace != null && t.IsGenericTypeDefinition)
+                {
+                    genericTypes.Add(new GenericTypeName(t.Namespace, t.Name));
+                }
+            }
+
+            return new AssemblyIndex(
+                namespaces.ToArray(),
+                typeNames.ToDictionary(entry => entry.Key, entry => entry.Value.ToArray()),
+                genericTypes.ToArray());
+        }
+
+        /// <summary>
+        /// Builds the index of an assembly by reading its metadata, without loading
+        /// its types. Falls back to reflection for assemblies, that are not loaded
+        /// from a single file.
+        /// </summary>
+        public static AssemblyIndex FromMetadata(Assembly assembly)
+        {
+            string? location = assembly.IsDynamic ? null : assembly.Location;
+            if (string.IsNullOrEmpty(location) || assembly.GetModules().Length != 1)
+            {
+                return FromAssembly(assembly);
+            }
+
+            try
+            {
+                return ReadMetadata(location);
+            }
+            // FileNotFoundException and FileLoadException are also thrown, when
+            // System.Reflection.Metadata or its dependencies are not deployed
+            catch (Exception e) when (e is IOException or UnauthorizedAccessException
+                                          or BadImageFormatException or InvalidOperationException)
+            {
+                Debug.WriteLine("Error reading metadata of assembly {0}. {1}", assembly, e);
+                return FromAssembly(assembly);
+            }
+        }
+
+        /// <summary>
+        /// Kept out of <see cref="FromMetadata(Assembly)"/>, so that a missing
+        /// System.Reflection.Metadata assembly fails this call, and not the JIT
+        /// compilation of the caller.
+        /// </summary>
+        [MethodImpl(MethodImplOptions.NoInlining)]
+        static AssemblyIndex ReadMetadata(string location)
+        {
+            using var peReader = new PEReader(File.OpenRead(location));
+            return FromMetadata(peReader.GetMetadataReader());
+        }
+
+        static AssemblyIndex FromMetadata(MetadataReader reader)
+        {
+            if (!IsExported(reader, reader.GetAssemblyDefinition().GetCustomAttributes()))
+            {
+                return Empty;
+            }
+
+            var namespaces = new HashSet<string>();
+            var typeNames = new Dictionary<string, List<string>>();
+            var genericTypes = new List<GenericTypeName>();
+            foreach (TypeDefinitionHandle handle in reader.TypeDefinitions)
+            {
+                TypeDefinition type = reader.GetTypeDefinition(handle);
+                if (!IsVisible(reader, type) || !IsExported(reader, type.GetCustomAttributes()))
+                {
+                    continue;
+                }
+
+                // like Type.Namespace, nested types report the namespace of their outermost type
+                TypeDefinition outermost = type;
+                while (outermost.IsNested)
+                {
+                    outermost = reader.GetTypeDefinition(outermost.GetDeclaringType());
+                }
+                string ns = reader.GetString(outermost.Namespace);
+                string name = reader.GetString(type.Name);
+                namespaces.Add(ns);
+
+                if (!type.IsNested)
+                {
+                    if (!typeNames.TryGetValue(ns, out var names))
+                    {
+                        names = new List<string>();
+                        typeNames.Add(ns, names);
+                    }
+                    names.Add(name);
+                }
+
+                if (ns.Length > 0 && type.GetGenericParameters().Count > 0)
+                {
+                    genericTypes.Add(new GenericTypeName(ns, name));
+                }
+            }
+
+            return new AssemblyIndex(
+                namespaces.ToArray(),
+                typeNames.ToDictionary(entry => entry.Key, entry => entry.Value.ToArray()),
+                genericTypes.ToArray());
+        }
+
+        /// <summary>
+        /// Matches visibility of types returned by <see cref="Assembly.GetExportedTypes"/>
+        /// </summary>
+        static bool IsVisible(MetadataReader reader, TypeDefinition type)
+        {
+            while (true)
+            {
+                var visibility = type.Attributes & TypeAttributes.VisibilityMask;
+                if (!type.IsNested)
+                {
+                    return visibility == TypeAttributes.Public;
+                }
+                if (visibility != TypeAttributes.NestedPublic)
+                {
+                    return false;
+                }
+                type = reader.GetTypeDefinition(type.GetDeclaringType());
+            }
+        }
+
+        /// <summary>
+        /// Returns <c>false</c> if the attributes contain <c>[PyExport(false)]</c>
+        /// </summary>
+        static bool IsExported(MetadataReader reader, CustomAttributeHandleCollection attributes)
+        {
+            foreach (CustomAttributeHandle handle in attributes)
+            {
+                CustomAttribute attribute = reader.GetCustomAttribute(handle);
+                bool isPyExport = attribute.Constructor.Kind switch
+                {
+                    HandleKind.MemberReference => IsPyExportAttribute(reader,
+                        reader.GetMemberReference((MemberReferenceHandle)attribute.Constructor).Parent),
+                    HandleKind.MethodDefinition => IsPyExportAttribute(reader,
+                        reader.GetMethodDefinition((MethodDefinitionHandle)attribute.Constructor).GetDeclaringType()),
+                    _ => false,
+                };
+                if (isPyExport)
+                {
+                    BlobReader value = reader.GetBlobReader(attribute.Value);
+                    value.ReadUInt16(); // prolog
+                    return value.ReadBoolean();
+                }
+            }
+            return true;
+        }
+
+        static bool IsPyExportAttribute(MetadataReader reader, EntityHandle type)
+        {
+            StringHandle ns, name;
+            switch (type.Kind)
+            {
+                case HandleKind.TypeReference:
+                    var reference = reader.GetTypeReference((TypeReferenceHandle)type);
+                    (ns, name) = (reference.Namespace, reference.Name);
+                    break;
+                case HandleKind.TypeDefinition:
+                    var definition = reader.GetTypeDefinition((TypeDefinitionHandle)type);
+                    (ns, name) = (definition.Namespace, definition.Name);
+                    break;
+                default:
+                    return false;
+            }
+            return reader.StringComparer.Equals(name, nameof(PyExportAttribute))
+                && reader.StringComparer.Equals(ns, typeof(PyExportAttribute).Namespace);
+        }
+
+        internal void Write(BinaryWriter writer)
+        {
+            WriteStrings(writer, Namespaces);
+            writer.Write(TypeNames.Count);
+            foreach (var entry in TypeNames)
+            {
+                writer.Write(entry.Key);
+                WriteStrings(writer, entry.Value);
+            }
+            writer.Write(GenericTypes.Count);
+            foreach (var generic in GenericTypes)
+            {
+                writer.Write(generic.Namespace);
+                writer.Write(generic.Name);
+            }
+        }
+
+        internal static AssemblyIndex Read(BinaryReader reader)
+        {
+            string[] namespaces = ReadStrings(reader);
+            int typeNamespaceCount = reader.ReadInt32();
+            var typeNames = new Dictionary<string, string[]>(typeNamespaceCount);
+            for (int i = 0; i < typeNamespaceCount; i++)
+            {
+                string ns = reader.ReadString();
+                typeNames[ns] = ReadStrings(reader);
+            }
+            var genericTypes = new GenericTypeName[reader.ReadInt32()];
+            for (int i = 0; i < genericTypes.Length; i++)
+            {
+                string ns = reader.ReadString();
+                genericTypes[i] = new GenericTypeName(ns, reader.ReadString());
+            }
+            return new AssemblyIndex(namespaces, typeNames, genericTypes);
+        }
+
+        static void WriteStrings(BinaryWriter writer, IReadOnlyCollection<string> strings)
+        {
+            writer.Write(strings.Count);
+            foreach (string s in strings)
+            {
+                writer.Write(s);
+            }
+        }
+
+        static string[] ReadStrings(BinaryReader reader)
+        {
+            var result = new string[reader.ReadInt32()];
+            for (int i = 0; i < result.Length; i++)
+            {
+                result[i] = reader.ReadString();
+            }
+            return result;
+        }
+    }
+
+    /// <summary>
+    /// Persists <see cref="AssemblyIndex"/>es of assemblies between processes.
+    /// Entries are keyed by assembly full name and module version ID (MVID),
+    /// which changes with every build of the assembly.
+    /// </summary>
+    internal sealed class AssemblyIndexCache
+    {
+        const string Magic = "PNAI";
+        const int FormatVersion = 1;
+
+        readonly string path;
+        readonly Dictionary<Guid, (string FullName, AssemblyIndex Index)> entries = new();
+        readonly object syncRoot = new();
+        bool modified;
+
+        AssemblyIndexCache(string path)
+        {
+            this.path = path;
+        }
+
+        /// <summary>
+        /// Loads the cache from the file at <paramref name="path"/>. Missing, outdated
+        /// or corrupted files result in an empty cache.
+        /// </summary>
+        public static AssemblyIndexCache Load(string path)
+        {
+            var cache = new AssemblyIndexCache(path);
+            bool loaded = CacheFile.TryRead(path, Magic, FormatVersion, reader =>
+            {
+                int count = reader.ReadInt32();
+                for (int i = 0; i < count; i++)
+                {
+                    var mvid = new Guid(reader.ReadBytes(16));
+                    string fullName = reader.ReadString();
+                    cache.entries[mvid] = (fullName, AssemblyIndex.Read(reader));
+                }
+            });
+            if (!loaded)
+            {
+                cache.entries.Clear();
+            }
+            return cache;
+        }
+
+        /// <summary>
+        /// Gets the index of the assembly from the cache, or builds it with
+        /// <paramref name="build"/> and caches it.
+        /// </summary>
+        public AssemblyIndex GetIndex(Assembly assembly, Func<Assembly, AssemblyIndex> build)
+        {
+            // dynamic assemblies can get new types at any time
+            if (assembly.IsDynamic)
+            {
+                return build(assembly);
+            }
+
+            Guid mvid = assembly.ManifestModule.ModuleVersionId;
+            string fullName = assembly.FullName;
+            lock (syncRoot)
+            {
+                if (entries.TryGetValue(mvid, out var entry) && entry.FullName == fullName)
+                {
+                    return entry.Index;
+                }
+            }
+
+            var index = build(assembly);
+            lock (syncRoot)
+            {
+                entries[mvid] = (fullName, index);
+                modified = true;
+            }
+            return index;
+        }
+
+        /// <summary>
+        /// Writes the cache back to its file, if new assemblies were indexed.
+        /// </summary>
+        public void Save()
+        {
+            lock (syncRoot)
+            {
+                if (!modified) return;
+
+                modified = !CacheFile.TryWrite(path, Magic, FormatVersion, writer =>
+                {
+                    writer.Write(entries.Count);
+                    foreach (var entry in entries)
+                    {
+                        writer.Write(entry.Key.ToByteArray());
+                        writer.Write(entry.Value.FullName);
+                        entry.Value.Index.Write(writer);
+                    }
+                });
+            }
+        }
+    }
+}
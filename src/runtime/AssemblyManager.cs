@@ -5,6 +5,8 @@ using System.Diagnostics;
 using System.IO;
 using System.Linq;
 using System.Reflection;
+using System.Threading;
+using System.Threading.Tasks;
 
 namespace Python.Runtime
 {
@@ -25,6 +27,21 @@ namespace Python.Runtime
         //    So for multidomain support it is better to have the dict. recreated for each app-domain initialization
         private static readonly ConcurrentDictionary<string, ConcurrentDictionary<Assembly, string>> namespaces =
             new();
+        // namespace -> names of top-level types in it (values are unused)
+        private static readonly ConcurrentDictionary<string, ConcurrentDictionary<string, byte>> typeNames =
+            new();
+        // first components of namespaces (values are unused)
+        private static readonly ConcurrentDictionary<string, byte> rootNamespaces = new();
+        // qualified name -> public type, or null if there is none, as of the generation
+        // the lookup started in. Cleared, when assemblies are scanned
+        private static readonly ConcurrentDictionary<string, (Type? Type, int Generation)> publicTypes = new();
+        private static int generation;
+
+        private static AssemblyIndexCache? indexCache;
+
+        // assemblies waiting to be scanned, when scanning is lazy
+        private static readonly ConcurrentQueue<Assembly> pendingScans = new();
+        private static bool lazyScanning;
 
 #pragma warning disable CS8618 // Non-nullable field must contain a non-null value when exiting constructor. Consider declaring as nullable.
         // domain-level handlers are initialized in Initialize
@@ -45,12 +62,17 @@ namespace Python.Runtime
         /// <summary>
         /// Initialization performed on startup of the Python runtime. Here we
         /// scan all of the currently loaded assemblies to determine exported
-        /// names, and register to be notified of new assembly loads.
+        /// names (or queue them, when scanning is lazy), and register to be
+        /// notified of new assembly loads.
         /// </summary>
         internal static void Initialize()
         {
             pypath.Clear();
 
+            string? cachePath = PythonEngine.InteropConfiguration.AssemblyIndexCachePath;
+            indexCache = string.IsNullOrEmpty(cachePath) ? null : AssemblyIndexCache.Load(cachePath!);
+            lazyScanning = PythonEngine.InteropConfiguration.LazyAssemblyScanning;
+
             AppDomain domain = AppDomain.CurrentDomain;
 
             lhandler = new AssemblyLoadEventHandler(AssemblyLoadHandler);
@@ -60,18 +82,21 @@ namespace Python.Runtime
             domain.AssemblyResolve += rhandler;
 
             Assembly[] items = domain.GetAssemblies();
-            foreach (Assembly a in items)
+            if (lazyScanning)
             {
-                try
+                foreach (Assembly a in items)
                 {
-                    ScanAssembly(a);
                     assemblies.Enqueue(a);
+                    pendingScans.Enqueue(a);
                 }
-                catch (Exception ex)
-                {
-                    Debug.WriteLine("Error scanning assembly {0}. {1}", a, ex);
-                }
+                return;
+            }
+
+            foreach (Assembly a in ScanAssemblies(items))
+            {
+                assemblies.Enqueue(a);
             }
+            indexCache?.Save();
         }
 
 
@@ -83,6 +108,12 @@ namespace Python.Runtime
             AppDomain domain = AppDomain.CurrentDomain;
             domain.AssemblyLoad -= lhandler;
             domain.AssemblyResolve -= rhandler;
+
+            while (pendingScans.TryDequeue(out _)) { }
+
+            // save assemblies loaded since initialization
+            indexCache?.Save();
+            indexCache = null;
         }
 
 
@@ -97,7 +128,14 @@ namespace Python.Runtime
         {
             Assembly assembly = args.LoadedAssembly;
             assemblies.Enqueue(assembly);
-            ScanAssembly(assembly);
+            if (lazyScanning)
+            {
+                pendingScans.Enqueue(assembly);
+            }
+            else
+            {
+                ScanAssembly(assembly);
+            }
         }
 
 
@@ -283,18 +321,76 @@ namespace Python.Runtime
         /// a.b.c.d, each of a, a.b, a.b.c and a.b.c.d are considered to
         /// be valid namespaces (to better match Python import semantics).
         /// </summary>
+        /// <remarks>
+        /// When <see cref="InteropConfiguration.AssemblyIndexCachePath"/> is set,
+        /// names exported by assemblies seen by previous processes are read from
+        /// the cache instead of being discovered with reflection.
+        /// </remarks>
         internal static void ScanAssembly(Assembly assembly)
         {
-            if (assembly.GetCustomAttribute<PyExportAttribute>()?.Export == false)
+            RegisterIndex(assembly, BuildIndex(assembly));
+        }
+
+        static AssemblyIndex BuildIndex(Assembly assembly)
+        {
+            Func<Assembly, AssemblyIndex> build = lazyScanning ? AssemblyIndex.FromMetadata : AssemblyIndex.FromAssembly;
+            return indexCache?.GetIndex(assembly, build) ?? build(assembly);
+        }
+
+        /// <summary>
+        /// Scans multiple assemblies, indexing them on the thread pool.
+        /// Returns assemblies, that were scanned successfully.
+        /// </summary>
+        static List<Assembly> ScanAssemblies(IReadOnlyList<Assembly> batch)
+        {
+            var indexes = new AssemblyIndex?[batch.Count];
+            Parallel.For(0, batch.Count, i =>
             {
-                return;
+                try
+                {
+                    indexes[i] = BuildIndex(batch[i]);
+                }
+                catch (Exception ex)
+                {
+                    Debug.WriteLine("Error scanning assembly {0}. {1}", batch[i], ex);
+                }
+            });
+
+            // registered in load order, which determines the order of generic
+            // type names with the same base name
+            var scanned = new List<Assembly>(batch.Count);
+            for (int i = 0; i < batch.Count; i++)
+            {
+                if (indexes[i] is { } index)
+                {
+                    RegisterIndex(batch[i], index);
+                    scanned.Add(batch[i]);
+                }
+            }
+            return scanned;
+        }
+
+        /// <summary>
+        /// Scans assemblies loaded since the last call, when
+        /// <see cref="InteropConfiguration.LazyAssemblyScanning"/> is enabled.
+        /// Must be called before looking up namespaces or names in them.
+        /// </summary>
+        internal static void ScanPendingAssemblies()
+        {
+            if (pendingScans.IsEmpty) return;
+
+            var batch = new List<Assembly>(pendingScans.Count);
+            while (pendingScans.TryDequeue(out Assembly assembly))
+            {
+                batch.Add(assembly);
             }
-            // A couple of things we want to do here: first, we want to
-            // gather a list of all of the namespaces contributed to by
-            // the assembly.
-            foreach (Type t in GetTypes(assembly))
+            ScanAssemblies(batch);
+        }
+
+        static void RegisterIndex(Assembly assembly, AssemblyIndex index)
+        {
+            foreach (string ns in index.Namespaces)
             {
-                string ns = t.Namespace ?? "";
                 if (!namespaces.ContainsKey(ns))
                 {
                     string[] names = ns.Split('.');
@@ -307,20 +403,39 @@ namespace Python.Runtime
                             ImportHook.AddNamespace(s);
                         }
                     }
+                    if (names[0].Length > 0)
+                    {
+                        rootNamespaces.TryAdd(names[0], 0);
+                    }
                 }
 
-                if (ns != null)
-                {
-                    namespaces[ns].TryAdd(assembly, string.Empty);
-                }
+                namespaces[ns].TryAdd(assembly, string.Empty);
+            }
 
-                if (ns != null && t.IsGenericTypeDefinition)
+            foreach (var entry in index.TypeNames)
+            {
+                var nsTypes = typeNames.GetOrAdd(entry.Key, _ => new ConcurrentDictionary<string, byte>());
+                foreach (string name in entry.Value)
                 {
-                    GenericUtil.Register(t);
+                    nsTypes.TryAdd(name, 0);
                 }
             }
+
+            foreach (var generic in index.GenericTypes)
+            {
+                GenericUtil.Register(generic.Namespace, generic.Name);
+            }
+
+            publicTypes.Clear();
+            Interlocked.Increment(ref generation);
         }
 
+        /// <summary>
+        /// Incremented every time an assembly is scanned. Names, that were not
+        /// found in earlier generations, might be exported by new assemblies.
+        /// </summary>
+        internal static int Generation => Volatile.Read(ref generation);
+
         public static AssemblyName[] ListAssemblies()
         {
             var names = new List<AssemblyName>(assemblies.Count);
@@ -337,6 +452,7 @@ namespace Python.Runtime
         /// </summary>
         public static bool IsValidNamespace(string name)
         {
+            ScanPendingAssemblies();
             return !string.IsNullOrEmpty(name) && namespaces.ContainsKey(name);
         }
 
@@ -346,14 +462,21 @@ namespace Python.Runtime
         /// </summary>
         public static IEnumerable<string> GetNamespaces ()
         {
+            ScanPendingAssemblies();
             return namespaces.Keys;
         }
 
+        /// <summary>
+        /// Returns namespaces of assemblies, that have already been scanned.
+        /// </summary>
+        internal static IEnumerable<string> GetScannedNamespaces() => namespaces.Keys;
+
         /// <summary>
         /// Returns list of assemblies that declare types in a given namespace
         /// </summary>
         public static IEnumerable<Assembly> GetAssemblies(string nsname)
         {
+            ScanPendingAssemblies();
             return !namespaces.ContainsKey(nsname) ? new List<Assembly>() : namespaces[nsname].Keys;
         }
 
@@ -362,41 +485,25 @@ namespace Python.Runtime
         /// </summary>
         public static List<string> GetNames(string nsname)
         {
-            //Dictionary<string, int> seen = new Dictionary<string, int>();
+            ScanPendingAssemblies();
             var names = new List<string>(8);
 
             List<string>? g = GenericUtil.GetGenericBaseNames(nsname);
             if (g != null)
             {
-                foreach (string n in g)
-                {
-                    names.Add(n);
-                }
+                names.AddRange(g);
             }
 
             if (namespaces.ContainsKey(nsname))
             {
-                foreach (Assembly a in namespaces[nsname].Keys)
+                if (typeNames.TryGetValue(nsname, out var nsTypes))
                 {
-                    foreach (Type t in GetTypes(a))
-                    {
-                        if ((t.Namespace ?? "") == nsname && !t.IsNested)
-                        {
-                            names.Add(t.Name);
-                        }
-                    }
+                    names.AddRange(nsTypes.Keys);
                 }
-                int nslen = nsname.Length;
-                foreach (string key in namespaces.Keys)
+                // the global namespace contains the top-level namespaces
+                if (nsname.Length == 0)
                 {
-                    if (key.Length > nslen && key.StartsWith(nsname))
-                    {
-                        //string tail = key.Substring(nslen);
-                        if (key.IndexOf('.') == -1)
-                        {
-                            names.Add(key);
-                        }
-                    }
+                    names.AddRange(rootNamespaces.Keys);
                 }
             }
             return names;
@@ -410,6 +517,61 @@ namespace Python.Runtime
         public static IEnumerable<Type> LookupTypes(string qualifiedName)
             => assemblies.Select(assembly => assembly.GetType(qualifiedName)).Where(type => type != null && IsExported(type));
 
+        /// <summary>
+        /// Returns the first public exported type with the given qualified name,
+        /// caching both found and missing types until more assemblies are scanned.
+        /// </summary>
+        /// <param name="qualifiedName">Full name of the type</param>
+        /// <param name="cacheable"><c>false</c>, if the type was not found, but might
+        /// still be defined in one of the dynamic assemblies</param>
+        internal static Type? LookupPublicType(string qualifiedName, out bool cacheable)
+        {
+            ScanPendingAssemblies();
+            // the generation is read first, so that lookups overlapping a scan
+            // are not valid in the next generation
+            int lookupGeneration = Generation;
+            cacheable = true;
+            if (publicTypes.TryGetValue(qualifiedName, out var cached) && cached.Generation == lookupGeneration)
+            {
+                return cached.Type;
+            }
+
+            foreach (Assembly assembly in CandidateAssemblies(qualifiedName))
+            {
+                Type? type = assembly.GetType(qualifiedName);
+                if (type != null && type.IsPublic && IsExported(type))
+                {
+                    publicTypes[qualifiedName] = (type, lookupGeneration);
+                    return type;
+                }
+                // types can be added to dynamic assemblies at any time
+                cacheable &= !assembly.IsDynamic;
+            }
+
+            if (cacheable)
+            {
+                publicTypes[qualifiedName] = (null, lookupGeneration);
+            }
+            return null;
+        }
+
+        /// <summary>
+        /// Assemblies, that might declare the given type, in load order.
+        /// </summary>
+        static IEnumerable<Assembly> CandidateAssemblies(string qualifiedName)
+        {
+            int dot = qualifiedName.LastIndexOf('.');
+            string ns = dot < 0 ? "" : qualifiedName.Substring(0, dot);
+            string name = qualifiedName.Substring(dot + 1);
+            if (typeNames.TryGetValue(ns, out var nsTypes) && nsTypes.ContainsKey(name)
+                && namespaces.TryGetValue(ns, out var declaring))
+            {
+                return assemblies.Where(declaring.ContainsKey);
+            }
+            // not indexed, e.g. types added to dynamic assemblies after they were scanned
+            return assemblies;
+        }
+
         internal static Type[] GetTypes(Assembly a)
         {
             if (a.IsDynamic)
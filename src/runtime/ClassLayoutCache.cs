@@ -0,0 +1,231 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Persists the members <see cref="ClassManager"/> exposes for reflected
+    /// types between processes, with overloads already in the order of
+    /// <see cref="MethodSorter"/>. Types are keyed by module version ID (MVID)
+    /// and metadata token, and so are their members, which are resolved from
+    /// their tokens instead of being discovered and filtered with reflection.
+    /// </summary>
+    /// <remarks>
+    /// Generic types, types with members declared on generic types and types
+    /// from dynamic assemblies are never cached.
+    /// </remarks>
+    internal sealed class ClassLayoutCache
+    {
+        const string Magic = "PNCL";
+        const int FormatVersion = 1;
+
+        const int MethodDefTable = 0x06;
+        const int FieldDefTable = 0x04;
+        const int TypeDefTable = 0x02;
+        const int PropertyTable = 0x17;
+        const int EventTable = 0x14;
+
+        static readonly BindingFlags DeclaredOnly = ClassManager.BindingFlags | BindingFlags.DeclaredOnly;
+
+        readonly struct MemberToken
+        {
+            public readonly Guid Module;
+            public readonly int Token;
+            // used to find properties and events, which can not be resolved from a module
+            public readonly int DeclaringType;
+
+            public MemberToken(Guid module, int token, int declaringType)
+            {
+                Module = module;
+                Token = token;
+                DeclaringType = declaringType;
+            }
+        }
+
+        readonly string path;
+        readonly Dictionary<(Guid Module, int Token), MemberToken[]> entries = new();
+        readonly Dictionary<Guid, Module> modules = new();
+        bool modified;
+
+        ClassLayoutCache(string path)
+        {
+            this.path = path;
+        }
+
+        /// <summary>
+        /// Loads the cache from the file at <paramref name="path"/>. Missing, outdated
+        /// or corrupted files result in an empty cache.
+        /// </summary>
+        public static ClassLayoutCache Load(string path)
+        {
+            var cache = new ClassLayoutCache(path);
+            bool loaded = CacheFile.TryRead(path, Magic, FormatVersion, reader =>
+            {
+                var moduleIds = new Guid[reader.ReadInt32()];
+                for (int i = 0; i < moduleIds.Length; i++)
+                {
+                    moduleIds[i] = new Guid(reader.ReadBytes(16));
+                }
+
+                int count = reader.ReadInt32();
+                for (int i = 0; i < count; i++)
+                {
+                    Guid typeModule = moduleIds[reader.ReadInt32()];
+                    int typeToken = reader.ReadInt32();
+                    var members = new MemberToken[reader.ReadInt32()];
+                    for (int m = 0; m < members.Length; m++)
+                    {
+                        members[m] = new MemberToken(moduleIds[reader.ReadInt32()], reader.ReadInt32(), reader.ReadInt32());
+                    }
+                    cache.entries[(typeModule, typeToken)] = members;
+                }
+            });
+            if (!loaded)
+            {
+                cache.entries.Clear();
+            }
+            return cache;
+        }
+
+        /// <summary>
+        /// Returns cached members of <paramref name="type"/> in their original order,
+        /// or <c>null</c>, if the type is not cached or its members can't be resolved.
+        /// </summary>
+        public List<MemberInfo>? TryGetMembers(Type type)
+        {
+            if (!entries.TryGetValue((type.Module.ModuleVersionId, type.MetadataToken), out var tokens))
+            {
+                return null;
+            }
+
+            var members = new List<MemberInfo>(tokens.Length);
+            try
+            {
+                foreach (var token in tokens)
+                {
+                    if (Resolve(token) is not { } member)
+                    {
+                        return null;
+                    }
+                    members.Add(member);
+                }
+            }
+            catch (Exception e) when (e is ArgumentException or BadImageFormatException)
+            {
+                // assembly changed without changing its MVID
+                return null;
+            }
+            return members;
+        }
+
+        MemberInfo? Resolve(MemberToken token)
+        {
+            if (!TryGetModule(token.Module, out var module))
+            {
+                return null;
+            }
+
+            return (token.Token >> 24) switch
+            {
+                MethodDefTable => module.ResolveMethod(token.Token),
+                FieldDefTable => module.ResolveField(token.Token),
+                TypeDefTable => module.ResolveType(token.Token),
+                PropertyTable => module.ResolveType(token.DeclaringType).GetProperties(DeclaredOnly)
+                                       .FirstOrDefault(p => p.MetadataToken == token.Token),
+                EventTable => module.ResolveType(token.DeclaringType).GetEvents(DeclaredOnly)
+                                    .FirstOrDefault(e => e.MetadataToken == token.Token),
+                _ => null,
+            };
+        }
+
+        bool TryGetModule(Guid mvid, out Module module)
+        {
+            if (modules.TryGetValue(mvid, out module))
+            {
+                return true;
+            }
+
+            // assemblies might have been loaded since the last lookup
+            foreach (Assembly assembly in AppDomain.CurrentDomain.GetAssemblies())
+            {
+                if (assembly.IsDynamic) continue;
+                foreach (Module m in assembly.GetModules())
+                {
+                    modules[m.ModuleVersionId] = m;
+                }
+            }
+            return modules.TryGetValue(mvid, out module);
+        }
+
+        /// <summary>
+        /// Caches the members of <paramref name="type"/>, if it can be cached.
+        /// </summary>
+        public void Add(Type type, IReadOnlyList<MemberInfo> members)
+        {
+            if (!IsCacheable(type))
+            {
+                return;
+            }
+
+            var tokens = new MemberToken[members.Count];
+            for (int i = 0; i < tokens.Length; i++)
+            {
+                MemberInfo member = members[i];
+                Type? declaringType = member.DeclaringType;
+                if (declaringType is null || !IsCacheable(declaringType)
+                    || member is MethodInfo { IsGenericMethod: true, IsGenericMethodDefinition: false })
+                {
+                    return;
+                }
+                tokens[i] = new MemberToken(member.Module.ModuleVersionId, member.MetadataToken, declaringType.MetadataToken);
+                modules[member.Module.ModuleVersionId] = member.Module;
+            }
+
+            entries[(type.Module.ModuleVersionId, type.MetadataToken)] = tokens;
+            modules[type.Module.ModuleVersionId] = type.Module;
+            modified = true;
+        }
+
+        static bool IsCacheable(Type type)
+            => !type.IsGenericType && !type.IsArray && !type.IsPointer && !type.IsByRef
+               && !type.Assembly.IsDynamic;
+
+        /// <summary>
+        /// Writes the cache back to its file, if new types were cached.
+        /// </summary>
+        public void Save()
+        {
+            if (!modified) return;
+
+            modified = !CacheFile.TryWrite(path, Magic, FormatVersion, writer =>
+            {
+                var moduleIds = entries.Keys.Select(key => key.Module)
+                    .Concat(entries.Values.SelectMany(tokens => tokens.Select(token => token.Module)))
+                    .Distinct().ToList();
+                var moduleIndexes = moduleIds.Select((id, index) => (id, index)).ToDictionary(p => p.id, p => p.index);
+
+                writer.Write(moduleIds.Count);
+                foreach (Guid id in moduleIds)
+                {
+                    writer.Write(id.ToByteArray());
+                }
+
+                writer.Write(entries.Count);
+                foreach (var entry in entries)
+                {
+                    writer.Write(moduleIndexes[entry.Key.Module]);
+                    writer.Write(entry.Key.Token);
+                    writer.Write(entry.Value.Length);
+                    foreach (var token in entry.Value)
+                    {
+                        writer.Write(moduleIndexes[token.Module]);
+                        writer.Write(token.Token);
+                        writer.Write(token.DeclaringType);
+                    }
+                }
+            });
+        }
+    }
+}
@@ -34,6 +34,7 @@ namespace Python.Runtime
                                                              BindingFlags.NonPublic;
 
         internal static Dictionary<MaybeType, ReflectedClrType> cache = new(capacity: 128);
+        private static ClassLayoutCache? layoutCache;
         private static readonly Type dtype;
 
         private ClassManager()
@@ -52,6 +53,9 @@ namespace Python.Runtime
         public static void Reset()
         {
             cache.Clear();
+
+            string? cachePath = PythonEngine.InteropConfiguration.ClassLayoutCachePath;
+            layoutCache = string.IsNullOrEmpty(cachePath) ? null : ClassLayoutCache.Load(cachePath!);
         }
 
         internal static void RemoveClasses()
@@ -61,6 +65,9 @@ namespace Python.Runtime
                 @class.Dispose();
             }
             cache.Clear();
+
+            layoutCache?.Save();
+            layoutCache = null;
         }
 
         internal static ClassManagerState SaveRuntimeData()
@@ -331,16 +338,22 @@ namespace Python.Runtime
             return ei.GetAddMethod(true) is { } add && ShouldBindMethod(add);
         }
 
-        private static ClassInfo GetClassInfo(Type type, ClassBase impl)
+        /// <summary>
+        /// Creates the Python descriptor of a class member, or a placeholder,
+        /// that creates it on first access, when <paramref name="lazy"/> is set.
+        /// </summary>
+        static PyObject CreateMember(Type type, string name, Func<ExtensionType> create, bool isDataDescriptor, bool lazy)
+            => lazy
+                ? LazyMemberObject.Create(type, name, create, isDataDescriptor).AllocObject()
+                : create().AllocObject();
+
+        /// <summary>
+        /// Returns members of the type, that are visible from Python, including
+        /// inherited ones, before filtering by accessibility.
+        /// </summary>
+        static List<MemberInfo> GetMembers(Type type)
         {
-            var ci = new ClassInfo();
-            var methods = new Dictionary<string, List<MethodBase>>();
-            MethodInfo meth;
-            ExtensionType ob;
-            string name;
-            Type tp;
             int i, n;
-
             MemberInfo[] info = type.GetMembers(BindingFlags);
             var local = new HashSet<string>();
             var items = new List<MemberInfo>();
@@ -428,6 +441,74 @@ namespace Python.Runtime
                 }
             }
 
+            return items;
+        }
+
+        static bool ShouldBindMember(MemberInfo mi) => mi switch
+        {
+            MethodInfo method => ShouldBindMethod(method),
+            ConstructorInfo ctor => !ctor.IsStatic,
+            PropertyInfo property => ShouldBindProperty(property),
+            FieldInfo field => ShouldBindField(field),
+            EventInfo @event => ShouldBindEvent(@event),
+            Type nested => nested.IsNestedPublic || nested.IsNestedFamily || nested.IsNestedFamORAssem,
+            _ => false,
+        };
+
+        /// <summary>
+        /// Arranges overloads of each method in the order <see cref="MethodBinder"/>
+        /// would sort them in, so that the order can be cached.
+        /// </summary>
+        static List<MemberInfo> SortOverloads(List<MemberInfo> members)
+        {
+            var result = new List<MemberInfo>(members.Count);
+            var overloads = new Dictionary<string, List<MaybeMethodBase<MethodBase>>>();
+            foreach (MemberInfo member in members)
+            {
+                if (member is MethodBase method)
+                {
+                    if (!overloads.TryGetValue(method.Name, out var list))
+                    {
+                        list = overloads[method.Name] = new List<MaybeMethodBase<MethodBase>>();
+                    }
+                    list.Add(method);
+                }
+                else
+                {
+                    result.Add(member);
+                }
+            }
+
+            var sorter = new MethodSorter();
+            foreach (var list in overloads.Values)
+            {
+                list.Sort(sorter);
+                result.AddRange(list.Select(method => (MemberInfo)method.Value));
+            }
+            return result;
+        }
+
+        private static ClassInfo GetClassInfo(Type type, ClassBase impl)
+        {
+            var ci = new ClassInfo();
+            bool lazy = PythonEngine.InteropConfiguration.LazyClassMembers;
+            var methods = new Dictionary<string, List<MethodBase>>();
+            MethodInfo meth;
+            string name;
+            Type tp;
+            int i;
+
+            List<MemberInfo>? items = layoutCache?.TryGetMembers(type);
+            if (items is null)
+            {
+                items = GetMembers(type).Where(ShouldBindMember).ToList();
+                if (layoutCache is not null)
+                {
+                    items = SortOverloads(items);
+                    layoutCache.Add(type, items);
+                }
+            }
+
             for (i = 0; i < items.Count; i++)
             {
                 var mi = (MemberInfo)items[i];
@@ -436,10 +517,6 @@ namespace Python.Runtime
                 {
                     case MemberTypes.Method:
                         meth = (MethodInfo)mi;
-                        if (!ShouldBindMethod(meth))
-                        {
-                            continue;
-                        }
                         name = meth.Name;
 
                         //TODO mangle?
@@ -455,11 +532,6 @@ namespace Python.Runtime
 
                     case MemberTypes.Constructor when !impl.HasCustomNew():
                         var ctor = (ConstructorInfo)mi;
-                        if (ctor.IsStatic)
-                        {
-                            continue;
-                        }
-
                         name = "__init__";
                         if (!methods.TryGetValue(name, out methodList))
                         {
@@ -471,11 +543,6 @@ namespace Python.Runtime
                     case MemberTypes.Property:
                         var pi = (PropertyInfo)mi;
 
-                        if(!ShouldBindProperty(pi))
-                        {
-                            continue;
-                        }
-
                         // Check for indexer
                         ParameterInfo[] args = pi.GetIndexParameters();
                         if (args.GetLength(0) > 0)
@@ -490,39 +557,25 @@ namespace Python.Runtime
                             continue;
                         }
 
-                        ob = new PropertyObject(pi);
-                        ci.members[pi.Name] = ob.AllocObject();
+                        ci.members[pi.Name] = CreateMember(type, pi.Name, () => new PropertyObject(pi),
+                                                           isDataDescriptor: true, lazy);
                         continue;
 
                     case MemberTypes.Field:
                         var fi = (FieldInfo)mi;
-                        if (!ShouldBindField(fi))
-                        {
-                            continue;
-                        }
-                        ob = new FieldObject(fi);
-                        ci.members[mi.Name] = ob.AllocObject();
+                        ci.members[mi.Name] = CreateMember(type, mi.Name, () => new FieldObject(fi),
+                                                           isDataDescriptor: true, lazy);
                         continue;
 
                     case MemberTypes.Event:
                         var ei = (EventInfo)mi;
-                        if (!ShouldBindEvent(ei))
-                        {
-                            continue;
-                        }
-                        ob = ei.AddMethod.IsStatic
-                            ? new EventBinding(ei)
-                            : new EventObject(ei);
-                        ci.members[ei.Name] = ob.AllocObject();
+                        ci.members[ei.Name] = CreateMember(type, ei.Name,
+                            () => ei.AddMethod.IsStatic ? new EventBinding(ei) : new EventObject(ei),
+                            isDataDescriptor: true, lazy);
                         continue;
 
                     case MemberTypes.NestedType:
                         tp = (Type)mi;
-                        if (!(tp.IsNestedPublic || tp.IsNestedFamily ||
-                              tp.IsNestedFamORAssem))
-                        {
-                            continue;
-                        }
                         // Note the given instance might be uninitialized
                         var pyType = GetClass(tp);
                         // make a copy, that could be disposed later
@@ -534,11 +587,16 @@ namespace Python.Runtime
             foreach (var iter in methods)
             {
                 name = iter.Key;
+                string methodName = name;
                 var mlist = iter.Value.ToArray();
-
-                ob = new MethodObject(type, name, mlist);
-                ci.members[name] = ob.AllocObject();
-                if (mlist.Any(OperatorMethod.IsOperatorMethod))
+                bool isOperator = mlist.Any(OperatorMethod.IsOperatorMethod);
+
+                // special and operator methods are looked up by the runtime directly
+                bool lazyMethod = lazy && !isOperator && !name.StartsWith("__")
+                                  && !ClassBase.CilToPyOpMap.ContainsKey(name);
+                ci.members[name] = CreateMember(type, name, () => CreateMethod(type, methodName, mlist),
+                                                isDataDescriptor: false, lazyMethod);
+                if (isOperator)
                 {
                     string pyName = OperatorMethod.GetPyMethodName(name);
                     string pyNameReverse = OperatorMethod.ReversePyMethodName(pyName);
@@ -552,6 +610,14 @@ namespace Python.Runtime
                 }
             }
 
+            MethodObject CreateMethod(Type type, string name, MethodBase[] overloads)
+            {
+                var method = new MethodObject(type, name, overloads);
+                // overloads from the layout cache path are already sorted
+                method.binder.sorted = layoutCache is not null;
+                return method;
+            }
+
             if (ci.indexer == null && type.IsClass)
             {
                 // Indexer may be inherited.
@@ -44,6 +44,9 @@ namespace Python.Runtime
             {
                 decoders.Add(decoder);
             }
+
+            // previously selected overloads might have been chosen without the new decoder
+            MethodBinder.InvalidateOverloadCache();
         }
 
         #region Encoding
@@ -135,6 +138,7 @@ namespace Python.Runtime
                     encoders.Dispose();
                     decoders.Dispose();
                 }
+            MethodBinder.InvalidateOverloadCache();
         }
 
         struct TypePair : IEquatable<TypePair>
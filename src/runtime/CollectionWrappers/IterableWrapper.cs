@@ -1,11 +1,18 @@
 using System;
 using System.Collections.Generic;
 using System.Collections;
+using System.Runtime.ExceptionServices;
 
 namespace Python.Runtime.CollectionWrappers
 {
     internal class IterableWrapper<T> : IEnumerable<T>
     {
+        /// <summary>
+        /// Minimal number of items read from lists and tuples per GIL acquisition.
+        /// Reading them by index has no side effects, unlike advancing an iterator.
+        /// </summary>
+        internal const int SequenceChunkSize = 64;
+
         protected readonly PyObject pyObject;
 
         public IterableWrapper(PyObject pyObj)
@@ -19,28 +26,129 @@ namespace Python.Runtime.CollectionWrappers
 
         public IEnumerator<T> GetEnumerator()
         {
-            PyIter iterObject;
+            int chunkSize = Math.Max(1, PythonEngine.InteropConfiguration.EnumerationChunkSize);
+            PyIter? iterObject = null;
+            bool isSequence;
             using (Py.GIL())
             {
-                iterObject = PyIter.GetIter(pyObject);
+                BorrowedReference type = Runtime.PyObject_TYPE(pyObject);
+                // subclasses might override __iter__
+                isSequence = type == Runtime.PyListType || type == Runtime.PyTupleType;
+                if (isSequence)
+                {
+                    chunkSize = Math.Max(chunkSize, SequenceChunkSize);
+                }
+                else
+                {
+                    iterObject = PyIter.GetIter(pyObject);
+                }
             }
+
+            var chunk = new List<T>(chunkSize);
             try
             {
+                int index = 0;
                 while (true)
                 {
-                    using var _ = Py.GIL();
-                    if (!iterObject.MoveNext())
+                    ExceptionDispatchInfo? error = null;
+                    using (Py.GIL())
+                    {
+                        try
+                        {
+                            if (iterObject is null)
+                            {
+                                index += ReadItems(index, chunkSize, chunk);
+                            }
+                            else
+                            {
+                                ReadItems(iterObject, chunkSize, chunk);
+                            }
+                        }
+                        catch (Exception e)
+                        {
+                            // items read before the failure are still returned
+                            error = ExceptionDispatchInfo.Capture(e);
+                        }
+                    }
+
+                    foreach (T item in chunk)
+                    {
+                        yield return item;
+                    }
+                    error?.Throw();
+
+                    if (chunk.Count < chunkSize)
                     {
                         break;
                     }
-                    yield return iterObject.Current.As<T>()!;
+                    chunk.Clear();
                 }
             }
             finally
             {
-                using var _ = Py.GIL();
-                iterObject.Dispose();
+                if (iterObject is not null)
+                {
+                    using var _ = Py.GIL();
+                    iterObject.Dispose();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Reads up to <paramref name="count"/> items of a list or tuple, starting
+        /// at <paramref name="start"/>, and returns the number of items read.
+        /// </summary>
+        int ReadItems(int start, int count, List<T> chunk)
+        {
+            BorrowedReference sequence = pyObject.Reference;
+            bool isList = Runtime.PyObject_TYPE(sequence) == Runtime.PyListType;
+            // lists can change size while they are enumerated
+            nint size = isList ? Runtime.PyList_Size(sequence) : Runtime.PyTuple_Size(sequence);
+            int end = (int)Math.Min(size, (nint)start + count);
+            for (int index = start; index < end; index++)
+            {
+                BorrowedReference borrowed = isList
+                    ? Runtime.PyList_GetItem(sequence, index)
+                    : Runtime.PyTuple_GetItem(sequence, index);
+                if (borrowed.IsNull)
+                {
+                    // the list was shortened by a previous conversion
+                    Exceptions.Clear();
+                    end = index;
+                    break;
+                }
+                // converting the item could run Python code, that removes it from the list
+                using var item = new NewReference(borrowed);
+                chunk.Add(Convert(item.Borrow()));
+            }
+            return Math.Max(end - start, 0);
+        }
+
+        static void ReadItems(PyIter iterObject, int count, List<T> chunk)
+        {
+            while (chunk.Count < count)
+            {
+                using var next = Runtime.PyIter_Next(iterObject);
+                if (next.IsNull())
+                {
+                    if (Exceptions.ErrorOccurred())
+                    {
+                        throw PythonException.ThrowLastAsClrException();
+                    }
+                    return;
+                }
+                chunk.Add(Convert(next.Borrow()));
+            }
+        }
+
+        static T Convert(BorrowedReference item)
+        {
+            if (!Converter.TryToManaged(item, out T value, true))
+            {
+                throw new InvalidCastException("cannot convert object to target type",
+                    PythonException.FetchCurrentOrNull(out _));
             }
+            return value;
         }
     }
 }
@@ -0,0 +1,105 @@
+using System;
+using System.Collections.Concurrent;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    partial class Converter
+    {
+        delegate object MemoryFactory(Array? array, PyBuffer? buffer, bool readOnly);
+
+        static readonly ConcurrentDictionary<Type, MemoryFactory> memoryFactories = new();
+        static readonly MethodInfo createMemory = typeof(Converter).GetMethod(
+            nameof(CreateMemory), BindingFlags.NonPublic | BindingFlags.Static);
+
+        /// <remarks>
+        /// Compares names, because on .NET Framework these types live in System.Memory,
+        /// that might not be deployed. Signatures using them can only be seen once it is loaded.
+        /// </remarks>
+        internal static bool IsSpanOrMemory(Type type)
+            => type.IsGenericType && type.Namespace == "System"
+            && type.Name is "Span`1" or "ReadOnlySpan`1" or "Memory`1" or "ReadOnlyMemory`1";
+
+        /// <summary>
+        /// Wraps a .NET array or the memory of a Python object supporting the buffer
+        /// protocol (e.g. numpy array) into <see cref="Memory{T}"/> or
+        /// <see cref="ReadOnlyMemory{T}"/> without copying.
+        /// </summary>
+        /// <remarks>
+        /// Span types can not be boxed, so for Span&lt;T&gt; and ReadOnlySpan&lt;T&gt;
+        /// this produces memory too, that <see cref="MethodInvoker"/> turns into spans.
+        /// The exported Python buffer is returned in <paramref name="buffer"/>. As long as
+        /// it is held, the exporter can not be resized (e.g. <c>bytearray.append</c> fails),
+        /// so <see cref="MethodBinder"/> releases it as soon as the call returns. Buffers,
+        /// that the caller does not release, are released by <see cref="Finalizer"/> once
+        /// the memory is collected.
+        /// </remarks>
+        static bool TryToMemory(BorrowedReference value, Type obType, out object? result, out PyBuffer? buffer)
+        {
+            result = null;
+            buffer = null;
+            Type elementType = obType.GetGenericArguments()[0];
+            if (!elementType.IsPrimitive)
+            {
+                return false;
+            }
+
+            Type definition = obType.GetGenericTypeDefinition();
+            bool readOnly = definition == typeof(ReadOnlySpan<>) || definition == typeof(ReadOnlyMemory<>);
+            var factory = memoryFactories.GetOrAdd(elementType, type
+                => (MemoryFactory)Delegate.CreateDelegate(typeof(MemoryFactory), createMemory.MakeGenericMethod(type)));
+
+            if (ManagedType.GetManagedObject(value) is CLRObject { inst: Array array })
+            {
+                if (array.GetType() != elementType.MakeArrayType())
+                {
+                    return false;
+                }
+                result = factory(array, null, readOnly);
+                return true;
+            }
+
+            if (!PyBuffer.IsSupportedBy(value))
+            {
+                return false;
+            }
+
+            var flags = PyBUF.FORMATS | PyBUF.C_CONTIGUOUS;
+            if (!readOnly)
+            {
+                flags |= PyBUF.WRITABLE;
+            }
+
+            // the buffer holds its own reference to the exporter
+            using var exporter = new PyObject(value);
+            PyBuffer exported;
+            try
+            {
+                exported = new PyBuffer(exporter, flags);
+            }
+            catch (PythonException)
+            {
+                // e.g. read-only or non-contiguous buffer
+                return false;
+            }
+
+            if (!exported.HasItemsOf(elementType))
+            {
+                exported.Dispose();
+                return false;
+            }
+
+            result = factory(null, exported, readOnly);
+            buffer = exported;
+            return true;
+        }
+
+        static object CreateMemory<T>(Array? array, PyBuffer? buffer, bool readOnly) where T : unmanaged
+        {
+            Memory<T> memory = array is not null
+                ? new Memory<T>((T[])array)
+                : new PyBufferMemoryManager<T>(buffer!, ownsBuffer: true).Memory;
+            return readOnly ? (ReadOnlyMemory<T>)memory : (object)memory;
+        }
+    }
+}
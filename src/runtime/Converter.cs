@@ -12,7 +12,7 @@ namespace Python.Runtime
     /// Performs data conversions between managed types and Python types.
     /// </summary>
     [SuppressUnmanagedCodeSecurity]
-    internal class Converter
+    internal partial class Converter
     {
         private Converter()
         {
@@ -95,8 +95,28 @@ namespace Python.Runtime
         }
 
 
+        /// <summary>
+        /// Converts a value of a statically known type to Python.
+        /// Values of primitive types are converted without boxing.
+        /// </summary>
         internal static NewReference ToPython<T>(T value)
-            => ToPython(value, typeof(T));
+        {
+            // for primitive types the JIT eliminates the boxing casts below
+            if (typeof(T) == typeof(int)) return Runtime.PyInt_FromInt32((int)(object)value!);
+            if (typeof(T) == typeof(long)) return Runtime.PyLong_FromLongLong((long)(object)value!);
+            if (typeof(T) == typeof(double)) return Runtime.PyFloat_FromDouble((double)(object)value!);
+            if (typeof(T) == typeof(float)) return Runtime.PyFloat_FromDouble((float)(object)value!);
+            if (typeof(T) == typeof(bool))
+                return new NewReference((bool)(object)value! ? Runtime.PyTrue : Runtime.PyFalse);
+            if (typeof(T) == typeof(short)) return Runtime.PyInt_FromInt32((short)(object)value!);
+            if (typeof(T) == typeof(byte)) return Runtime.PyInt_FromInt32((byte)(object)value!);
+            if (typeof(T) == typeof(sbyte)) return Runtime.PyInt_FromInt32((sbyte)(object)value!);
+            if (typeof(T) == typeof(ushort)) return Runtime.PyInt_FromInt32((ushort)(object)value!);
+            if (typeof(T) == typeof(uint)) return Runtime.PyLong_FromUnsignedLongLong((uint)(object)value!);
+            if (typeof(T) == typeof(ulong)) return Runtime.PyLong_FromUnsignedLongLong((ulong)(object)value!);
+            if (typeof(T) == typeof(char)) return Runtime.PyUnicode_FromOrdinal((char)(object)value!);
+            return ToPython(value, typeof(T));
+        }
 
         private static readonly Func<object, bool> IsTransparentProxy = GetIsTransparentProxy();
 
@@ -266,17 +286,39 @@ namespace Python.Runtime
         /// <returns>True on success</returns>
         internal static bool ToManaged(BorrowedReference value, Type type,
             out object? result, bool setError)
+            => ToManaged(value, type, out result, setError, out _);
+
+        /// <summary>
+        /// Return a managed object for the given Python object, taking funny
+        /// byref types into account.
+        /// </summary>
+        /// <param name="value">A Python object</param>
+        /// <param name="type">The desired managed type</param>
+        /// <param name="result">Receives the managed object</param>
+        /// <param name="setError">If true, call <c>Exceptions.SetError</c> with the reason for failure.</param>
+        /// <param name="buffer">
+        /// Receives the Python buffer exported for a span or memory <paramref name="type"/>.
+        /// The caller should release it once <paramref name="result"/> is not used anymore.
+        /// </param>
+        /// <returns>True on success</returns>
+        internal static bool ToManaged(BorrowedReference value, Type type,
+            out object? result, bool setError, out PyBuffer? buffer)
         {
             if (type.IsByRef)
             {
                 type = type.GetElementType();
             }
-            return Converter.ToManagedValue(value, type, out result, setError);
+            return Converter.ToManagedValue(value, type, out result, setError, out buffer);
         }
 
         internal static bool ToManagedValue(BorrowedReference value, Type obType,
             out object? result, bool setError)
+            => ToManagedValue(value, obType, out result, setError, out _);
+
+        static bool ToManagedValue(BorrowedReference value, Type obType,
+            out object? result, bool setError, out PyBuffer? buffer)
         {
+            buffer = null;
             if (obType == typeof(PyObject))
             {
                 result = new PyObject(value);
@@ -292,6 +334,11 @@ namespace Python.Runtime
                 return result is not null;
             }
 
+            if (IsSpanOrMemory(obType) && TryToMemory(value, obType, out result, out buffer))
+            {
+                return true;
+            }
+
             // Common case: if the Python value is a wrapped managed object
             // instance, just return the wrapped object.
             result = null;
@@ -588,36 +635,23 @@ namespace Python.Runtime
 
                 case TypeCode.Int32:
                     {
-                        // Python3 always use PyLong API
-                        nint num = Runtime.PyLong_AsSignedSize_t(value);
-                        if (num == -1 && Exceptions.ErrorOccurred())
+                        if (!ToInt32(value, out int num, setError))
                         {
-                            goto convert_error;
+                            return false;
                         }
-                        if (num > Int32.MaxValue || num < Int32.MinValue)
-                        {
-                            goto overflow;
-                        }
-                        result = (int)num;
+                        result = num;
                         return true;
                     }
 
                 case TypeCode.Boolean:
-                    if (value == Runtime.PyTrue)
                     {
-                        result = true;
-                        return true;
-                    }
-                    if (value == Runtime.PyFalse)
-                    {
-                        result = false;
+                        if (!ToBoolean(value, out bool b, setError))
+                        {
+                            return false;
+                        }
+                        result = b;
                         return true;
                     }
-                    if (setError)
-                    {
-                        goto type_error;
-                    }
-                    return false;
 
                 case TypeCode.Byte:
                     {
@@ -723,30 +757,12 @@ namespace Python.Runtime
 
                 case TypeCode.Int64:
                     {
-                        if (Runtime.Is32Bit)
+                        if (!ToInt64(value, out long num, setError))
                         {
-                            if (!Runtime.PyInt_Check(value))
-                            {
-                                goto type_error;
-                            }
-                            long? num = Runtime.PyLong_AsLongLong(value);
-                            if (num is null)
-                            {
-                                goto convert_error;
-                            }
-                            result = num.Value;
-                            return true;
-                        }
-                        else
-                        {
-                            nint num = Runtime.PyLong_AsSignedSize_t(value);
-                            if (num == -1 && Exceptions.ErrorOccurred())
-                            {
-                                goto convert_error;
-                            }
-                            result = (long)num;
-                            return true;
+                            return false;
                         }
+                        result = num;
+                        return true;
                     }
 
                 case TypeCode.UInt16:
@@ -792,36 +808,19 @@ namespace Python.Runtime
 
                 case TypeCode.Single:
                     {
-                        if (!Runtime.PyFloat_Check(value) && !Runtime.PyInt_Check(value))
-                        {
-                            goto type_error;
-                        }
-                        double num = Runtime.PyFloat_AsDouble(value);
-                        if (num == -1.0 && Exceptions.ErrorOccurred())
-                        {
-                            goto convert_error;
-                        }
-                        if (num > Single.MaxValue || num < Single.MinValue)
+                        if (!ToSingle(value, out float num, setError))
                         {
-                            if (!double.IsInfinity(num))
-                            {
-                                goto overflow;
-                            }
+                            return false;
                         }
-                        result = (float)num;
+                        result = num;
                         return true;
                     }
 
                 case TypeCode.Double:
                     {
-                        if (!Runtime.PyFloat_Check(value) && !Runtime.PyInt_Check(value))
+                        if (!ToDouble(value, out double num, setError))
                         {
-                            goto type_error;
-                        }
-                        double num = Runtime.PyFloat_AsDouble(value);
-                        if (num == -1.0 && Exceptions.ErrorOccurred())
-                        {
-                            goto convert_error;
+                            return false;
                         }
                         result = num;
                         return true;
@@ -831,21 +830,178 @@ namespace Python.Runtime
             }
 
         convert_error:
+            return ConversionFailed(setError);
+
+        type_error:
+            return TypeMismatch(value, obType, setError);
+
+        overflow:
+            return Overflow(setError);
+        }
+
+        /// <summary>
+        /// Converts a Python value to a statically known managed type.
+        /// Unlike <see cref="ToManaged(BorrowedReference, Type, out object?, bool)"/>,
+        /// converts Python numbers to the most common primitive types without boxing.
+        /// </summary>
+        internal static bool TryToManaged<T>(BorrowedReference value, out T result, bool setError)
+        {
+            // wrapped managed objects (e.g. boxed System.Int32) take the general path
+            if (ManagedType.GetManagedObject(value) is null)
+            {
+                // for primitive types the JIT eliminates the boxing casts below
+                if (typeof(T) == typeof(int))
+                {
+                    bool converted = ToInt32(value, out int num, setError);
+                    result = (T)(object)num;
+                    return converted;
+                }
+                if (typeof(T) == typeof(long))
+                {
+                    bool converted = ToInt64(value, out long num, setError);
+                    result = (T)(object)num;
+                    return converted;
+                }
+                if (typeof(T) == typeof(double))
+                {
+                    bool converted = ToDouble(value, out double num, setError);
+                    result = (T)(object)num;
+                    return converted;
+                }
+                if (typeof(T) == typeof(float))
+                {
+                    bool converted = ToSingle(value, out float num, setError);
+                    result = (T)(object)num;
+                    return converted;
+                }
+                if (typeof(T) == typeof(bool))
+                {
+                    bool converted = ToBoolean(value, out bool b, setError);
+                    result = (T)(object)b;
+                    return converted;
+                }
+            }
+
+            if (ToManaged(value, typeof(T), out object? boxed, setError))
+            {
+                result = (T)boxed!;
+                return true;
+            }
+            result = default!;
+            return false;
+        }
+
+        static bool ToInt32(BorrowedReference value, out int result, bool setError)
+        {
+            result = 0;
+            // Python3 always use PyLong API
+            nint num = Runtime.PyLong_AsSignedSize_t(value);
+            if (num == -1 && Exceptions.ErrorOccurred())
+            {
+                return ConversionFailed(setError);
+            }
+            if (num > Int32.MaxValue || num < Int32.MinValue)
+            {
+                return Overflow(setError);
+            }
+            result = (int)num;
+            return true;
+        }
+
+        static bool ToInt64(BorrowedReference value, out long result, bool setError)
+        {
+            result = 0;
+            if (Runtime.Is32Bit)
+            {
+                if (!Runtime.PyInt_Check(value))
+                {
+                    return TypeMismatch(value, typeof(long), setError);
+                }
+                long? num = Runtime.PyLong_AsLongLong(value);
+                if (num is null)
+                {
+                    return ConversionFailed(setError);
+                }
+                result = num.Value;
+                return true;
+            }
+            else
+            {
+                nint num = Runtime.PyLong_AsSignedSize_t(value);
+                if (num == -1 && Exceptions.ErrorOccurred())
+                {
+                    return ConversionFailed(setError);
+                }
+                result = (long)num;
+                return true;
+            }
+        }
+
+        static bool ToBoolean(BorrowedReference value, out bool result, bool setError)
+        {
+            result = value == Runtime.PyTrue;
+            if (result || value == Runtime.PyFalse)
+            {
+                return true;
+            }
+            return TypeMismatch(value, typeof(bool), setError);
+        }
+
+        static bool ToSingle(BorrowedReference value, out float result, bool setError)
+        {
+            result = 0;
+            if (!ToDouble(value, out double num, setError, typeof(float)))
+            {
+                return false;
+            }
+            if (num > Single.MaxValue || num < Single.MinValue)
+            {
+                if (!double.IsInfinity(num))
+                {
+                    return Overflow(setError);
+                }
+            }
+            result = (float)num;
+            return true;
+        }
+
+        static bool ToDouble(BorrowedReference value, out double result, bool setError, Type? obType = null)
+        {
+            result = 0;
+            if (!Runtime.PyFloat_Check(value) && !Runtime.PyInt_Check(value))
+            {
+                return TypeMismatch(value, obType ?? typeof(double), setError);
+            }
+            double num = Runtime.PyFloat_AsDouble(value);
+            if (num == -1.0 && Exceptions.ErrorOccurred())
+            {
+                return ConversionFailed(setError);
+            }
+            result = num;
+            return true;
+        }
+
+        static bool ConversionFailed(bool setError)
+        {
             if (!setError)
             {
                 Exceptions.Clear();
             }
             return false;
+        }
 
-        type_error:
+        static bool TypeMismatch(BorrowedReference value, Type obType, bool setError)
+        {
             if (setError)
             {
                 string tpName = Runtime.PyObject_GetTypeName(value);
                 Exceptions.SetError(Exceptions.TypeError, $"'{tpName}' value cannot be converted to {obType}");
             }
             return false;
+        }
 
-        overflow:
+        static bool Overflow(bool setError)
+        {
             // C# level overflow error
             if (setError)
             {
@@ -886,6 +1042,11 @@ namespace Python.Runtime
             Type elementType = obType.GetElementType();
             result = null;
 
+            if (TryCopyFromBuffer(value, obType, out result))
+            {
+                return true;
+            }
+
             using var IterObject = Runtime.PyObject_GetIter(value);
             if (IterObject.IsNull())
             {
@@ -966,6 +1127,54 @@ namespace Python.Runtime
             return true;
         }
 
+        /// <summary>
+        /// Copies the contents of a Python object, that supports the buffer protocol
+        /// (e.g. numpy array, array.array or bytes), to a new single dimensional
+        /// array at once, if buffer items have the representation of array elements.
+        /// </summary>
+        private static bool TryCopyFromBuffer(BorrowedReference value, Type obType, out object? result)
+        {
+            result = null;
+            Type elementType = obType.GetElementType();
+            if (!elementType.IsPrimitive || obType != elementType.MakeArrayType()
+                || !PyBuffer.IsSupportedBy(value))
+            {
+                return false;
+            }
+
+            using var exporter = new PyObject(value);
+            try
+            {
+                using var buffer = new PyBuffer(exporter, PyBUF.FORMATS | PyBUF.STRIDES);
+                if (buffer.Dimensions != 1 || !buffer.HasItemsOf(elementType))
+                {
+                    return false;
+                }
+
+                var items = Array.CreateInstance(elementType, buffer.Length / buffer.ItemSize);
+                if (items.Length > 0)
+                {
+                    var handle = GCHandle.Alloc(items, GCHandleType.Pinned);
+                    try
+                    {
+                        buffer.ToContiguous(handle.AddrOfPinnedObject(), BufferOrderStyle.C);
+                    }
+                    finally
+                    {
+                        handle.Free();
+                    }
+                }
+                result = items;
+                return true;
+            }
+            catch (PythonException)
+            {
+                // the exporter can not provide the requested buffer,
+                // fall back to the element by element conversion
+                return false;
+            }
+        }
+
         internal static bool IsFloatingNumber(Type type) => type == typeof(float) || type == typeof(double);
         internal static bool IsInteger(Type type)
             => type == typeof(Byte) || type == typeof(SByte)
@@ -201,16 +201,10 @@ namespace Python.Runtime
 
         public object? Dispatch(object?[] args)
         {
-            PyGILState gs = PythonEngine.AcquireLock();
-
-            try
+            using (Py.GIL())
             {
                 return TrueDispatch(args);
             }
-            finally
-            {
-                PythonEngine.ReleaseLock(gs);
-            }
         }
 
         private object? TrueDispatch(object?[] args)
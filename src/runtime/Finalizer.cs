@@ -3,7 +3,10 @@ using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.ComponentModel;
 using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using System.IO;
 using System.Linq;
+using System.Runtime.CompilerServices;
 using System.Runtime.InteropServices;
 using System.Threading;
 using System.Threading.Tasks;
@@ -17,6 +20,45 @@ namespace Python.Runtime
             public int ObjectCount { get; set; }
         }
 
+        public class CollectedArgs : EventArgs
+        {
+            /// <summary>Number of released objects</summary>
+            public long ObjectCount { get; set; }
+            /// <summary>Time spent releasing objects</summary>
+            public TimeSpan Duration { get; set; }
+            /// <summary>Time the collecting thread waited for the GIL before collection</summary>
+            public TimeSpan GILWait { get; set; }
+        }
+
+        /// <summary>
+        /// Snapshot of finalizer statistics, see <see cref="GetMetrics"/>.
+        /// </summary>
+        public sealed class Metrics
+        {
+            /// <summary>Number of finalized <see cref="PyObject"/>s waiting for release</summary>
+            public long ObjectQueueLength { get; internal set; }
+            /// <summary>Number of finalized .NET objects derived from Python types waiting for release</summary>
+            public long DerivedQueueLength { get; internal set; }
+            /// <summary>Number of finalized <see cref="PyBuffer"/>s waiting for release</summary>
+            public long BufferQueueLength { get; internal set; }
+            /// <summary>Total number of finalized objects queued for release</summary>
+            public long EnqueuedCount { get; internal set; }
+            /// <summary>Total number of queued objects released</summary>
+            public long CollectedCount { get; internal set; }
+            /// <summary>Total number of collections, that released at least one object</summary>
+            public long CollectionCount { get; internal set; }
+            /// <summary>The largest number of objects released by a single collection</summary>
+            public long LargestBatch { get; internal set; }
+            /// <summary>Total time spent releasing objects</summary>
+            public TimeSpan TotalCollectDuration { get; internal set; }
+            /// <summary>Time spent by the last collection, that released at least one object</summary>
+            public TimeSpan LastCollectDuration { get; internal set; }
+            /// <summary>Total time the background thread waited for the GIL</summary>
+            public TimeSpan TotalGILWait { get; internal set; }
+            /// <summary>Time the background thread waited for the GIL before the last collection</summary>
+            public TimeSpan LastGILWait { get; internal set; }
+        }
+
         public class ErrorArgs : EventArgs
         {
             public ErrorArgs(Exception error)
@@ -30,6 +72,11 @@ namespace Python.Runtime
         public static Finalizer Instance { get; } = new ();
 
         public event EventHandler<CollectArgs>? BeforeCollect;
+        /// <summary>
+        /// Raised after each collection, that released at least one object,
+        /// on the collecting thread while it holds the GIL.
+        /// </summary>
+        public event EventHandler<CollectedArgs>? AfterCollect;
         public event EventHandler<ErrorArgs>? ErrorHandler;
 
         const int DefaultThreshold = 200;
@@ -41,10 +88,138 @@ namespace Python.Runtime
         [DefaultValue(true)]
         public bool Enable { get; set; } = true;
 
+        /// <summary>
+        /// Release finalized Python objects on a dedicated thread instead of threads
+        /// creating Python objects. The thread wakes up after every <see cref="Threshold"/>
+        /// finalized objects, and every <see cref="BackgroundCollectInterval"/>.
+        /// </summary>
+        /// <remarks>
+        /// Finalization errors not handled by <see cref="ErrorHandler"/> can not be
+        /// propagated from the background thread, and are ignored.
+        /// </remarks>
+        [DefaultValue(false)]
+        public bool CollectInBackground
+        {
+            get => collectInBackground;
+            set
+            {
+                collectInBackground = value;
+                if (!started) return;
+
+                if (value)
+                    StartBackgroundThread();
+                else
+                    StopBackgroundThread();
+            }
+        }
+        bool collectInBackground;
+
+        /// <summary>
+        /// How often the background thread checks for finalized objects,
+        /// when <see cref="CollectInBackground"/> is enabled.
+        /// </summary>
+        public TimeSpan BackgroundCollectInterval { get; set; } = TimeSpan.FromSeconds(1);
+
+        /// <summary>
+        /// Maximum time a single background or throttled collection holds the GIL.
+        /// Objects not released in time stay queued for the next collection.
+        /// Explicit <see cref="Collect"/> calls are not limited.
+        /// </summary>
+        public TimeSpan MaxBatchDuration { get; set; } = Timeout.InfiniteTimeSpan;
+
+        /// <summary>Total number of finalized objects queued for release</summary>
+        public long EnqueuedCount => Interlocked.Read(ref _enqueued);
+        /// <summary>Total number of queued objects released</summary>
+        public long CollectedCount => Interlocked.Read(ref _collected);
+        /// <summary>Total number of collections, that released at least one object</summary>
+        public long CollectionCount => Interlocked.Read(ref _collections);
+
         private readonly ConcurrentQueue<PendingFinalization> _objQueue = new();
         private readonly ConcurrentQueue<PendingFinalization> _derivedQueue = new();
         private readonly ConcurrentQueue<Py_buffer> _bufferQueue = new();
         private int _throttled;
+        private long _enqueued;
+        private long _collected;
+        private long _collections;
+        private long _largestBatch;
+        // durations are in Stopwatch ticks
+        private long _collectDuration;
+        private long _lastCollectDuration;
+        private long _gilWait;
+        private long _lastGILWait;
+
+        /// <summary>
+        /// Publishes finalizer statistics through <see cref="System.Diagnostics.Metrics"/>
+        /// as instruments of the "Python.Runtime" meter.
+        /// </summary>
+        /// <remarks>
+        /// Only touched through <see cref="UpdateMetrics"/>, so that a missing
+        /// System.Diagnostics.DiagnosticSource assembly disables the metrics
+        /// instead of failing <see cref="Finalizer"/>.
+        /// </remarks>
+        static class MeterInstruments
+        {
+            static readonly Meter meter = new("Python.Runtime");
+            static readonly Histogram<double> collectDurationHistogram = meter.CreateHistogram<double>(
+                "pythonnet.finalizer.collect.duration", unit: "ms",
+                description: "Time spent releasing finalized Python objects per collection");
+            static readonly Histogram<long> batchSizeHistogram = meter.CreateHistogram<long>(
+                "pythonnet.finalizer.collect.objects", unit: "{object}",
+                description: "Number of finalized Python objects released per collection");
+            static readonly Histogram<double> gilWaitHistogram = meter.CreateHistogram<double>(
+                "pythonnet.finalizer.gil_wait", unit: "ms",
+                description: "Time the finalizer thread waited for the GIL before collection");
+            static readonly ObservableGauge<long> queueLengthGauge = meter.CreateObservableGauge(
+                "pythonnet.finalizer.queue.length", ObserveQueueLengths, unit: "{object}",
+                description: "Number of finalized Python objects waiting for release");
+            static readonly ObservableCounter<long> enqueuedCounter = meter.CreateObservableCounter(
+                "pythonnet.finalizer.enqueued", () => Instance.EnqueuedCount, unit: "{object}",
+                description: "Total number of finalized Python objects queued for release");
+            static readonly ObservableCounter<long> collectedCounter = meter.CreateObservableCounter(
+                "pythonnet.finalizer.collected", () => Instance.CollectedCount, unit: "{object}",
+                description: "Total number of finalized Python objects released");
+
+            [MethodImpl(MethodImplOptions.NoInlining)]
+            public static void Initialize() => GC.KeepAlive(meter);
+
+            [MethodImpl(MethodImplOptions.NoInlining)]
+            public static void RecordCollection(TimeSpan duration, long collected, TimeSpan gilWait)
+            {
+                collectDurationHistogram.Record(duration.TotalMilliseconds);
+                batchSizeHistogram.Record(collected);
+                gilWaitHistogram.Record(gilWait.TotalMilliseconds);
+            }
+
+            static IEnumerable<Measurement<long>> ObserveQueueLengths()
+            {
+                var instance = Instance;
+                yield return new(instance._objQueue.Count, new KeyValuePair<string, object?>("queue", "object"));
+                yield return new(instance._derivedQueue.Count, new KeyValuePair<string, object?>("queue", "derived"));
+                yield return new(instance._bufferQueue.Count, new KeyValuePair<string, object?>("queue", "buffer"));
+            }
+        }
+
+        static volatile bool metricsUnavailable;
+
+        static void UpdateMetrics(Action update)
+        {
+            if (metricsUnavailable) return;
+
+            try
+            {
+                update();
+            }
+            catch (Exception e) when (e is FileNotFoundException or FileLoadException or TypeLoadException
+                                      || e is TypeInitializationException { InnerException: FileNotFoundException or FileLoadException or TypeLoadException })
+            {
+                metricsUnavailable = true;
+            }
+        }
+
+        private readonly object _backgroundLock = new();
+        private readonly AutoResetEvent _collectRequested = new(false);
+        private Thread? _backgroundThread;
+        private volatile bool _stopBackgroundThread;
 
         #region FINALIZER_CHECK
 
@@ -116,9 +291,32 @@ namespace Python.Runtime
             _throttled = unchecked(this._throttled + 1);
             if (!started || !Enable || _throttled < Threshold) return;
             _throttled = 0;
-            this.Collect();
+            // the background thread is woken up as objects are queued
+            if (_backgroundThread is not null) return;
+            this.DisposeAll(timeLimit: MaxBatchDuration);
         }
 
+        /// <summary>
+        /// Gets current queue lengths and statistics of past collections.
+        /// </summary>
+        public Metrics GetMetrics() => new()
+        {
+            ObjectQueueLength = _objQueue.Count,
+            DerivedQueueLength = _derivedQueue.Count,
+            BufferQueueLength = _bufferQueue.Count,
+            EnqueuedCount = EnqueuedCount,
+            CollectedCount = CollectedCount,
+            CollectionCount = CollectionCount,
+            LargestBatch = Interlocked.Read(ref _largestBatch),
+            TotalCollectDuration = TicksToTimeSpan(Interlocked.Read(ref _collectDuration)),
+            LastCollectDuration = TicksToTimeSpan(Interlocked.Read(ref _lastCollectDuration)),
+            TotalGILWait = TicksToTimeSpan(Interlocked.Read(ref _gilWait)),
+            LastGILWait = TicksToTimeSpan(Interlocked.Read(ref _lastGILWait)),
+        };
+
+        static TimeSpan TicksToTimeSpan(long stopwatchTicks)
+            => TimeSpan.FromTicks((long)(stopwatchTicks * ((double)TimeSpan.TicksPerSecond / Stopwatch.Frequency)));
+
         internal List<IntPtr> GetCollectedObjects()
         {
             return _objQueue.Select(o => o.PyObj).ToList();
@@ -150,6 +348,7 @@ namespace Python.Runtime
                 });
             }
             obj = IntPtr.Zero;
+            OnEnqueued();
         }
 
         internal void AddDerivedFinalizedObject(ref IntPtr derived, int run)
@@ -165,6 +364,7 @@ namespace Python.Runtime
             var pending = new PendingFinalization { PyObj = derived, RuntimeRun = run };
             derived = IntPtr.Zero;
             _derivedQueue.Enqueue(pending);
+            OnEnqueued();
         }
 
         internal void AddFinalizedBuffer(ref Py_buffer buffer)
@@ -178,25 +378,134 @@ namespace Python.Runtime
             var pending = buffer;
             buffer = default;
             _bufferQueue.Enqueue(pending);
+            OnEnqueued();
         }
 
+        void OnEnqueued()
+        {
+            long enqueued = Interlocked.Increment(ref _enqueued);
+            if (_backgroundThread is not null && enqueued % Math.Max(Threshold, 1) == 0)
+            {
+                _collectRequested.Set();
+            }
+        }
+
+        bool HasPendingFinalizations
+            => !_objQueue.IsEmpty || !_derivedQueue.IsEmpty || !_bufferQueue.IsEmpty;
+
         internal static void Initialize()
         {
             Instance.started = true;
+            UpdateMetrics(() => MeterInstruments.Initialize());
+            if (Instance.collectInBackground)
+            {
+                Instance.StartBackgroundThread();
+            }
         }
 
         internal static void Shutdown()
         {
+            Instance.StopBackgroundThread();
             Instance.DisposeAll();
             Instance.started = false;
         }
 
-        internal nint DisposeAll(bool disposeObj = true, bool disposeDerived = true, bool disposeBuffer = true)
+        void StartBackgroundThread()
+        {
+            lock (_backgroundLock)
+            {
+                if (_backgroundThread is not null) return;
+
+                _stopBackgroundThread = false;
+                _backgroundThread = new Thread(BackgroundCollect)
+                {
+                    IsBackground = true,
+                    Name = "Python.NET finalizer",
+                };
+                _backgroundThread.Start();
+            }
+        }
+
+        /// <summary>
+        /// Stops the background thread, if it is running. Must be called before
+        /// the runtime starts shutting down, as the thread may be waiting for the GIL.
+        /// </summary>
+        internal void StopBackgroundThread()
+        {
+            Thread? thread;
+            lock (_backgroundLock)
+            {
+                thread = _backgroundThread;
+                if (thread is null) return;
+
+                _backgroundThread = null;
+                _stopBackgroundThread = true;
+                _collectRequested.Set();
+            }
+
+            if (thread == Thread.CurrentThread) return;
+
+            // let the thread finish a batch, that is waiting for the GIL
+            bool holdsGIL = Runtime.PyGILState_Check() != 0;
+            IntPtr threadState = holdsGIL ? PythonEngine.BeginAllowThreads() : IntPtr.Zero;
+            try
+            {
+                thread.Join();
+            }
+            finally
+            {
+                if (holdsGIL) PythonEngine.EndAllowThreads(threadState);
+            }
+        }
+
+        void BackgroundCollect()
         {
-            if (_objQueue.IsEmpty && _derivedQueue.IsEmpty && _bufferQueue.IsEmpty)
+            while (!_stopBackgroundThread)
+            {
+                _collectRequested.WaitOne(BackgroundCollectInterval);
+
+                while (!_stopBackgroundThread && HasPendingFinalizations)
+                {
+                    long waitStart = Stopwatch.GetTimestamp();
+                    var gil = PythonEngine.AcquireLock();
+                    long gilWait = Stopwatch.GetTimestamp() - waitStart;
+                    Interlocked.Add(ref _gilWait, gilWait);
+                    try
+                    {
+                        if (_stopBackgroundThread) break;
+                        DisposeAll(timeLimit: MaxBatchDuration, gilWait: gilWait);
+                    }
+                    catch (FinalizationException)
+                    {
+                        // there is no caller to report the error to
+                    }
+                    finally
+                    {
+                        PythonEngine.ReleaseLock(gil);
+                    }
+                    // give other threads a chance to take the GIL between batches
+                    Thread.Yield();
+                }
+            }
+        }
+
+        /// <param name="timeLimit">Stop releasing objects after this time, leaving the rest queued</param>
+        /// <param name="gilWait">Stopwatch ticks the caller waited for the GIL, for metrics</param>
+        internal nint DisposeAll(bool disposeObj = true, bool disposeDerived = true, bool disposeBuffer = true,
+                                 TimeSpan? timeLimit = null, long gilWait = 0)
+        {
+            if (!HasPendingFinalizations)
                 return 0;
 
             nint collected = 0;
+            long start = Stopwatch.GetTimestamp();
+            CollectedArgs? collectedArgs = null;
+            long deadline = timeLimit is { } limit && limit != Timeout.InfiniteTimeSpan
+                ? Stopwatch.GetTimestamp() + (long)(limit.TotalSeconds * Stopwatch.Frequency)
+                : long.MaxValue;
+            int processed = 0;
+            // reading the clock is cheap, but not as cheap as releasing most objects
+            bool TimeIsUp() => (++processed & 0x3F) == 0 && Stopwatch.GetTimestamp() >= deadline;
 
             BeforeCollect?.Invoke(this, new CollectArgs()
             {
@@ -216,7 +525,7 @@ namespace Python.Runtime
 
                 try
                 {
-                    if (disposeObj) while (!_objQueue.IsEmpty)
+                    if (disposeObj) while (!_objQueue.IsEmpty && !TimeIsUp())
                     {
                         if (!_objQueue.TryDequeue(out var obj))
                             continue;
@@ -240,7 +549,7 @@ namespace Python.Runtime
                         }
                     }
 
-                    if (disposeDerived) while (!_derivedQueue.IsEmpty)
+                    if (disposeDerived) while (!_derivedQueue.IsEmpty && !TimeIsUp())
                     {
                         if (!_derivedQueue.TryDequeue(out var derived))
                             continue;
@@ -258,7 +567,7 @@ namespace Python.Runtime
                         collected++;
                     }
 
-                    if (disposeBuffer) while (!_bufferQueue.IsEmpty)
+                    if (disposeBuffer) while (!_bufferQueue.IsEmpty && !TimeIsUp())
                     {
                         if (!_bufferQueue.TryDequeue(out var buffer))
                             continue;
@@ -272,11 +581,49 @@ namespace Python.Runtime
                     // Python requires finalizers to preserve exception:
                     // https://docs.python.org/3/extending/newtypes.html#finalization-and-de-allocation
                     Runtime.PyErr_Restore(errType.StealNullable(), errVal.StealNullable(), traceback.StealNullable());
+
+                    if (collected > 0)
+                    {
+                        collectedArgs = RecordCollection(collected, Stopwatch.GetTimestamp() - start, gilWait);
+                    }
                 }
             }
+
+            if (collectedArgs is not null)
+            {
+                AfterCollect?.Invoke(this, collectedArgs);
+            }
             return collected;
         }
 
+        CollectedArgs RecordCollection(long collected, long duration, long gilWait)
+        {
+            Interlocked.Add(ref _collected, collected);
+            Interlocked.Increment(ref _collections);
+            Interlocked.Add(ref _collectDuration, duration);
+            Interlocked.Exchange(ref _lastCollectDuration, duration);
+            Interlocked.Exchange(ref _lastGILWait, gilWait);
+
+            long largest = Interlocked.Read(ref _largestBatch);
+            while (collected > largest)
+            {
+                long previous = Interlocked.CompareExchange(ref _largestBatch, collected, largest);
+                if (previous == largest) break;
+                largest = previous;
+            }
+
+            TimeSpan durationSpan = TicksToTimeSpan(duration);
+            TimeSpan gilWaitSpan = TicksToTimeSpan(gilWait);
+            UpdateMetrics(() => MeterInstruments.RecordCollection(durationSpan, collected, gilWaitSpan));
+
+            return new CollectedArgs
+            {
+                ObjectCount = collected,
+                Duration = durationSpan,
+                GILWait = gilWaitSpan,
+            };
+        }
+
         void HandleFinalizationException(IntPtr obj, Exception cause)
         {
             var errorArgs = new ErrorArgs(cause);
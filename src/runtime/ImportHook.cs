@@ -191,7 +191,8 @@ class DotNetFinder(importlib.abc.MetaPathFinder):
         static void SetupNamespaceTracking()
         {
             using var newset = Runtime.PySet_New(default);
-            foreach (var ns in AssemblyManager.GetNamespaces())
+            // namespaces of assemblies scanned later are added by AddPendingNamespaces
+            foreach (var ns in AssemblyManager.GetScannedNamespaces())
             {
                 using var pyNs = Runtime.PyString_FromString(ns);
                 if (Runtime.PySet_Add(newset.Borrow(), pyNs.BorrowOrThrow()) != 0)
@@ -219,6 +220,8 @@ class DotNetFinder(importlib.abc.MetaPathFinder):
 
         internal static int AddPendingNamespaces()
         {
+            AssemblyManager.ScanPendingAssemblies();
+
             int added = 0;
             while (addPending.TryDequeue(out string ns))
             {
@@ -50,15 +50,31 @@ namespace Python.Runtime
         {
             foreach (var entry in _string2interns)
             {
-                var field = typeof(PyIdentifier).GetField("f" + entry.Value, PyIdentifierFieldFlags)!;
+                // names interned by Get have no identifier field
+                var field = typeof(PyIdentifier).GetField("f" + entry.Key, PyIdentifierFieldFlags);
                 entry.Value.Dispose();
-                field.SetValue(null, IntPtr.Zero);
+                field?.SetValue(null, IntPtr.Zero);
             }
 
             _string2interns.Clear();
             _intern2strings.Clear();
         }
 
+        /// <summary>
+        /// Returns the interned Python string for <paramref name="name"/>,
+        /// interning it on first use. Dict lookups with interned keys
+        /// only need to compare pointers.
+        /// </summary>
+        public static BorrowedReference Get(string name)
+        {
+            if (!_string2interns.TryGetValue(name, out PyString op))
+            {
+                op = new PyString(Runtime.PyUnicode_InternFromString(name).StealOrThrow());
+                SetIntern(name, op);
+            }
+            return op.Reference;
+        }
+
         public static string? GetManagedString(BorrowedReference op)
         {
             if (TryGetInterned(op, out string s))
@@ -3,6 +3,7 @@ namespace Python.Runtime
     using System;
     using System.Collections.Generic;
     using System.Linq;
+    using System.Reflection;
 
     using Python.Runtime.Mixins;
 
@@ -14,6 +15,66 @@ namespace Python.Runtime
         /// <summary>Enables replacing base types of CLR types as seen from Python</summary>
         public IList<IPythonBaseTypeProvider> PythonBaseTypeProviders => this.pythonBaseTypeProviders;
 
+        /// <summary>
+        /// Path to a file, that caches namespaces and type names exported by assemblies
+        /// between processes, so they don't have to be discovered with reflection.
+        /// Assemblies are identified by their module version IDs, so rebuilt assemblies
+        /// are scanned again. Defaults to the <c>PYTHONNET_ASSEMBLY_INDEX_CACHE</c>
+        /// environment variable. Caching is disabled, when not set.
+        /// </summary>
+        public string? AssemblyIndexCachePath { get; set; }
+            = Environment.GetEnvironmentVariable("PYTHONNET_ASSEMBLY_INDEX_CACHE");
+
+        /// <summary>
+        /// Path to a file, that caches members of .NET classes exposed to Python
+        /// and the order of their overloads between processes, so that classes
+        /// can be set up with less reflection. Defaults to the
+        /// <c>PYTHONNET_CLASS_LAYOUT_CACHE</c> environment variable. Caching is
+        /// disabled, when not set.
+        /// </summary>
+        public string? ClassLayoutCachePath { get; set; }
+            = Environment.GetEnvironmentVariable("PYTHONNET_CLASS_LAYOUT_CACHE");
+
+        /// <summary>
+        /// When enabled, assemblies are not scanned for namespaces and types as they
+        /// are loaded. Instead they are scanned, when Python first looks up a .NET
+        /// namespace or module member, and their names are read from metadata without
+        /// loading their types. Defaults to <c>true</c>, when the
+        /// <c>PYTHONNET_LAZY_ASSEMBLY_SCANNING</c> environment variable is set to <c>1</c>.
+        /// </summary>
+        public bool LazyAssemblyScanning { get; set; }
+            = Environment.GetEnvironmentVariable("PYTHONNET_LAZY_ASSEMBLY_SCANNING") == "1";
+
+        /// <summary>
+        /// When enabled, descriptors of methods, properties, fields and events of
+        /// .NET classes are created when they are first accessed from Python instead
+        /// of when the class is first used. <c>dir()</c> still lists all members.
+        /// Defaults to <c>true</c>, when the <c>PYTHONNET_LAZY_CLASS_MEMBERS</c>
+        /// environment variable is set to <c>1</c>.
+        /// </summary>
+        public bool LazyClassMembers { get; set; }
+            = Environment.GetEnvironmentVariable("PYTHONNET_LAZY_CLASS_MEMBERS") == "1";
+
+        /// <summary>
+        /// Number of items .NET enumerators over Python iterables (see
+        /// <see cref="Codecs.IterableDecoder"/>) fetch per GIL acquisition. Values above 1
+        /// advance Python iterators ahead of the enumerator. Lists and tuples are
+        /// always read in chunks, because reading them has no side effects.
+        /// Defaults to the <c>PYTHONNET_ENUMERATION_CHUNK_SIZE</c> environment variable or 1.
+        /// </summary>
+        public int EnumerationChunkSize { get; set; }
+            = int.TryParse(Environment.GetEnvironmentVariable("PYTHONNET_ENUMERATION_CHUNK_SIZE"), out int chunkSize)
+              && chunkSize > 0 ? chunkSize : 1;
+
+        /// <summary>
+        /// Properties, and types whose declared properties, release the GIL while
+        /// their getters and setters are called from Python, like members marked with
+        /// <see cref="ReleaseGILAttribute"/>. Generic type definitions and their properties
+        /// apply to all constructed types. Members must be added before their
+        /// class is first used from Python.
+        /// </summary>
+        public IList<MemberInfo> ReleaseGILMembers { get; } = new List<MemberInfo>();
+
         public static InteropConfiguration MakeDefault()
         {
             return new InteropConfiguration
@@ -22,6 +83,7 @@ namespace Python.Runtime
                 {
                     DefaultBaseTypeProvider.Instance,
                     new CollectionMixinsProvider(new Lazy<PyObject>(() => Py.Import("clr._extras.collections"))),
+                    new TaskMixinsProvider(new Lazy<PyObject>(() => Py.Import("clr._extras.tasks"))),
                 },
             };
         }
@@ -0,0 +1,146 @@
+using System;
+using System.Linq.Expressions;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Reads and writes a CLR property or field through compiled strongly typed
+    /// delegates, avoiding reflection, and boxing of primitive values.
+    /// </summary>
+    /// <remarks>
+    /// Unlike reflection, exceptions thrown by property accessors are not
+    /// wrapped in <see cref="TargetInvocationException"/>.
+    /// </remarks>
+    internal abstract class MemberAccessor
+    {
+        protected readonly Type declaringType;
+        protected readonly bool isStatic;
+
+        protected MemberAccessor(MemberInfo member, bool isStatic)
+        {
+            this.declaringType = member.DeclaringType;
+            this.isStatic = isStatic;
+        }
+
+        public abstract bool CanRead { get; }
+        public abstract bool CanWrite { get; }
+
+        /// <summary>
+        /// Checks if the member can be accessed on the given target without reflection.
+        /// </summary>
+        public bool IsValidTarget(object? target)
+            => isStatic || declaringType.IsInstanceOfType(target);
+
+        /// <summary>
+        /// Reads the member value and converts it to Python.
+        /// </summary>
+        public abstract NewReference GetPython(object? target);
+
+        /// <summary>
+        /// Converts the Python value to the member type and assigns the member.
+        /// Returns <c>false</c> and sets a Python error if the conversion fails.
+        /// </summary>
+        public abstract bool TrySetPython(object? target, BorrowedReference value);
+
+        internal static MemberAccessor? TryCreate(PropertyInfo property, MethodInfo? getter, MethodInfo? setter)
+        {
+            var accessor = getter ?? setter;
+            if (accessor is null || !IsSupported(property.DeclaringType, property.PropertyType)
+                || property.GetIndexParameters().Length > 0)
+            {
+                return null;
+            }
+
+            return TryCreate(property.PropertyType, property, accessor.IsStatic,
+                             target => getter is null ? null : Expression.Call(target, getter),
+                             (target, value) => setter is null ? null : Expression.Call(target, setter, value));
+        }
+
+        internal static MemberAccessor? TryCreate(FieldInfo field)
+        {
+            // literals have no storage
+            if (field.IsLiteral || !IsSupported(field.DeclaringType, field.FieldType))
+            {
+                return null;
+            }
+
+            bool readOnly = field.IsInitOnly;
+            return TryCreate(field.FieldType, field, field.IsStatic,
+                             target => Expression.Field(target, field),
+                             (target, value) => readOnly ? null : Expression.Assign(Expression.Field(target, field), value));
+        }
+
+        static bool IsSupported(Type declaringType, Type memberType)
+            => !declaringType.ContainsGenericParameters
+            && !memberType.IsByRef && !memberType.IsPointer
+            && !memberType.ContainsGenericParameters;
+
+        static MemberAccessor? TryCreate(Type memberType, MemberInfo member, bool isStatic,
+                                         Func<Expression?, Expression?> read,
+                                         Func<Expression?, Expression, Expression?> write)
+        {
+            var target = Expression.Parameter(typeof(object), "target");
+            var value = Expression.Parameter(memberType, "value");
+
+            Expression? instance = null;
+            if (!isStatic)
+            {
+                // Unbox refers to the boxed value, so that modifications of value types
+                // are made to the wrapped object, like reflection does
+                instance = member.DeclaringType.IsValueType
+                    ? Expression.Unbox(target, member.DeclaringType)
+                    : Expression.Convert(target, member.DeclaringType);
+            }
+
+            try
+            {
+                Expression? getBody = read(instance);
+                Expression? setBody = write(instance, value);
+                Delegate? getter = getBody is null ? null
+                    : Expression.Lambda(typeof(Func<,>).MakeGenericType(typeof(object), memberType),
+                                        getBody, target).Compile();
+                Delegate? setter = setBody is null ? null
+                    : Expression.Lambda(typeof(Action<,>).MakeGenericType(typeof(object), memberType),
+                                        setBody, target, value).Compile();
+
+                var accessorType = typeof(MemberAccessor<>).MakeGenericType(memberType);
+                return (MemberAccessor)Activator.CreateInstance(accessorType, member, isStatic, getter, setter);
+            }
+            catch (Exception e) when (e is ArgumentException or InvalidOperationException or NotSupportedException)
+            {
+                // e.g. by-ref like member types
+                return null;
+            }
+        }
+    }
+
+    internal sealed class MemberAccessor<T> : MemberAccessor
+    {
+        readonly Func<object?, T>? getter;
+        readonly Action<object?, T>? setter;
+
+        public MemberAccessor(MemberInfo member, bool isStatic, Func<object?, T>? getter, Action<object?, T>? setter)
+            : base(member, isStatic)
+        {
+            this.getter = getter;
+            this.setter = setter;
+        }
+
+        public override bool CanRead => getter is not null;
+        public override bool CanWrite => setter is not null;
+
+        public override NewReference GetPython(object? target)
+            => Converter.ToPython(getter!(target));
+
+        public override bool TrySetPython(object? target, BorrowedReference value)
+        {
+            if (!Converter.TryToManaged(value, out T converted, setError: true))
+            {
+                return false;
+            }
+            setter!(target, converted);
+            return true;
+        }
+    }
+}
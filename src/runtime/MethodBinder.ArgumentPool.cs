@@ -0,0 +1,60 @@
+using System;
+using System.Collections.Generic;
+
+namespace Python.Runtime
+{
+    partial class MethodBinder
+    {
+        /// <summary>
+        /// Per-thread pool of argument arrays, so that binding and invoking
+        /// methods from Python loops does not allocate them on every call.
+        /// </summary>
+        /// <remarks>
+        /// Arrays must be returned only after the call they were rented for is
+        /// complete. Calls can nest (e.g. .NET calling back into Python), so
+        /// a few arrays of each length are kept.
+        /// </remarks>
+        sealed class ArgumentArrayPool
+        {
+            internal const int MaxPooledLength = 16;
+            const int MaxArraysPerLength = 4;
+
+            [ThreadStatic]
+            static ArgumentArrayPool? current;
+
+            public static ArgumentArrayPool Current => current ??= new ArgumentArrayPool();
+
+            readonly Stack<object?[]>?[] arrays = new Stack<object?[]>?[MaxPooledLength + 1];
+
+            public object?[] Rent(int length)
+            {
+                if (length == 0)
+                {
+                    return Array.Empty<object?>();
+                }
+                if (length <= MaxPooledLength && arrays[length] is { Count: > 0 } pooled)
+                {
+                    return pooled.Pop();
+                }
+                return new object?[length];
+            }
+
+            public void Return(object?[] array)
+            {
+                int length = array.Length;
+                if (length == 0 || length > MaxPooledLength)
+                {
+                    return;
+                }
+
+                // do not keep arguments alive
+                Array.Clear(array, 0, length);
+                var pooled = arrays[length] ??= new Stack<object?[]>(MaxArraysPerLength);
+                if (pooled.Count < MaxArraysPerLength)
+                {
+                    pooled.Push(array);
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,205 @@
+using System;
+using System.Reflection;
+using System.Threading;
+
+namespace Python.Runtime
+{
+    partial class MethodBinder
+    {
+        /// <summary>
+        /// Number of distinct argument type signatures remembered per binder.
+        /// </summary>
+        internal const int OverloadCacheSize = 8;
+
+        /// <summary>
+        /// Bumped whenever something that affects overload resolution changes
+        /// globally (e.g. a decoder is registered). Cache entries created with
+        /// an older version are ignored.
+        /// </summary>
+        static int overloadCacheVersion;
+
+        [NonSerialized]
+        private OverloadCacheEntry?[]? overloadCache;
+        [NonSerialized]
+        private int overloadCacheNext;
+
+        /// <summary>
+        /// Invalidates overloads cached by all method binders.
+        /// </summary>
+        internal static void InvalidateOverloadCache()
+            => Interlocked.Increment(ref overloadCacheVersion);
+
+        /// <summary>
+        /// Returns the overload previously selected for arguments of the same
+        /// Python types (and the same keyword argument names), or null.
+        /// </summary>
+        OverloadTable? GetCachedOverload(BorrowedReference inst, BorrowedReference args, BorrowedReference kw)
+        {
+            var cache = overloadCache;
+            if (cache is null)
+            {
+                return null;
+            }
+
+            int version = overloadCacheVersion;
+            foreach (var entry in cache)
+            {
+                if (entry is not null && entry.Version == version && entry.Matches(inst, args, kw))
+                {
+                    return entry.Overload;
+                }
+            }
+            return null;
+        }
+
+        void CacheOverload(BorrowedReference inst, BorrowedReference args, BorrowedReference kw, OverloadTable overload)
+        {
+            overloadCache ??= new OverloadCacheEntry?[OverloadCacheSize];
+            int slot = overloadCacheNext;
+            overloadCacheNext = (slot + 1) % OverloadCacheSize;
+
+            overloadCache[slot]?.Dispose();
+            overloadCache[slot] = new OverloadCacheEntry(inst, args, kw, overload, overloadCacheVersion);
+        }
+
+        /// <summary>
+        /// Checks if the conversion failure, that is currently set as the Python error,
+        /// would happen for any argument of the same Python type. Only such failures
+        /// allow caching overload resolution results by argument types: e.g. a 'str'
+        /// never converts to <see cref="int"/>, but an 'int' may or may not fit into one.
+        /// </summary>
+        static bool IsTypeDeterminedMismatch(BorrowedReference arg, Type parameterType)
+        {
+            if (arg == null || !Exceptions.ExceptionMatches(Exceptions.TypeError))
+            {
+                return false;
+            }
+
+            if (parameterType.IsByRef)
+            {
+                parameterType = parameterType.GetElementType();
+            }
+            parameterType = Nullable.GetUnderlyingType(parameterType) ?? parameterType;
+
+            BorrowedReference argType = Runtime.PyObject_TYPE(arg);
+            if (argType == Runtime.PyLongType || argType == Runtime.PyFloatType
+                || argType == Runtime.PyBoolType || argType == Runtime.PyNoneType)
+            {
+                return parameterType.IsPrimitive || parameterType == typeof(string);
+            }
+
+            if (argType == Runtime.PyUnicodeType)
+            {
+                // single character strings convert to char
+                return parameterType.IsPrimitive && parameterType != typeof(char);
+            }
+
+            // reflected objects are checked with Type.IsInstanceOfType, which only depends
+            // on the runtime type, unless the object is wrapped as an interface or an array
+            // of a less specific type
+            if (ManagedType.GetManagedObject(arg) is CLRObject
+                && ManagedType.GetManagedObject(argType) is ClassBase cls
+                && cls is not InterfaceObject
+                && cls.type.Valid && !cls.type.Value.IsArray)
+            {
+                return !typeof(PyObject).IsAssignableFrom(parameterType);
+            }
+
+            return false;
+        }
+
+        sealed class OverloadCacheEntry : IDisposable
+        {
+            // strong references ensure type objects, whose addresses are compared,
+            // are not deallocated and reused while the entry is alive
+            readonly PyType? instanceType;
+            readonly PyType[] argTypes;
+            readonly PyString[] kwNames;
+            readonly PyType[] kwTypes;
+
+            public OverloadTable Overload { get; }
+            public int Version { get; }
+
+            public OverloadCacheEntry(BorrowedReference inst, BorrowedReference args, BorrowedReference kw,
+                                      OverloadTable overload, int version)
+            {
+                Overload = overload;
+                Version = version;
+
+                instanceType = inst == null ? null : PyType.FromReference(Runtime.PyObject_TYPE(inst));
+
+                var argCount = (int)Runtime.PyTuple_Size(args);
+                argTypes = new PyType[argCount];
+                for (int i = 0; i < argCount; i++)
+                {
+                    argTypes[i] = PyType.FromReference(Runtime.PyObject_TYPE(Runtime.PyTuple_GetItem(args, i)));
+                }
+
+                if (kw == null)
+                {
+                    kwNames = Array.Empty<PyString>();
+                    kwTypes = Array.Empty<PyType>();
+                    return;
+                }
+
+                using var keys = Runtime.PyDict_Keys(kw);
+                var kwCount = (int)Runtime.PyList_Size(keys.Borrow());
+                kwNames = new PyString[kwCount];
+                kwTypes = new PyType[kwCount];
+                for (int i = 0; i < kwCount; i++)
+                {
+                    BorrowedReference key = Runtime.PyList_GetItem(keys.Borrow(), i);
+                    kwNames[i] = new PyString(key);
+                    kwTypes[i] = PyType.FromReference(Runtime.PyObject_TYPE(Runtime.PyDict_GetItem(kw, key)));
+                }
+            }
+
+            public bool Matches(BorrowedReference inst, BorrowedReference args, BorrowedReference kw)
+            {
+                if (instanceType is null)
+                {
+                    if (inst != null) return false;
+                }
+                else if (inst == null || Runtime.PyObject_TYPE(inst) != instanceType.Reference)
+                {
+                    return false;
+                }
+
+                if (Runtime.PyTuple_Size(args) != argTypes.Length)
+                {
+                    return false;
+                }
+                for (int i = 0; i < argTypes.Length; i++)
+                {
+                    if (Runtime.PyObject_TYPE(Runtime.PyTuple_GetItem(args, i)) != argTypes[i].Reference)
+                    {
+                        return false;
+                    }
+                }
+
+                nint kwCount = kw == null ? 0 : Runtime.PyDict_Size(kw);
+                if (kwCount != kwNames.Length)
+                {
+                    return false;
+                }
+                for (int i = 0; i < kwNames.Length; i++)
+                {
+                    BorrowedReference value = Runtime.PyDict_GetItem(kw, kwNames[i]);
+                    if (value == null || Runtime.PyObject_TYPE(value) != kwTypes[i].Reference)
+                    {
+                        return false;
+                    }
+                }
+                return true;
+            }
+
+            public void Dispose()
+            {
+                instanceType?.Dispose();
+                foreach (var type in argTypes) type.Dispose();
+                foreach (var name in kwNames) name.Dispose();
+                foreach (var type in kwTypes) type.Dispose();
+            }
+        }
+    }
+}
@@ -0,0 +1,148 @@
+using System;
+using System.Linq;
+using System.Reflection;
+
+namespace Python.Runtime
+{
+    partial class MethodBinder
+    {
+        [NonSerialized]
+        private OverloadTable? overloads;
+
+        /// <summary>
+        /// Returns the overloads of this method in order of precedence,
+        /// with the information <see cref="Bind(BorrowedReference, BorrowedReference, BorrowedReference)"/>
+        /// needs to match arguments precomputed.
+        /// </summary>
+        OverloadTable GetOverloads()
+        {
+            if (!init || overloads is null)
+            {
+                overloads = new OverloadTable(GetMethods());
+            }
+            return overloads;
+        }
+
+        /// <summary>
+        /// Information about a single overload, that does not depend on arguments.
+        /// Computed once, so that binding does not have to query reflection.
+        /// </summary>
+        sealed class Overload
+        {
+            public MethodBase Method { get; }
+            public ParameterInfo[] Parameters { get; }
+            /// <summary>
+            /// Values passed for omitted optional parameters, aligned with <see cref="Parameters"/>.
+            /// </summary>
+            public object?[] DefaultValues { get; }
+            public bool IsParamsArray { get; }
+            /// <summary>
+            /// Number of positional arguments required, when no keyword arguments are passed.
+            /// </summary>
+            public int MinArgs { get; }
+            public bool IsOperator { get; }
+            public bool IsComparisonOperator { get; }
+            /// <summary>
+            /// Parameters, that receive Python arguments of a bound operator method:
+            /// all but the left operand or, if reversed, only the left operand.
+            /// </summary>
+            public ParameterInfo[] OperandParameters { get; }
+            public ParameterInfo[] ReverseOperandParameters { get; }
+
+            public Overload(MethodBase method)
+            {
+                Method = method;
+                Parameters = method.GetParameters();
+                DefaultValues = new object?[Parameters.Length];
+                for (int i = 0; i < Parameters.Length; i++)
+                {
+                    ParameterInfo parameter = Parameters[i];
+                    if (parameter.IsOptional)
+                    {
+                        DefaultValues[i] = parameter.GetDefaultValue();
+                    }
+                    if (!parameter.IsOptional && !parameter.IsOut)
+                    {
+                        MinArgs = i + 1;
+                    }
+                }
+                IsParamsArray = Parameters.Length > 0
+                    && Attribute.IsDefined(Parameters[Parameters.Length - 1], typeof(ParamArrayAttribute));
+
+                IsOperator = OperatorMethod.IsOperatorMethod(method);
+                IsComparisonOperator = IsOperator && OperatorMethod.IsComparisonOp(method);
+                OperandParameters = IsOperator ? Parameters.Skip(1).ToArray() : Parameters;
+                ReverseOperandParameters = IsOperator ? Parameters.Take(1).ToArray() : Parameters;
+            }
+
+            /// <summary>
+            /// Checks if the overload can take <paramref name="argCount"/> positional
+            /// arguments without any keyword arguments. Operators are included, when
+            /// they could be bound to that many operands.
+            /// </summary>
+            public bool AcceptsArgumentCount(int argCount)
+            {
+                int count = Parameters.Length;
+                if (IsParamsArray)
+                {
+                    return argCount >= count - 1;
+                }
+                return argCount >= MinArgs && argCount <= count
+                    || IsOperator && argCount == count - 1;
+            }
+
+            public override string ToString() => Method.ToString();
+        }
+
+        /// <summary>
+        /// Immutable overload table of a method, ordered by precedence.
+        /// Overloads are additionally bucketed by the number of positional arguments
+        /// they accept, so calls without keyword arguments only check applicable ones.
+        /// </summary>
+        sealed class OverloadTable
+        {
+            readonly Overload[] all;
+            // buckets[n] contains overloads taking n positional arguments;
+            // the last one is shared by all counts above the longest parameter list
+            readonly Overload[][] buckets;
+
+            public MethodBase[] Methods { get; }
+            public bool ContainsGenericMethods { get; }
+
+            public OverloadTable(MethodBase[] methods)
+                : this(Array.ConvertAll(methods, method => new Overload(method)))
+            {
+            }
+
+            public OverloadTable(Overload[] overloads)
+            {
+                all = overloads;
+                Methods = Array.ConvertAll(overloads, o => o.Method);
+                ContainsGenericMethods = overloads.Any(o => o.Method.IsGenericMethod);
+
+                int maxCount = overloads.Length == 0 ? 0 : overloads.Max(o => o.Parameters.Length);
+                buckets = new Overload[maxCount + 2][];
+                for (int argCount = 0; argCount < buckets.Length; argCount++)
+                {
+                    buckets[argCount] = overloads.Where(o => o.AcceptsArgumentCount(argCount)).ToArray();
+                }
+            }
+
+            /// <summary>
+            /// Returns overloads, that might accept the given arguments, in order of precedence.
+            /// </summary>
+            public Overload[] GetCandidates(int argCount, bool hasKeywordArgs)
+                => hasKeywordArgs ? all : buckets[Math.Min(argCount, buckets.Length - 1)];
+
+            /// <summary>
+            /// Returns a table with the single overload for <paramref name="method"/>,
+            /// reusing its precomputed information, if it belongs to this table.
+            /// </summary>
+            public OverloadTable Single(MethodBase method)
+            {
+                Overload? overload = Array.Find(all, o => o.Method == method);
+                return new OverloadTable(new[] { overload ?? new Overload(method) });
+            }
+        }
+    }
+}
@@ -1,5 +1,4 @@
 using System;
-using System.Collections;
 using System.Reflection;
 using System.Text;
 using System.Collections.Generic;
@@ -16,7 +15,7 @@ namespace Python.Runtime
     /// ConstructorBinder, a minor variation used to invoke constructors.
     /// </summary>
     [Serializable]
-    internal class MethodBinder
+    internal partial class MethodBinder
     {
         /// <summary>
         /// The overloads of this method
@@ -29,6 +28,11 @@ namespace Python.Runtime
         [NonSerialized]
         public bool init = false;
 
+        /// <summary>
+        /// Set, when overloads were added in the order of <see cref="MethodSorter"/>.
+        /// </summary>
+        public bool sorted = false;
+
         public const bool DefaultAllowThreads = true;
         public bool allow_threads = DefaultAllowThreads;
 
@@ -186,8 +190,11 @@ namespace Python.Runtime
         {
             if (!init)
             {
-                // I'm sure this could be made more efficient.
-                list.Sort(new MethodSorter());
+                if (!sorted)
+                {
+                    // I'm sure this could be made more efficient.
+                    list.Sort(new MethodSorter());
+                }
                 methods = (from method in list where method.Valid select method.Value).ToArray();
                 init = true;
             }
@@ -298,11 +305,12 @@ namespace Python.Runtime
 
         private readonly struct MatchedMethod
         {
-            public MatchedMethod(int kwargsMatched, int defaultsNeeded, object?[] margs, int outs, MethodBase mb)
+            public MatchedMethod(int kwargsMatched, int defaultsNeeded, object?[] margs, List<PyBuffer>? buffers, int outs, MethodBase mb)
             {
                 KwargsMatched = kwargsMatched;
                 DefaultsNeeded = defaultsNeeded;
                 ManagedArgs = margs;
+                Buffers = buffers;
                 Outs = outs;
                 Method = mb;
             }
@@ -310,20 +318,72 @@ namespace Python.Runtime
             public int KwargsMatched { get; }
             public int DefaultsNeeded { get; }
             public object?[] ManagedArgs { get; }
+            public List<PyBuffer>? Buffers { get; }
             public int Outs { get; }
             public MethodBase Method { get; }
         }
 
+        /// <summary>
+        /// An overload, that did not accept the arguments, and the Python error raised by
+        /// the conversion of the parameter, that failed. The error is only turned into a
+        /// .NET exception, if no overload matches (see <see cref="GetMismatchCause"/>).
+        /// </summary>
         private readonly struct MismatchedMethod
         {
-            public MismatchedMethod(Exception exception, MethodBase mb)
+            public MismatchedMethod(MethodBase mb, ParameterInfo parameter)
             {
-                Exception = exception;
                 Method = mb;
+                Parameter = parameter;
+                // fetching does not normalize or format the error
+                Runtime.PyErr_Fetch(out var type, out var value, out var traceback);
+                ErrorType = type.MoveToPyObjectOrNull();
+                ErrorValue = value.MoveToPyObjectOrNull();
+                ErrorTraceback = traceback.MoveToPyObjectOrNull();
             }
 
-            public Exception Exception { get; }
             public MethodBase Method { get; }
+            public ParameterInfo Parameter { get; }
+            public PyObject? ErrorType { get; }
+            public PyObject? ErrorValue { get; }
+            public PyObject? ErrorTraceback { get; }
+
+            public void Dispose()
+            {
+                ErrorType?.Dispose();
+                ErrorValue?.Dispose();
+                ErrorTraceback?.Dispose();
+            }
+        }
+
+        /// <summary>
+        /// Keyword arguments of a call. Looks values up in the borrowed Python dict
+        /// by interned parameter names instead of copying it.
+        /// </summary>
+        private readonly ref struct KeywordArguments
+        {
+            readonly BorrowedReference dict;
+
+            public KeywordArguments(BorrowedReference kw)
+            {
+                dict = kw;
+                Count = kw.IsNull ? 0 : (int)Runtime.PyDict_Size(kw);
+            }
+
+            public int Count { get; }
+
+            /// <summary>
+            /// Returns the argument for the parameter <paramref name="name"/>, or null.
+            /// </summary>
+            public BorrowedReference Get(string? name)
+            {
+                if (Count == 0 || name is null)
+                {
+                    return BorrowedReference.Null;
+                }
+                return Runtime.PyDict_GetItem(dict, InternString.Get(name));
+            }
+
+            public bool Contains(string? name) => !Get(name).IsNull;
         }
 
         /// <summary>
@@ -341,79 +401,95 @@ namespace Python.Runtime
         internal Binding? Bind(BorrowedReference inst, BorrowedReference args, BorrowedReference kw, MethodBase? info, MethodBase[]? methodinfo)
         {
             // loop to find match, return invoker w/ or w/o error
-            var kwargDict = new Dictionary<string, PyObject>();
-            if (kw != null)
-            {
-                nint pynkwargs = Runtime.PyDict_Size(kw);
-                using var keylist = Runtime.PyDict_Keys(kw);
-                using var valueList = Runtime.PyDict_Values(kw);
-                for (int i = 0; i < pynkwargs; ++i)
-                {
-                    var keyStr = Runtime.GetManagedString(Runtime.PyList_GetItem(keylist.Borrow(), i));
-                    BorrowedReference value = Runtime.PyList_GetItem(valueList.Borrow(), i);
-                    kwargDict[keyStr!] = new PyObject(value);
-                }
-            }
+            var kwargDict = new KeywordArguments(kw);
 
-            MethodBase[] _methods;
+            OverloadTable _methods;
             if (info != null)
             {
-                _methods = new MethodBase[1];
-                _methods.SetValue(info, 0);
+                _methods = new OverloadTable(new[] { info });
             }
             else
             {
-                _methods = GetMethods();
+                _methods = GetOverloads();
+
+                OverloadTable? cached = GetCachedOverload(inst, args, kw);
+                if (cached != null)
+                {
+                    bool _ = false;
+                    Binding? cachedBinding = Bind(inst, args, kwargDict, cached, matchGenerics: false, argsReversed, ref _);
+                    if (cachedBinding != null)
+                    {
+                        return cachedBinding;
+                    }
+                    // the overload, selected for the same argument types before,
+                    // can not take these particular values (e.g. int overflow)
+                    Exceptions.Clear();
+                }
             }
 
-            return Bind(inst, args, kwargDict, _methods, matchGenerics: true, argsReversed);
+            // there is nothing to save by caching the only non-generic overload
+            MethodBase[] allMethods = GetMethods();
+            bool cacheable = info == null
+                && (allMethods.Length > 1 || allMethods.Length == 1 && allMethods[0].IsGenericMethodDefinition);
+            Binding? binding = Bind(inst, args, kwargDict, _methods, matchGenerics: true, argsReversed, ref cacheable);
+            if (binding != null && cacheable)
+            {
+                CacheOverload(inst, args, kw, _methods.Single(binding.info));
+            }
+            return binding;
         }
 
-        private static Binding? Bind(BorrowedReference inst, BorrowedReference args, Dictionary<string, PyObject> kwargDict, MethodBase[] methods, bool matchGenerics, bool argsReversed = false)
+        /// <param name="cacheable">
+        /// Reset to <c>false</c> if the result could be different for other
+        /// argument values of the same Python types.
+        /// </param>
+        private static Binding? Bind(BorrowedReference inst, BorrowedReference args, KeywordArguments kwargDict, OverloadTable methods, bool matchGenerics, bool argsReversed, ref bool cacheable)
         {
             var pynargs = (int)Runtime.PyTuple_Size(args);
-            var isGeneric = false;
+            Overload[] candidates = methods.GetCandidates(pynargs, hasKeywordArgs: kwargDict.Count > 0);
 
-            var argMatchedMethods = new List<MatchedMethod>(methods.Length);
-            var mismatchedMethods = new List<MismatchedMethod>();
+            var argMatchedMethods = new List<MatchedMethod>(candidates.Length);
+            List<MismatchedMethod>? mismatchedMethods = null;
 
             // TODO: Clean up
-            foreach (MethodBase mi in methods)
+            foreach (Overload overload in candidates)
             {
-                if (mi.IsGenericMethod)
-                {
-                    isGeneric = true;
-                }
-                ParameterInfo[] pi = mi.GetParameters();
-                bool isOperator = OperatorMethod.IsOperatorMethod(mi);
+                MethodBase mi = overload.Method;
+                ParameterInfo[] pi = overload.Parameters;
                 // Binary operator methods will have 2 CLR args but only one Python arg
                 // (unary operators will have 1 less each), since Python operator methods are bound.
-                isOperator = isOperator && pynargs == pi.Length - 1;
+                bool isOperator = overload.IsOperator && pynargs == pi.Length - 1;
                 bool isReverse = isOperator && argsReversed;  // Only cast if isOperator.
-                if (isReverse && OperatorMethod.IsComparisonOp((MethodInfo)mi))
+                if (isReverse && overload.IsComparisonOperator)
                     continue;  // Comparison operators in Python have no reverse mode.
-                if (!MatchesArgumentCount(pynargs, pi, kwargDict, out bool paramsArray, out ArrayList? defaultArgList, out int kwargsMatched, out int defaultsNeeded) && !isOperator)
+                if (!MatchesArgumentCount(pynargs, overload, kwargDict, out int kwargsMatched, out int defaultsNeeded) && !isOperator)
                 {
                     continue;
                 }
+                object?[]? defaultValues = overload.DefaultValues;
                 // Preprocessing pi to remove either the first or second argument.
                 if (isOperator && !isReverse)
                 {
                     // The first Python arg is the right operand, while the bound instance is the left.
                     // We need to skip the first (left operand) CLR argument.
-                    pi = pi.Skip(1).ToArray();
+                    pi = overload.OperandParameters;
+                    defaultValues = null;
                 }
                 else if (isOperator && isReverse)
                 {
                     // The first Python arg is the left operand.
                     // We need to take the first CLR argument.
-                    pi = pi.Take(1).ToArray();
+                    pi = overload.ReverseOperandParameters;
+                    defaultValues = null;
                 }
-                var margs = TryConvertArguments(pi, paramsArray, args, pynargs, kwargDict, defaultArgList, outs: out int outs);
+                var margs = TryConvertArguments(pi, overload.IsParamsArray, args, pynargs, kwargDict, defaultValues, outs: out int outs,
+                                                out List<PyBuffer>? buffers, out int mismatchIndex, out bool typeDeterminedMismatch);
                 if (margs == null)
                 {
-                    var mismatchCause = PythonException.FetchCurrent();
-                    mismatchedMethods.Add(new MismatchedMethod(mismatchCause, mi));
+                    cacheable &= typeDeterminedMismatch;
+                    // another overload might match, so only format the error if none does
+                    mismatchedMethods ??= new List<MismatchedMethod>();
+                    mismatchedMethods.Add(new MismatchedMethod(mi, pi[mismatchIndex]));
                     continue;
                 }
                 if (isOperator)
@@ -424,7 +500,7 @@ namespace Python.Runtime
                         {
                             bool isUnary = pynargs == 0;
                             // Postprocessing to extend margs.
-                            var margsTemp = isUnary ? new object?[1] : new object?[2];
+                            var margsTemp = ArgumentArrayPool.Current.Rent(isUnary ? 1 : 2);
                             // If reverse, the bound instance is the right operand.
                             int boundOperandIndex = isReverse ? 1 : 0;
                             // If reverse, the passed instance is the left operand.
@@ -434,18 +510,24 @@ namespace Python.Runtime
                             {
                                 margsTemp[passedOperandIndex] = margs[0];
                             }
+                            ArgumentArrayPool.Current.Return(margs);
                             margs = margsTemp;
                         }
-                        else continue;
+                        else
+                        {
+                            ReleaseArguments(margs, buffers);
+                            continue;
+                        }
                     }
                 }
 
 
-                var matchedMethod = new MatchedMethod(kwargsMatched, defaultsNeeded, margs, outs, mi);
+                var matchedMethod = new MatchedMethod(kwargsMatched, defaultsNeeded, margs, buffers, outs, mi);
                 argMatchedMethods.Add(matchedMethod);
             }
             if (argMatchedMethods.Count > 0)
             {
+                DisposeMismatches(mismatchedMethods);
                 var bestKwargMatchCount = argMatchedMethods.Max(x => x.KwargsMatched);
                 var fewestDefaultsRequired = argMatchedMethods.Where(x => x.KwargsMatched == bestKwargMatchCount).Min(x => x.DefaultsNeeded);
 
@@ -463,6 +545,15 @@ namespace Python.Runtime
                     }
                 }
 
+                // arguments converted for other overloads are not needed anymore
+                for (int index = 0; index < argMatchedMethods.Count; index++)
+                {
+                    if (index != bestMatchIndex)
+                    {
+                        ReleaseArguments(argMatchedMethods[index].ManagedArgs, argMatchedMethods[index].Buffers);
+                    }
+                }
+
                 if (bestCount > 1 && fewestDefaultsRequired > 0)
                 {
                     // Best effort for determining method to match on gives multiple possible
@@ -474,6 +565,7 @@ namespace Python.Runtime
                         stringBuilder.Append(matchedMethod.Method.ToString());
                     }
                     Exceptions.SetError(Exceptions.TypeError, stringBuilder.ToString());
+                    ReleaseArguments(argMatchedMethods[bestMatchIndex].ManagedArgs, argMatchedMethods[bestMatchIndex].Buffers);
                     return null;
                 }
 
@@ -507,36 +599,67 @@ namespace Python.Runtime
                     else
                     {
                         Exceptions.SetError(Exceptions.TypeError, "Invoked a non-static method with an invalid instance");
+                        ReleaseArguments(margs, bestMatch.Buffers);
                         return null;
                     }
                 }
 
-                return new Binding(mi, target, margs, outs);
+                return new Binding(mi, target, margs, outs, bestMatch.Buffers);
             }
-            else if (matchGenerics && isGeneric)
+            else if (matchGenerics && methods.ContainsGenericMethods)
             {
                 // We weren't able to find a matching method but at least one
                 // is a generic method and info is null. That happens when a generic
                 // method was not called using the [] syntax. Let's introspect the
                 // type of the arguments and use it to construct the correct method.
                 Type[]? types = Runtime.PythonArgsToTypeArray(args, true);
-                MethodInfo[] overloads = MatchParameters(methods, types);
+                MethodInfo[] overloads = MatchParameters(methods.Methods, types);
                 if (overloads.Length != 0)
                 {
-                    return Bind(inst, args, kwargDict, overloads, matchGenerics: false);
+                    DisposeMismatches(mismatchedMethods);
+                    return Bind(inst, args, kwargDict, new OverloadTable(overloads), matchGenerics: false, argsReversed: false, ref cacheable);
                 }
             }
-            if (mismatchedMethods.Count > 0)
+            if (mismatchedMethods != null)
             {
-                var aggregateException = GetAggregateException(mismatchedMethods);
-                Exceptions.SetError(aggregateException);
+                var causes = new List<Exception>(mismatchedMethods.Count);
+                foreach (var mismatch in mismatchedMethods)
+                {
+                    Exception cause = GetMismatchCause(mismatch);
+                    causes.Add(new ArgumentException($"{cause.Message} in method {mismatch.Method}", cause));
+                }
+                DisposeMismatches(mismatchedMethods);
+                Exceptions.SetError(new AggregateException(causes));
             }
             return null;
         }
 
-        static AggregateException GetAggregateException(IEnumerable<MismatchedMethod> mismatchedMethods)
+        /// <summary>
+        /// Converts the Python error, that was raised when the argument did not match
+        /// the parameter of a mismatched overload, to a .NET exception.
+        /// </summary>
+        static Exception GetMismatchCause(MismatchedMethod mismatch)
         {
-            return new AggregateException(mismatchedMethods.Select(m => new ArgumentException($"{m.Exception.Message} in method {m.Method}", m.Exception)));
+            if (mismatch.ErrorType is null)
+            {
+                return new ArgumentException($"Value can not be converted to {mismatch.Parameter.ParameterType}", mismatch.Parameter.Name);
+            }
+
+            Runtime.PyErr_Restore(
+                mismatch.ErrorType.NewReferenceOrNull().Steal(),
+                mismatch.ErrorValue.NewReferenceOrNull().StealNullable(),
+                mismatch.ErrorTraceback.NewReferenceOrNull().StealNullable());
+            return PythonException.FetchCurrent();
+        }
+
+        static void DisposeMismatches(List<MismatchedMethod>? mismatches)
+        {
+            if (mismatches == null) return;
+
+            foreach (var mismatch in mismatches)
+            {
+                mismatch.Dispose();
+            }
         }
 
         static BorrowedReference HandleParamsArray(BorrowedReference args, int arrayStart, int pyArgCount, out NewReference tempObject)
@@ -558,18 +681,28 @@ namespace Python.Runtime
                 }
                 else
                 {
-                    tempObject = Runtime.PyTuple_GetSlice(args, arrayStart, pyArgCount);
-                    op = tempObject.Borrow();
+                    op = SliceArgs(args, arrayStart, pyArgCount, out tempObject);
                 }
             }
             else
             {
-                tempObject = Runtime.PyTuple_GetSlice(args, arrayStart, pyArgCount);
-                op = tempObject.Borrow();
+                op = SliceArgs(args, arrayStart, pyArgCount, out tempObject);
             }
             return op;
         }
 
+        static BorrowedReference SliceArgs(BorrowedReference args, int start, int end, out NewReference tempObject)
+        {
+            if (start == 0)
+            {
+                // all arguments go to the params array, no need to copy them
+                tempObject = default;
+                return args;
+            }
+            tempObject = Runtime.PyTuple_GetSlice(args, start, end);
+            return tempObject.Borrow();
+        }
+
         /// <summary>
         /// Attempts to convert Python positional argument tuple and keyword argument table
         /// into an array of managed objects, that can be passed to a method.
@@ -579,30 +712,43 @@ namespace Python.Runtime
         /// <param name="paramsArray"><c>true</c>, if the last parameter is a params array.</param>
         /// <param name="args">A pointer to the Python argument tuple</param>
         /// <param name="pyArgCount">Number of arguments, passed by Python</param>
-        /// <param name="kwargDict">Dictionary of keyword argument name to python object pointer</param>
-        /// <param name="defaultArgList">A list of default values for omitted parameters</param>
+        /// <param name="kwargDict">Keyword arguments passed from Python</param>
+        /// <param name="defaultValues">Default values for omitted parameters, aligned with <paramref name="pi"/></param>
         /// <param name="outs">Returns number of output parameters</param>
+        /// <param name="buffers">Python buffers exported for span and memory parameters, see <see cref="ReleaseArguments"/></param>
+        /// <param name="mismatchIndex">On failure, index of the parameter, that could not be converted</param>
+        /// <param name="typeDeterminedMismatch">On failure, whether any other argument of the same Python type would fail too</param>
         /// <returns>If successful, an array of .NET arguments that can be passed to the method.  Otherwise null.</returns>
         static object?[]? TryConvertArguments(ParameterInfo[] pi, bool paramsArray,
             BorrowedReference args, int pyArgCount,
-            Dictionary<string, PyObject> kwargDict,
-            ArrayList? defaultArgList,
-            out int outs)
+            KeywordArguments kwargDict,
+            object?[]? defaultValues,
+            out int outs,
+            out List<PyBuffer>? buffers,
+            out int mismatchIndex,
+            out bool typeDeterminedMismatch)
         {
             outs = 0;
-            var margs = new object?[pi.Length];
+            buffers = null;
+            mismatchIndex = -1;
+            typeDeterminedMismatch = false;
+            var margs = ArgumentArrayPool.Current.Rent(pi.Length);
             int arrayStart = paramsArray ? pi.Length - 1 : -1;
 
             for (int paramIndex = 0; paramIndex < pi.Length; paramIndex++)
             {
                 var parameter = pi[paramIndex];
-                bool hasNamedParam = parameter.Name != null && kwargDict.ContainsKey(parameter.Name);
+                BorrowedReference namedArg = kwargDict.Get(parameter.Name);
+                bool hasNamedParam = !namedArg.IsNull;
 
                 if (paramIndex >= pyArgCount && !(hasNamedParam || (paramsArray && paramIndex == arrayStart)))
                 {
-                    if (defaultArgList != null)
+                    if (defaultValues != null)
                     {
-                        margs[paramIndex] = defaultArgList[paramIndex - pyArgCount];
+                        // by-ref arguments may be modified by the callee, so they can't share a default
+                        margs[paramIndex] = parameter.ParameterType.IsByRef
+                            ? parameter.GetDefaultValue()
+                            : defaultValues[paramIndex];
                     }
 
                     if (parameter.ParameterType.IsByRef)
@@ -617,7 +763,7 @@ namespace Python.Runtime
                 NewReference tempObject = default;
                 if (hasNamedParam)
                 {
-                    op = kwargDict[parameter.Name!];
+                    op = namedArg;
                 }
                 else
                 {
@@ -631,14 +777,24 @@ namespace Python.Runtime
                     }
                 }
 
-                if (!TryConvertArgument(op, parameter.ParameterType, out margs[paramIndex], out bool isOut))
+                if (!TryConvertArgument(op, parameter.ParameterType, out margs[paramIndex], out bool isOut, out PyBuffer? buffer))
                 {
+                    mismatchIndex = paramIndex;
+                    typeDeterminedMismatch = IsTypeDeterminedMismatch(op, parameter.ParameterType);
                     tempObject.Dispose();
+                    ReleaseArguments(margs, buffers);
+                    buffers = null;
                     return null;
                 }
 
                 tempObject.Dispose();
 
+                if (buffer != null)
+                {
+                    buffers ??= new List<PyBuffer>();
+                    buffers.Add(buffer);
+                }
+
                 if (isOut)
                 {
                     outs++;
@@ -656,19 +812,21 @@ namespace Python.Runtime
         /// <param name="parameterType">That parameter's managed type.</param>
         /// <param name="arg">Converted argument.</param>
         /// <param name="isOut">Whether the CLR type is passed by reference.</param>
+        /// <param name="buffer">Python buffer exported for a span or memory parameter.</param>
         /// <returns>true on success</returns>
         static bool TryConvertArgument(BorrowedReference op, Type parameterType,
-                                       out object? arg, out bool isOut)
+                                       out object? arg, out bool isOut, out PyBuffer? buffer)
         {
             arg = null;
             isOut = false;
+            buffer = null;
             var clrtype = TryComputeClrArgumentType(parameterType, op);
             if (clrtype == null)
             {
                 return false;
             }
 
-            if (!Converter.ToManaged(op, clrtype, out arg, true))
+            if (!Converter.ToManaged(op, clrtype, out arg, true, out buffer))
             {
                 return false;
             }
@@ -745,23 +903,19 @@ namespace Python.Runtime
         /// Check whether the number of Python and .NET arguments match, and compute additional arg information.
         /// </summary>
         /// <param name="positionalArgumentCount">Number of positional args passed from Python.</param>
-        /// <param name="parameters">Parameters of the specified .NET method.</param>
+        /// <param name="overload">The .NET method overload.</param>
         /// <param name="kwargDict">Keyword args passed from Python.</param>
-        /// <param name="paramsArray">True if the final param of the .NET method is an array (`params` keyword).</param>
-        /// <param name="defaultArgList">List of default values for arguments.</param>
         /// <param name="kwargsMatched">Number of kwargs from Python that are also present in the .NET method.</param>
         /// <param name="defaultsNeeded">Number of non-null defaultsArgs.</param>
         /// <returns></returns>
-        static bool MatchesArgumentCount(int positionalArgumentCount, ParameterInfo[] parameters,
-            Dictionary<string, PyObject> kwargDict,
-            out bool paramsArray,
-            out ArrayList? defaultArgList,
+        static bool MatchesArgumentCount(int positionalArgumentCount, Overload overload,
+            KeywordArguments kwargDict,
             out int kwargsMatched,
             out int defaultsNeeded)
         {
-            defaultArgList = null;
+            ParameterInfo[] parameters = overload.Parameters;
+            bool paramsArray = overload.IsParamsArray;
             var match = false;
-            paramsArray = parameters.Length > 0 && Attribute.IsDefined(parameters[parameters.Length - 1], typeof(ParamArrayAttribute));
             kwargsMatched = 0;
             defaultsNeeded = 0;
             if (positionalArgumentCount == parameters.Length && kwargDict.Count == 0)
@@ -774,41 +928,31 @@ namespace Python.Runtime
                 // every parameter past 'positionalArgumentCount' must have either
                 // a corresponding keyword arg or a default param, unless the method
                 // method accepts a params array (which cannot have a default value)
-                defaultArgList = new ArrayList();
                 for (var v = positionalArgumentCount; v < parameters.Length; v++)
                 {
-                    if (kwargDict.ContainsKey(parameters[v].Name))
+                    if (kwargDict.Contains(parameters[v].Name))
                     {
                         // we have a keyword argument for this parameter,
-                        // no need to check for a default parameter, but put a null
-                        // placeholder in defaultArgList
-                        defaultArgList.Add(null);
+                        // no need to check for a default parameter
                         kwargsMatched++;
                     }
                     else if (parameters[v].IsOptional)
                     {
                         // IsOptional will be true if the parameter has a default value,
                         // or if the parameter has the [Optional] attribute specified.
-                        // The GetDefaultValue() extension method will return the value
-                        // to be passed in as the parameter value
-                        defaultArgList.Add(parameters[v].GetDefaultValue());
+                        // Overload.DefaultValues contains the value to be passed in
                         defaultsNeeded++;
                     }
-                    else if (parameters[v].IsOut) {
-                        defaultArgList.Add(null);
-                    }
-                    else if (!paramsArray)
+                    else if (!parameters[v].IsOut && !paramsArray)
                     {
                         match = false;
                     }
                 }
             }
-            else if (positionalArgumentCount > parameters.Length && parameters.Length > 0 &&
-                       Attribute.IsDefined(parameters[parameters.Length - 1], typeof(ParamArrayAttribute)))
+            else if (positionalArgumentCount > parameters.Length && paramsArray)
             {
                 // This is a `foo(params object[] bar)` style method
                 match = true;
-                paramsArray = true;
             }
 
             return match;
@@ -871,8 +1015,6 @@ namespace Python.Runtime
             }
 
             Binding? binding = Bind(inst, args, kw, info, methodinfo);
-            object result;
-            IntPtr ts = IntPtr.Zero;
 
             if (binding == null)
             {
@@ -893,6 +1035,53 @@ namespace Python.Runtime
                 return Exceptions.RaiseTypeError(value.ToString());
             }
 
+            using (binding)
+            {
+                return Invoke(binding);
+            }
+        }
+
+        /// <summary>
+        /// Returns the argument array to the pool, and releases the Python buffers exported
+        /// for span and memory arguments, so that their exporters can be resized again.
+        /// Spans can not outlive the call, and memory passed from Python to .NET is only
+        /// valid until the call returns.
+        /// </summary>
+        internal static void ReleaseArguments(object?[] margs, List<PyBuffer>? buffers)
+        {
+            ArgumentArrayPool.Current.Return(margs);
+            if (buffers != null)
+            {
+                foreach (var buffer in buffers)
+                {
+                    buffer.Dispose();
+                }
+            }
+        }
+
+        NewReference Invoke(Binding binding)
+        {
+            object result;
+            IntPtr ts = IntPtr.Zero;
+
+            if (binding.outs == 0)
+            {
+                // the result is converted directly from its static type, avoiding boxing
+                try
+                {
+                    return MethodInvoker.InvokeToPython(binding.info, binding.inst, binding.args, allow_threads);
+                }
+                catch (Exception e)
+                {
+                    if (e is TargetInvocationException && e.InnerException != null)
+                    {
+                        e = e.InnerException;
+                    }
+                    Exceptions.SetError(e);
+                    return default;
+                }
+            }
+
             if (allow_threads)
             {
                 ts = PythonEngine.BeginAllowThreads();
@@ -900,11 +1089,11 @@ namespace Python.Runtime
 
             try
             {
-                result = binding.info.Invoke(binding.inst, BindingFlags.Default, null, binding.args, null);
+                result = MethodInvoker.Invoke(binding.info, binding.inst, binding.args);
             }
             catch (Exception e)
             {
-                if (e.InnerException != null)
+                if (e is TargetInvocationException && e.InnerException != null)
                 {
                     e = e.InnerException;
                 }
@@ -921,7 +1110,7 @@ namespace Python.Runtime
                 PythonEngine.EndAllowThreads(ts);
             }
 
-            // If there are out parameters, we return a tuple containing
+            // There are out parameters, so we return a tuple containing
             // the result, if any, followed by the out parameters. If there is only
             // one out parameter and the return type of the method is void,
             // we return the out parameter as the result to Python (for
@@ -929,43 +1118,38 @@ namespace Python.Runtime
 
             var returnType = binding.info.IsConstructor ? typeof(void) : ((MethodInfo)binding.info).ReturnType;
 
-            if (binding.outs > 0)
+            ParameterInfo[] pi = binding.info.GetParameters();
+            int c = pi.Length;
+            var n = 0;
+
+            bool isVoid = returnType == typeof(void);
+            int tupleSize = binding.outs + (isVoid ? 0 : 1);
+            using var t = Runtime.PyTuple_New(tupleSize);
+            if (!isVoid)
             {
-                ParameterInfo[] pi = binding.info.GetParameters();
-                int c = pi.Length;
-                var n = 0;
-
-                bool isVoid = returnType == typeof(void);
-                int tupleSize = binding.outs + (isVoid ? 0 : 1);
-                using var t = Runtime.PyTuple_New(tupleSize);
-                if (!isVoid)
+                using var v = Converter.ToPython(result, returnType);
+                Runtime.PyTuple_SetItem(t.Borrow(), n, v.Steal());
+                n++;
+            }
+
+            for (var i = 0; i < c; i++)
+            {
+                Type pt = pi[i].ParameterType;
+                if (pt.IsByRef)
                 {
-                    using var v = Converter.ToPython(result, returnType);
+                    using var v = Converter.ToPython(binding.args[i], pt.GetElementType());
                     Runtime.PyTuple_SetItem(t.Borrow(), n, v.Steal());
                     n++;
                 }
+            }
 
-                for (var i = 0; i < c; i++)
-                {
-                    Type pt = pi[i].ParameterType;
-                    if (pt.IsByRef)
-                    {
-                        using var v = Converter.ToPython(binding.args[i], pt.GetElementType());
-                        Runtime.PyTuple_SetItem(t.Borrow(), n, v.Steal());
-                        n++;
-                    }
-                }
-
-                if (binding.outs == 1 && returnType == typeof(void))
-                {
-                    BorrowedReference item = Runtime.PyTuple_GetItem(t.Borrow(), 0);
-                    return new NewReference(item);
-                }
-
-                return new NewReference(t.Borrow());
+            if (binding.outs == 1 && returnType == typeof(void))
+            {
+                BorrowedReference item = Runtime.PyTuple_GetItem(t.Borrow(), 0);
+                return new NewReference(item);
             }
 
-            return Converter.ToPython(result, returnType);
+            return new NewReference(t.Borrow());
         }
     }
 
@@ -975,6 +1159,18 @@ namespace Python.Runtime
     /// </summary>
     internal class MethodSorter : IComparer<MaybeMethodBase>
     {
+        // computing precedence inspects all parameters, so do it once per method
+        readonly Dictionary<MethodBase, int> precedence = new();
+
+        int GetPrecedence(MethodBase method)
+        {
+            if (!precedence.TryGetValue(method, out int value))
+            {
+                value = precedence[method] = MethodBinder.GetPrecedence(method);
+            }
+            return value;
+        }
+
         int IComparer<MaybeMethodBase>.Compare(MaybeMethodBase m1, MaybeMethodBase m2)
         {
             MethodBase me1 = m1.UnsafeValue;
@@ -1003,8 +1199,8 @@ namespace Python.Runtime
                     return -1;
             }
 
-            int p1 = MethodBinder.GetPrecedence(me1);
-            int p2 = MethodBinder.GetPrecedence(me2);
+            int p1 = GetPrecedence(me1);
+            int p2 = GetPrecedence(me2);
             if (p1 < p2)
             {
                 return -1;
@@ -1022,20 +1218,34 @@ namespace Python.Runtime
     /// A Binding is a utility instance that bundles together a MethodInfo
     /// representing a method to call, a (possibly null) target instance for
     /// the call, and the arguments for the call (all as managed values).
+    /// It must be disposed once the call returns.
     /// </summary>
-    internal class Binding
+    internal class Binding : IDisposable
     {
         public MethodBase info;
         public object?[] args;
         public object? inst;
         public int outs;
+        /// <summary>Python buffers, that back span and memory arguments.</summary>
+        public List<PyBuffer>? buffers;
 
-        internal Binding(MethodBase info, object? inst, object?[] args, int outs)
+        internal Binding(MethodBase info, object? inst, object?[] args, int outs, List<PyBuffer>? buffers = null)
         {
             this.info = info;
             this.inst = inst;
             this.args = args;
             this.outs = outs;
+            this.buffers = buffers;
+        }
+
+        /// <summary>
+        /// Releases the arguments, see <see cref="MethodBinder.ReleaseArguments"/>.
+        /// </summary>
+        public void Dispose()
+        {
+            MethodBinder.ReleaseArguments(args, buffers);
+            args = Array.Empty<object?>();
+            buffers = null;
         }
     }
 
@@ -0,0 +1,332 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq.Expressions;
+using System.Reflection;
+using System.Threading;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Invokes reflected methods via compiled strongly typed delegates instead of
+    /// <see cref="MethodBase.Invoke(object, object[])"/>, which has to validate
+    /// and coerce every argument on every call.
+    /// </summary>
+    /// <remarks>
+    /// Methods are invoked through reflection until they have been called
+    /// <see cref="CompilationThreshold"/> times, so that methods called only
+    /// once or twice do not pay for the code generation.
+    /// Constructors are always invoked through reflection, because
+    /// reflected constructors are called on already allocated instances.
+    /// Methods with <c>Span&lt;T&gt;</c> or <c>ReadOnlySpan&lt;T&gt;</c> parameters,
+    /// which reflection can not invoke, are compiled on the first call and
+    /// receive the spans as boxed <see cref="Memory{T}"/> or <see cref="ReadOnlyMemory{T}"/>.
+    /// Unlike reflection, exceptions thrown by the compiled invoker are not
+    /// wrapped in <see cref="TargetInvocationException"/>.
+    /// </remarks>
+    internal sealed class MethodInvoker
+    {
+        internal const int CompilationThreshold = 4;
+
+        static readonly ConcurrentDictionary<MethodBase, MethodInvoker> invokers = new();
+        static readonly Func<MethodBase, MethodInvoker> createInvoker = method => new MethodInvoker(method);
+
+        readonly MethodBase method;
+        /// <summary>Types, that the passed arguments must be instances of.</summary>
+        readonly Type[] argumentTypes;
+        int calls;
+        bool unsupported;
+        readonly bool requiresCompilation;
+        CompiledInvoker? compiled;
+
+        MethodInvoker(MethodBase method)
+        {
+            this.method = method;
+            var parameters = method.GetParameters();
+            argumentTypes = new Type[parameters.Length];
+            for (int i = 0; i < parameters.Length; i++)
+            {
+                Type type = parameters[i].ParameterType;
+                if (GetSpanMemoryType(type) is { } memoryType)
+                {
+                    argumentTypes[i] = memoryType;
+                    requiresCompilation = true;
+                    continue;
+                }
+                if (type.IsByRef) type = type.GetElementType();
+                argumentTypes[i] = Nullable.GetUnderlyingType(type) ?? type;
+            }
+            unsupported = method is not MethodInfo info
+                || info.ContainsGenericParameters
+                || info.ReturnType.IsByRef
+                || IsByRefLike(info.ReturnType)
+                || Array.Exists(argumentTypes, IsByRefLike);
+        }
+
+        /// <summary>
+        /// Values of by-ref like types (e.g. <c>Span&lt;T&gt;</c>) can not be boxed.
+        /// </summary>
+        static bool IsByRefLike(Type type)
+        {
+            foreach (var attribute in type.GetCustomAttributesData())
+            {
+                if (attribute.AttributeType.FullName == "System.Runtime.CompilerServices.IsByRefLikeAttribute")
+                    return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Maps span types to the memory types, that represent their values in argument arrays.
+        /// </summary>
+        /// <remarks>
+        /// Compares names like <see cref="Converter.IsSpanOrMemory"/>, and takes the memory
+        /// types from the assembly of the span types.
+        /// </remarks>
+        static Type? GetSpanMemoryType(Type type)
+        {
+            if (!type.IsGenericType || type.Namespace != "System") return null;
+            string? memoryTypeName = type.Name switch
+            {
+                "Span`1" => "System.Memory`1",
+                "ReadOnlySpan`1" => "System.ReadOnlyMemory`1",
+                _ => null,
+            };
+            return memoryTypeName is null ? null
+                : type.Assembly.GetType(memoryTypeName, throwOnError: true).MakeGenericType(type.GetGenericArguments());
+        }
+
+        internal static MethodInvoker Get(MethodBase method)
+            => invokers.GetOrAdd(method, createInvoker);
+
+        /// <summary>
+        /// Invokes the method with the specified target and arguments.
+        /// Modified values of by-ref arguments are written back to <paramref name="args"/>.
+        /// </summary>
+        internal static object? Invoke(MethodBase method, object? target, object?[] args)
+            => Get(method).Invoke(target, args);
+
+        internal object? Invoke(object? target, object?[] args)
+        {
+            var invoke = GetCompiled();
+            if (invoke is not null && CanInvokeDirectly(target, args))
+            {
+                return invoke.Invoke(target, args);
+            }
+
+            return method.Invoke(target, BindingFlags.Default, null, args, null);
+        }
+
+        /// <summary>
+        /// Invokes the method and converts its result to Python. Results of
+        /// primitive types are not boxed. If <paramref name="allowThreads"/> is set,
+        /// the GIL is released for the duration of the call (but not the conversion).
+        /// </summary>
+        internal static NewReference InvokeToPython(MethodBase method, object? target, object?[] args, bool allowThreads)
+            => Get(method).InvokeToPython(target, args, allowThreads);
+
+        internal NewReference InvokeToPython(object? target, object?[] args, bool allowThreads)
+        {
+            var invoke = GetCompiled();
+            if (invoke is not null && CanInvokeDirectly(target, args))
+            {
+                return invoke.InvokeToPython(target, args, allowThreads);
+            }
+
+            object? result;
+            IntPtr ts = allowThreads ? PythonEngine.BeginAllowThreads() : IntPtr.Zero;
+            try
+            {
+                result = method.Invoke(target, BindingFlags.Default, null, args, null);
+            }
+            finally
+            {
+                if (allowThreads)
+                {
+                    PythonEngine.EndAllowThreads(ts);
+                }
+            }
+
+            var returnType = method is MethodInfo info ? info.ReturnType : typeof(void);
+            return Converter.ToPython(result, returnType);
+        }
+
+        CompiledInvoker? GetCompiled()
+        {
+            var invoke = compiled;
+            if (invoke is null && !unsupported
+                && (requiresCompilation || Interlocked.Increment(ref calls) == CompilationThreshold))
+            {
+                invoke = Compile();
+            }
+            return invoke;
+        }
+
+        /// <summary>
+        /// The compiled invoker performs no argument coercion, so arguments,
+        /// that reflection would have to coerce (or reject), go through reflection.
+        /// </summary>
+        bool CanInvokeDirectly(object? target, object?[] args)
+        {
+            if (args.Length != argumentTypes.Length)
+            {
+                return false;
+            }
+
+            if (!method.IsStatic && (target is null || !method.DeclaringType.IsInstanceOfType(target)))
+            {
+                return false;
+            }
+
+            for (int i = 0; i < args.Length; i++)
+            {
+                object? arg = args[i];
+                if (arg is null) continue;
+
+                Type expected = argumentTypes[i];
+                if (arg.GetType() != expected && !expected.IsInstanceOfType(arg))
+                {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        CompiledInvoker? Compile()
+        {
+            try
+            {
+                compiled = GenerateInvoker((MethodInfo)method);
+            }
+            catch (Exception e) when (e is ArgumentException or InvalidOperationException or NotSupportedException)
+            {
+                // e.g. pointer or by-ref like parameter types
+                unsupported = true;
+            }
+            return compiled;
+        }
+
+        static CompiledInvoker GenerateInvoker(MethodInfo method)
+        {
+            var target = Expression.Parameter(typeof(object), "target");
+            var args = Expression.Parameter(typeof(object?[]), "args");
+
+            var parameters = method.GetParameters();
+            var variables = new List<ParameterExpression>();
+            var body = new List<Expression>();
+            var callArgs = new Expression[parameters.Length];
+            var writeBacks = new List<Expression>();
+
+            for (int i = 0; i < parameters.Length; i++)
+            {
+                Type parameterType = parameters[i].ParameterType;
+                var arg = Expression.ArrayAccess(args, Expression.Constant(i));
+                if (parameterType.IsByRef)
+                {
+                    Type elementType = parameterType.GetElementType();
+                    var local = Expression.Variable(elementType, parameters[i].Name);
+                    variables.Add(local);
+                    body.Add(Expression.Assign(local, Unbox(arg, elementType)));
+                    callArgs[i] = local;
+                    writeBacks.Add(Expression.Assign(arg, Expression.Convert(local, typeof(object))));
+                }
+                else if (GetSpanMemoryType(parameterType) is { } memoryType)
+                {
+                    callArgs[i] = Expression.Property(Unbox(arg, memoryType), nameof(Memory<int>.Span));
+                }
+                else
+                {
+                    callArgs[i] = Unbox(arg, parameterType);
+                }
+            }
+
+            Expression? instance = null;
+            if (!method.IsStatic)
+            {
+                // Unbox produces a reference to the boxed value, so that mutating
+                // methods of value types modify the wrapped object, like reflection does
+                instance = method.DeclaringType.IsValueType
+                    ? Expression.Unbox(target, method.DeclaringType)
+                    : Expression.Convert(target, method.DeclaringType);
+            }
+
+            Expression call = Expression.Call(instance, method, callArgs);
+            Type resultType;
+            if (method.ReturnType == typeof(void))
+            {
+                resultType = typeof(object);
+                body.Add(call);
+                body.AddRange(writeBacks);
+                body.Add(Expression.Constant(null, typeof(object)));
+            }
+            else
+            {
+                resultType = method.ReturnType;
+                var result = Expression.Variable(resultType, "result");
+                variables.Add(result);
+                body.Add(Expression.Assign(result, call));
+                body.AddRange(writeBacks);
+                body.Add(result);
+            }
+
+            var lambda = Expression.Lambda(
+                typeof(Func<,,>).MakeGenericType(typeof(object), typeof(object?[]), resultType),
+                Expression.Block(resultType, variables, body),
+                target, args);
+            var invokerType = typeof(CompiledInvoker<>).MakeGenericType(resultType);
+            return (CompiledInvoker)Activator.CreateInstance(invokerType, lambda.Compile());
+        }
+
+        /// <summary>
+        /// Reflection passes the default value for <c>null</c> arguments of value types.
+        /// </summary>
+        static Expression Unbox(Expression arg, Type type)
+        {
+            if (!type.IsValueType || Nullable.GetUnderlyingType(type) is not null)
+            {
+                return Expression.Convert(arg, type);
+            }
+
+            return Expression.Condition(
+                Expression.ReferenceEqual(arg, Expression.Constant(null)),
+                Expression.Default(type),
+                Expression.Convert(arg, type));
+        }
+
+        abstract class CompiledInvoker
+        {
+            public abstract object? Invoke(object? target, object?[] args);
+            public abstract NewReference InvokeToPython(object? target, object?[] args, bool allowThreads);
+        }
+
+        sealed class CompiledInvoker<TResult> : CompiledInvoker
+        {
+            readonly Func<object?, object?[], TResult> invoke;
+
+            public CompiledInvoker(Func<object?, object?[], TResult> invoke)
+            {
+                this.invoke = invoke;
+            }
+
+            public override object? Invoke(object? target, object?[] args) => invoke(target, args);
+
+            public override NewReference InvokeToPython(object? target, object?[] args, bool allowThreads)
+            {
+                TResult result;
+                IntPtr ts = allowThreads ? PythonEngine.BeginAllowThreads() : IntPtr.Zero;
+                try
+                {
+                    result = invoke(target, args);
+                }
+                finally
+                {
+                    if (allowThreads)
+                    {
+                        PythonEngine.EndAllowThreads(ts);
+                    }
+                }
+                return Converter.ToPython(result);
+            }
+        }
+    }
+}
@@ -0,0 +1,66 @@
+using System;
+using System.Collections.Generic;
+using System.Threading.Tasks;
+
+namespace Python.Runtime.Mixins
+{
+    /// <summary>
+    /// Makes <see cref="Task"/> and <c>ValueTask</c> types awaitable from Python.
+    /// </summary>
+    class TaskMixinsProvider : IPythonBaseTypeProvider, IDisposable
+    {
+        readonly Lazy<PyObject> mixinsModule;
+        public TaskMixinsProvider(Lazy<PyObject> mixinsModule)
+        {
+            this.mixinsModule = mixinsModule ?? throw new ArgumentNullException(nameof(mixinsModule));
+        }
+
+        public PyObject Mixins => this.mixinsModule.Value;
+
+        public IEnumerable<PyType> GetBaseTypes(Type type, IList<PyType> existingBases)
+        {
+            if (type is null)
+                throw new ArgumentNullException(nameof(type));
+
+            if (existingBases is null)
+                throw new ArgumentNullException(nameof(existingBases));
+
+            // derived tasks inherit the mixin from the Python type of Task
+            string? mixin = type == typeof(Task) ? "TaskMixin"
+                : IsValueTask(type) ? "ValueTaskMixin"
+                : null;
+            if (mixin is null)
+            {
+                return existingBases;
+            }
+
+            var newBases = new List<PyType>(existingBases)
+            {
+                new PyType(this.Mixins.GetAttr(mixin)),
+            };
+            return newBases;
+        }
+
+        /// <remarks>
+        /// Compares names, because on .NET Framework <c>ValueTask</c> lives in
+        /// System.Threading.Tasks.Extensions, which might not be deployed.
+        /// </remarks>
+        static bool IsValueTask(Type type)
+        {
+            if (type.IsGenericType)
+            {
+                type = type.GetGenericTypeDefinition();
+            }
+            return type.Namespace == "System.Threading.Tasks"
+                && type.Name is "ValueTask" or "ValueTask`1";
+        }
+
+        public void Dispose()
+        {
+            if (this.mixinsModule.IsValueCreated)
+            {
+                this.mixinsModule.Value.Dispose();
+            }
+        }
+    }
+}
@@ -0,0 +1,100 @@
+"""
+Implements awaiting .NET tasks from asyncio coroutines, and runs coroutines
+for .NET on a dedicated event loop thread
+https://docs.python.org/3/library/asyncio-task.html
+"""
+
+# asyncio is imported on first use instead of when the clr module is initialized
+import _thread
+
+
+def _set_done(future):
+    if not future.done():
+        future.set_result(None)
+
+
+def _await_task(task):
+    import asyncio
+    import clr
+    import functools
+
+    if not task.IsCompleted:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # the GIL is not held while the task runs, the callback
+        # only wakes up the event loop once it completed
+        notify = functools.partial(loop.call_soon_threadsafe, _set_done, future)
+        clr._add_task_callback(task, notify)
+        yield from future
+    if task.IsCanceled:
+        raise asyncio.CancelledError()
+    return clr._get_task_result(task)
+
+
+class TaskMixin:
+    __slots__ = ()
+
+    def __await__(self):
+        return _await_task(self)
+
+
+class ValueTaskMixin:
+    __slots__ = ()
+
+    def __await__(self):
+        return _await_task(self.AsTask())
+
+
+_loop = None
+_loop_thread = None
+_lock = _thread.allocate_lock()
+
+
+def _run_loop(loop):
+    import asyncio
+
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    finally:
+        loop.close()
+
+
+def _get_loop():
+    import asyncio
+    import threading
+
+    global _loop, _loop_thread
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_run_loop, args=(_loop,),
+                                            name="pythonnet asyncio event loop", daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+def run_coroutine(coroutine, completion):
+    """Schedules the coroutine on the event loop thread, and completes
+    the .NET TaskCompletionSource with its result"""
+    import asyncio
+    import clr
+    import functools
+
+    future = asyncio.run_coroutine_threadsafe(coroutine, _get_loop())
+    future.add_done_callback(functools.partial(clr._complete_task, completion))
+
+
+def stop_loop():
+    """Cancels coroutines, that are still running, and stops the event loop thread"""
+    global _loop, _loop_thread
+    with _lock:
+        loop, thread = _loop, _loop_thread
+        _loop = _loop_thread = None
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
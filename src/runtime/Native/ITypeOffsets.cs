@@ -9,6 +9,7 @@ namespace Python.Runtime.Native
                      Scope = "type")]
     interface ITypeOffsets
     {
+        int am_await { get; }
         int bf_getbuffer { get; }
         int mp_ass_subscript { get; }
         int mp_length { get; }
@@ -38,6 +39,7 @@ namespace Python.Runtime.Native
         int sq_contains { get; }
         int sq_length { get; }
         int tp_alloc { get; }
+        int tp_as_async { get; }
         int tp_as_buffer { get; }
         int tp_as_mapping { get; }
         int tp_as_number { get; }
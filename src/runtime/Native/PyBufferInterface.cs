@@ -4,7 +4,11 @@ using System.Runtime.InteropServices;
 namespace Python.Runtime
 {
     /* buffer interface */
-    [StructLayout(LayoutKind.Sequential, CharSet = CharSet.Auto)]
+    /// <remarks>
+    /// Must stay blittable: exporters may point fields (e.g. <see cref="strides"/>)
+    /// into the structure itself, so it must not be copied by the marshaler.
+    /// </remarks>
+    [StructLayout(LayoutKind.Sequential)]
     internal struct Py_buffer {
         public IntPtr buf;
         public IntPtr obj;        /* owned reference */
@@ -14,11 +18,18 @@ namespace Python.Runtime
         [MarshalAs(UnmanagedType.SysInt)]
         public nint itemsize;  /* This is Py_ssize_t so it can be
                              pointed to by strides in simple case.*/
-        [MarshalAs(UnmanagedType.Bool)]
-        public bool _readonly;
+        int readonlyFlag;
+        public bool _readonly
+        {
+            get => readonlyFlag != 0;
+            set => readonlyFlag = value ? 1 : 0;
+        }
         public int ndim;
-        [MarshalAs(UnmanagedType.LPStr)]
-        public string? format;
+        /// <summary>
+        /// Null-terminated struct module style format string, owned by the exporter.
+        /// Not marshaled as string, because the marshaler would free it.
+        /// </summary>
+        public IntPtr format;
         public IntPtr shape;
         public IntPtr strides;
         public IntPtr suboffsets;
@@ -16,6 +16,7 @@ namespace Python.Runtime
                      Scope = "type")]
     static partial class TypeOffset
     {
+        internal static int am_await { get; private set; }
         internal static int bf_getbuffer { get; private set; }
         internal static int mp_ass_subscript { get; private set; }
         internal static int mp_length { get; private set; }
@@ -45,6 +46,7 @@ namespace Python.Runtime
         internal static int sq_contains { get; private set; }
         internal static int sq_length { get; private set; }
         internal static int tp_alloc { get; private set; }
+        internal static int tp_as_async { get; private set; }
         internal static int tp_as_buffer { get; private set; }
         internal static int tp_as_mapping { get; private set; }
         internal static int tp_as_number { get; private set; }
@@ -171,6 +173,9 @@ namespace Python.Runtime
                 "ListAssemblies",
                 nameof(CLRModule._load_clr_module),
                 nameof(CLRModule._add_pending_namespaces),
+                nameof(CLRModule._add_task_callback),
+                nameof(CLRModule._get_task_result),
+                nameof(CLRModule._complete_task),
                 "Release",
                 "Reset",
                 "set_SuppressDocs",
@@ -5,56 +5,156 @@ using System.Collections.Generic;
 using System.Linq;
 using System.Runtime.Serialization;
 using System.Threading;
+using System.Threading.Tasks;
 
 using Python.Runtime.Native;
 
 public static class Py
 {
-    public static GILState GIL() => PythonEngine.DebugGIL ? new DebugGILState() : new GILState();
+    /// <summary>
+    /// Acquires the Python global interpreter lock (GIL) for the current thread.
+    /// Nested acquisitions on a thread, that already acquired the GIL this way,
+    /// only increment a counter.
+    /// </summary>
+    public static GILState GIL() => GILState.Acquire();
+
+    /// <summary>
+    /// Checks if the current thread holds the Python global interpreter lock.
+    /// </summary>
+    public static bool IsGILHeld
+        => GILState.CurrentDepth > 0
+        || Runtime.IsInitialized && Runtime.PyGILState_Check() != 0;
+
+    /// <summary>
+    /// Runs a Python coroutine on a dedicated <c>asyncio</c> event loop thread, and returns
+    /// a task, that completes with its result. The event loop is started on first use,
+    /// and stopped when the engine shuts down, cancelling coroutines, that are still running.
+    /// </summary>
+    public static Task<PyObject> RunCoroutine(PyObject coroutine) => TaskBridge.RunCoroutine(coroutine);
 
     public static PyModule CreateScope() => new();
     public static PyModule CreateScope(string name)
         => new(name ?? throw new ArgumentNullException(nameof(name)));
 
 
-    public class GILState : IDisposable
+    /// <summary>
+    /// Handle to the GIL acquired by <see cref="GIL"/>.
+    /// Handles must be disposed on the thread, that acquired them, in reverse order.
+    /// </summary>
+    public struct GILState : IDisposable
     {
-        private readonly PyGILState state;
-        private bool isDisposed;
+        // number of nested GIL() handles on this thread, that are not disposed
+        [ThreadStatic]
+        static int currentDepth;
+        // handles up to this depth are suspended by PythonEngine.BeginAllowThreads
+        [ThreadStatic]
+        static int suspendedDepth;
+        [ThreadStatic]
+        static Stack<int>? suspendedDepths;
+        // identifies the handle at each depth, so that copies of a disposed
+        // handle can not release a later acquisition at the same depth
+        [ThreadStatic]
+        static long[]? tokens;
+        [ThreadStatic]
+        static long lastToken;
+
+        readonly PyGILState state;
+        // whether this handle took the GIL, and must give it back
+        readonly bool locked;
+        readonly long token;
+        readonly DebugInfo? debug;
+        int depth;
 
-        internal GILState()
+        GILState(PyGILState state, bool locked, int depth, long token)
         {
-            state = PythonEngine.AcquireLock();
+            this.state = state;
+            this.locked = locked;
+            this.depth = depth;
+            this.token = token;
+            this.debug = PythonEngine.DebugGIL ? new DebugInfo() : null;
         }
 
-        public virtual void Dispose()
-        {
-            if (this.isDisposed) return;
+        internal static int CurrentDepth => currentDepth - suspendedDepth;
 
-            PythonEngine.ReleaseLock(state);
-            GC.SuppressFinalize(this);
-            this.isDisposed = true;
+        internal static GILState Acquire()
+        {
+            int depth = currentDepth;
+            // native code (e.g. ctypes) can release the GIL without BeginAllowThreads,
+            // and call back into .NET, so outer handles do not guarantee it is held
+            bool locked = depth == suspendedDepth || Runtime.PyGILState_Check() == 0;
+            PyGILState state = locked ? PythonEngine.AcquireLock() : default;
+            depth++;
+            if (tokens is null || tokens.Length <= depth)
+            {
+                Array.Resize(ref tokens, Math.Max(depth + 1, (tokens?.Length ?? 4) * 2));
+            }
+            long token = ++lastToken;
+            tokens[depth] = token;
+            currentDepth = depth;
+            return new GILState(state, locked, depth, token);
         }
 
-        ~GILState()
+        /// <summary>
+        /// Called when the current thread releases the GIL, so that handles
+        /// acquired after that do not assume it is still held.
+        /// </summary>
+        internal static void Suspend()
         {
-            throw new InvalidOperationException("GIL must always be released, and it must be released from the same thread that acquired it.");
+            (suspendedDepths ??= new Stack<int>()).Push(suspendedDepth);
+            suspendedDepth = currentDepth;
         }
-    }
 
-    public class DebugGILState : GILState
-    {
-        readonly Thread owner;
-        internal DebugGILState() : base()
+        internal static void Resume()
         {
-            this.owner = Thread.CurrentThread;
+            if (suspendedDepths is { Count: > 0 })
+            {
+                suspendedDepth = suspendedDepths.Pop();
+            }
         }
-        public override void Dispose()
+
+        public void Dispose()
         {
-            if (this.owner != Thread.CurrentThread)
+            if (this.depth == 0) return;
+
+            if (this.debug is not null && this.debug.Owner != Thread.CurrentThread)
                 throw new InvalidOperationException("GIL must always be released from the same thread, that acquired it");
 
-            base.Dispose();
+            // disposing a copy of a handle, that was already disposed, is a no-op
+            if (currentDepth < this.depth || tokens![this.depth] != this.token)
+            {
+                this.depth = 0;
+                return;
+            }
+            // handles acquired before BeginAllowThreads are nested outside of it
+            if (currentDepth > this.depth || this.depth <= suspendedDepth)
+                throw new InvalidOperationException("GIL must be released in the reverse order it was acquired");
+
+            currentDepth = this.depth - 1;
+            if (this.locked)
+            {
+                PythonEngine.ReleaseLock(state);
+            }
+            // the depth can be reached again, but not by this acquisition
+            tokens[this.depth] = 0;
+            this.depth = 0;
+            if (this.debug is not null)
+            {
+                GC.SuppressFinalize(this.debug);
+            }
+        }
+
+        /// <summary>
+        /// With <see cref="PythonEngine.DebugGIL"/> set, checks that handles are
+        /// released on the thread, that acquired them, and that they are released at all.
+        /// </summary>
+        sealed class DebugInfo
+        {
+            public readonly Thread Owner = Thread.CurrentThread;
+
+            ~DebugInfo()
+            {
+                throw new InvalidOperationException("GIL must always be released, and it must be released from the same thread that acquired it.");
+            }
         }
     }
 
@@ -299,7 +299,7 @@ namespace Python.Runtime
 
         static void LoadMixins(BorrowedReference targetModuleDict)
         {
-            foreach (string nested in new[] { "collections" })
+            foreach (string nested in new[] { "collections", "tasks" })
             {
                 LoadSubmodule(targetModuleDict,
                     fullName: "clr._extras." + nested,
@@ -507,7 +507,9 @@ namespace Python.Runtime
         /// </remarks>
         public static unsafe IntPtr BeginAllowThreads()
         {
-            return (IntPtr)Runtime.PyEval_SaveThread();
+            var ts = (IntPtr)Runtime.PyEval_SaveThread();
+            Py.GILState.Suspend();
+            return ts;
         }
 
 
@@ -524,6 +526,7 @@ namespace Python.Runtime
         public static unsafe void EndAllowThreads(IntPtr ts)
         {
             Runtime.PyEval_RestoreThread((PyThreadState*)ts);
+            Py.GILState.Resume();
         }
 
         public static PyObject Compile(string code, string filename = "", RunFlagType mode = RunFlagType.File)
@@ -55,7 +55,7 @@ namespace Python.Runtime
 
         internal static PythonException? FetchCurrentOrNullRaw()
         {
-            using var _ = new Py.GILState();
+            using var _ = Py.GIL();
 
             Runtime.PyErr_Fetch(type: out var type, val: out var value, tb: out var traceback);
 
@@ -77,7 +77,7 @@ namespace Python.Runtime
 
         internal static Exception? PeekCurrentOrNull(out ExceptionDispatchInfo? dispatchInfo)
         {
-            using var _ = new Py.GILState();
+            using var _ = Py.GIL();
 
             Runtime.PyErr_Fetch(out var type, out var value, out var traceback);
             Runtime.PyErr_Restore(
@@ -100,7 +100,7 @@ namespace Python.Runtime
             // from crashing process with undebuggable StackOverflowException
             RuntimeHelpers.EnsureSufficientExecutionStack();
 
-            using var _ = new Py.GILState();
+            using var _ = Py.GIL();
             Runtime.PyErr_Fetch(out var type, out var value, out var traceback);
             if (type.IsNull())
             {
@@ -324,7 +324,7 @@ namespace Python.Runtime
                 if (!PythonEngine.IsInitialized && Runtime.Py_IsInitialized() == 0)
                     return "Python stack unavailable as runtime was shut down\n" + base.StackTrace;
 
-                using var _ = new Py.GILState();
+                using var _ = Py.GIL();
                 return TracebackToString(Traceback) + base.StackTrace;
             }
         }
@@ -337,7 +337,7 @@ namespace Python.Runtime
 
                 CheckRuntimeIsRunning();
 
-                using var _ = new Py.GILState();
+                using var _ = Py.GIL();
                 return Runtime.PyObject_TypeCheck(Value.Reference, Type.Reference);
             }
         }
@@ -393,7 +393,7 @@ namespace Python.Runtime
         {
             CheckRuntimeIsRunning();
 
-            using var _ = new Py.GILState();
+            using var _ = Py.GIL();
 
             var copy = Clone();
             copy.Normalize();
@@ -6,22 +6,44 @@ using System.Runtime.InteropServices;
 
 namespace Python.Runtime
 {
-    public sealed class PyBuffer : IDisposable
+    public sealed unsafe class PyBuffer : IDisposable
     {
         private PyObject _exporter;
-        private Py_buffer _view;
+        /// <summary>
+        /// Exporters may point fields of the view into the view itself,
+        /// so it is allocated in unmanaged memory, where it does not move.
+        /// </summary>
+        private Py_buffer* _viewPtr;
+        private ref Py_buffer _view
+        {
+            get
+            {
+                if (_viewPtr == null)
+                    throw new ObjectDisposedException(nameof(PyBuffer));
+                return ref *_viewPtr;
+            }
+        }
 
         internal PyBuffer(PyObject exporter, PyBUF flags)
         {
-            _view = new Py_buffer();
+            _viewPtr = (Py_buffer*)Marshal.AllocHGlobal(sizeof(Py_buffer));
+            *_viewPtr = default;
 
             if (Runtime.PyObject_GetBuffer(exporter, out _view, (int)flags) < 0)
             {
+                FreeView();
+                disposedValue = true;
+                GC.SuppressFinalize(this);
                 throw PythonException.ThrowLastAsClrException();
             }
 
             _exporter = exporter;
 
+            if (_view.format != IntPtr.Zero)
+            {
+                Format = Marshal.PtrToStringAnsi(_view.format);
+            }
+
             var intPtrBuf = new IntPtr[_view.ndim];
             if (_view.shape != IntPtr.Zero)
             {
@@ -46,7 +68,7 @@ namespace Python.Runtime
         public int Dimensions => _view.ndim;
         public bool ReadOnly => _view._readonly;
         public IntPtr Buffer => _view.buf;
-        public string? Format => _view.format;
+        public string? Format { get; }
 
         /// <summary>
         /// An array of length <see cref="Dimensions"/> indicating the shape of the memory as an n-dimensional array.
@@ -66,6 +88,58 @@ namespace Python.Runtime
         /// </summary>
         public long[]? SubOffsets { get; private set; }
 
+        /// <summary>
+        /// Checks if the object supports the buffer protocol without requesting a buffer.
+        /// </summary>
+        internal static bool IsSupportedBy(BorrowedReference obj)
+        {
+            IntPtr procs = Util.ReadIntPtr(Runtime.PyObject_TYPE(obj), TypeOffset.tp_as_buffer);
+            return procs != IntPtr.Zero && Marshal.ReadIntPtr(procs) != IntPtr.Zero;
+        }
+
+        /// <summary>
+        /// Checks if the items of the buffer have the same binary representation
+        /// as values of the given primitive type.
+        /// </summary>
+        internal bool HasItemsOf(Type type)
+        {
+            // NULL format means unsigned bytes
+            string format = Format ?? "B";
+            if (format.Length == 2
+                && (format[0] is '@' or '=' || format[0] == (BitConverter.IsLittleEndian ? '<' : '>')))
+            {
+                format = format.Substring(1);
+            }
+            if (format.Length != 1)
+            {
+                return false;
+            }
+
+            char code = format[0];
+            long size = ItemSize;
+            switch (Type.GetTypeCode(type))
+            {
+                case TypeCode.Boolean: return code == '?' && size == 1;
+                case TypeCode.SByte: return IsSignedIntegerFormat(code) && size == 1;
+                case TypeCode.Byte: return IsUnsignedIntegerFormat(code) && size == 1;
+                case TypeCode.Int16: return IsSignedIntegerFormat(code) && size == 2;
+                case TypeCode.UInt16: return IsUnsignedIntegerFormat(code) && size == 2;
+                case TypeCode.Int32: return IsSignedIntegerFormat(code) && size == 4;
+                case TypeCode.UInt32: return IsUnsignedIntegerFormat(code) && size == 4;
+                case TypeCode.Int64: return IsSignedIntegerFormat(code) && size == 8;
+                case TypeCode.UInt64: return IsUnsignedIntegerFormat(code) && size == 8;
+                case TypeCode.Single: return code == 'f' && size == 4;
+                case TypeCode.Double: return code == 'd' && size == 8;
+            }
+
+            if (type == typeof(IntPtr)) return IsSignedIntegerFormat(code) && size == IntPtr.Size;
+            if (type == typeof(UIntPtr)) return IsUnsignedIntegerFormat(code) && size == UIntPtr.Size;
+            return false;
+        }
+
+        static bool IsSignedIntegerFormat(char code) => code is 'b' or 'h' or 'i' or 'l' or 'q' or 'n';
+        static bool IsUnsignedIntegerFormat(char code) => code is 'B' or 'H' or 'I' or 'L' or 'Q' or 'N';
+
         private static char OrderStyleToChar(BufferOrderStyle order, bool eitherOneValid)
         {
             char style = 'C';
@@ -231,6 +305,70 @@ namespace Python.Runtime
             Marshal.Copy(_view.buf + sourceOffset, buffer, destinationOffset, count);
         }
 
+        /// <summary>
+        /// Gets a span over the memory of a writable C-contiguous buffer without copying it.
+        /// The span is only valid until the buffer is disposed.
+        /// </summary>
+        /// <typeparam name="T">Type of buffer items. Must match <see cref="Format"/> and <see cref="ItemSize"/>.</typeparam>
+        public Span<T> AsSpan<T>() where T : unmanaged
+        {
+            if (ReadOnly)
+                throw new InvalidOperationException("Buffer is read-only");
+            return GetSpan<T>();
+        }
+
+        /// <summary>
+        /// Gets a read-only span over the memory of a C-contiguous buffer without copying it.
+        /// The span is only valid until the buffer is disposed.
+        /// </summary>
+        /// <typeparam name="T">Type of buffer items. Must match <see cref="Format"/> and <see cref="ItemSize"/>.</typeparam>
+        public ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged
+            => GetSpan<T>();
+
+        /// <summary>
+        /// Gets a <see cref="Memory{T}"/> over the memory of a writable C-contiguous buffer
+        /// without copying it. The memory is only valid until the buffer is disposed.
+        /// </summary>
+        /// <typeparam name="T">Type of buffer items. Must match <see cref="Format"/> and <see cref="ItemSize"/>.</typeparam>
+        public Memory<T> AsMemory<T>() where T : unmanaged
+        {
+            if (ReadOnly)
+                throw new InvalidOperationException("Buffer is read-only");
+            CheckSpanCompatible<T>();
+            return new PyBufferMemoryManager<T>(this, ownsBuffer: false).Memory;
+        }
+
+        /// <summary>
+        /// Gets a <see cref="ReadOnlyMemory{T}"/> over the memory of a C-contiguous buffer
+        /// without copying it. The memory is only valid until the buffer is disposed.
+        /// </summary>
+        /// <typeparam name="T">Type of buffer items. Must match <see cref="Format"/> and <see cref="ItemSize"/>.</typeparam>
+        public ReadOnlyMemory<T> AsReadOnlyMemory<T>() where T : unmanaged
+        {
+            CheckSpanCompatible<T>();
+            return new PyBufferMemoryManager<T>(this, ownsBuffer: false).Memory;
+        }
+
+        internal unsafe Span<T> GetSpan<T>() where T : unmanaged
+        {
+            CheckSpanCompatible<T>();
+            return new Span<T>((void*)_view.buf, checked((int)(_view.len / sizeof(T))));
+        }
+
+        unsafe void CheckSpanCompatible<T>() where T : unmanaged
+        {
+            if (disposedValue)
+                throw new ObjectDisposedException(nameof(PyBuffer));
+            if (!this.IsContiguous(BufferOrderStyle.C))
+                throw new NotImplementedException("Only continuous buffers are supported");
+            // items of non-primitive types are only checked for size
+            bool compatible = typeof(T).IsPrimitive
+                ? HasItemsOf(typeof(T))
+                : _view.itemsize == sizeof(T);
+            if (!compatible)
+                throw new InvalidOperationException($"Buffer of items with format '{Format}' and size {ItemSize} can not be accessed as {typeof(T)}");
+        }
+
         private bool disposedValue = false; // To detect redundant calls
 
         private void Dispose(bool disposing)
@@ -242,6 +380,7 @@ namespace Python.Runtime
 
                 // this also decrements ref count for _view->obj
                 Runtime.PyBuffer_Release(ref _view);
+                FreeView();
 
                 _exporter = null!;
                 Shape = null;
@@ -252,6 +391,12 @@ namespace Python.Runtime
             }
         }
 
+        private void FreeView()
+        {
+            Marshal.FreeHGlobal((IntPtr)_viewPtr);
+            _viewPtr = null;
+        }
+
         ~PyBuffer()
         {
             Debug.Assert(!disposedValue);
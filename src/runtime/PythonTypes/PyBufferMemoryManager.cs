@@ -0,0 +1,45 @@
+using System;
+using System.Buffers;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Exposes the memory of a C-contiguous <see cref="PyBuffer"/> as <see cref="Memory{T}"/>.
+    /// </summary>
+    internal sealed class PyBufferMemoryManager<T> : MemoryManager<T> where T : unmanaged
+    {
+        readonly PyBuffer buffer;
+        readonly bool ownsBuffer;
+
+        /// <param name="buffer">The buffer to expose</param>
+        /// <param name="ownsBuffer">
+        /// If set, the buffer is released when the manager is disposed. Otherwise, buffers
+        /// not released explicitly are released by <see cref="Finalizer"/>.
+        /// </param>
+        public PyBufferMemoryManager(PyBuffer buffer, bool ownsBuffer)
+        {
+            this.buffer = buffer ?? throw new ArgumentNullException(nameof(buffer));
+            this.ownsBuffer = ownsBuffer;
+        }
+
+        public override Span<T> GetSpan() => buffer.GetSpan<T>();
+
+        public override unsafe MemoryHandle Pin(int elementIndex = 0)
+        {
+            if ((uint)elementIndex > (uint)GetSpan().Length)
+                throw new ArgumentOutOfRangeException(nameof(elementIndex));
+            // exported memory does not move while the buffer is held
+            return new MemoryHandle((T*)buffer.Buffer + elementIndex);
+        }
+
+        public override void Unpin() { }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing && ownsBuffer)
+            {
+                buffer.Dispose();
+            }
+        }
+    }
+}
@@ -0,0 +1,22 @@
+namespace Python.Runtime {
+    using System;
+
+    /// <summary>
+    /// Releases the Python global interpreter lock (GIL) while getters and setters
+    /// of the marked property, or of all properties declared by the marked type,
+    /// are called from Python, so other Python threads can run during blocking calls.
+    /// Methods of .NET types already release the GIL while they run.
+    /// </summary>
+    /// <remarks>
+    /// Marked members must not use Python objects without acquiring the GIL.
+    /// Members of types, that can not be marked, can be registered in
+    /// <see cref="InteropConfiguration.ReleaseGILMembers"/>.
+    /// </remarks>
+    [AttributeUsage(AttributeTargets.Class | AttributeTargets.Interface | AttributeTargets.Struct
+                    | AttributeTargets.Property,
+        AllowMultiple = false,
+        Inherited = false)]
+    public sealed class ReleaseGILAttribute : Attribute
+    {
+    }
+}
@@ -211,6 +211,8 @@ public unsafe partial class Runtime
             PyTuple_SetItem = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int>)GetFunctionByName(nameof(PyTuple_SetItem), GetUnmanagedDll(_PythonDll));
             PyTuple_GetSlice = (delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference>)GetFunctionByName(nameof(PyTuple_GetSlice), GetUnmanagedDll(_PythonDll));
             PyTuple_Size = (delegate* unmanaged[Cdecl]<BorrowedReference, IntPtr>)GetFunctionByName(nameof(PyTuple_Size), GetUnmanagedDll(_PythonDll));
+            PySlice_Unpack = (delegate* unmanaged[Cdecl]<BorrowedReference, out nint, out nint, out nint, int>)GetFunctionByName(nameof(PySlice_Unpack), GetUnmanagedDll(_PythonDll));
+            PySlice_AdjustIndices = (delegate* unmanaged[Cdecl]<nint, ref nint, ref nint, nint, nint>)GetFunctionByName(nameof(PySlice_AdjustIndices), GetUnmanagedDll(_PythonDll));
             try
             {
                 PyIter_Check = (delegate* unmanaged[Cdecl]<BorrowedReference, int>)GetFunctionByName(nameof(PyIter_Check), GetUnmanagedDll(_PythonDll));
@@ -487,6 +489,8 @@ public unsafe partial class Runtime
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, StolenReference, int> PyTuple_SetItem { get; }
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint, nint, NewReference> PyTuple_GetSlice { get; }
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, nint> PyTuple_Size { get; }
+        internal static delegate* unmanaged[Cdecl]<BorrowedReference, out nint, out nint, out nint, int> PySlice_Unpack { get; }
+        internal static delegate* unmanaged[Cdecl]<nint, ref nint, ref nint, nint, nint> PySlice_AdjustIndices { get; }
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, int> PyIter_Check { get; }
         internal static delegate* unmanaged[Cdecl]<BorrowedReference, NewReference> PyIter_Next { get; }
         internal static delegate* unmanaged[Cdecl]<StrPtr, NewReference> PyModule_New { get; }
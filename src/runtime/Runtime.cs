@@ -223,6 +223,7 @@ namespace Python.Runtime
                 SetPyMemberTypeOf(out PyWrapperDescriptorType, PyObject_GetAttrString(PyBaseObjectType, "__init__").StealNullable());
 
                 SetPyMember(out PySuper_Type, PyObject_GetAttrString(builtins, "super").StealNullable());
+                SetPyMember(out PySliceType, PyObject_GetAttrString(builtins, "slice").StealNullable());
             }
 
             SetPyMemberTypeOf(out PyStringType, PyString_FromString("string").StealNullable());
@@ -262,6 +263,9 @@ namespace Python.Runtime
             }
             _isInitialized = false;
 
+            // the finalizer thread must not be waiting for the GIL during shutdown
+            Finalizer.Instance.StopBackgroundThread();
+
             var state = PyGILState_Ensure();
 
             if (!HostedInPython && !ProcessIsTerminating)
@@ -482,6 +486,7 @@ namespace Python.Runtime
         internal static PyObject PyTupleType;
         internal static PyObject PyListType;
         internal static PyObject PyDictType;
+        internal static PyObject PySliceType;
         internal static PyObject PyLongType;
         internal static PyObject PyFloatType;
         internal static PyType PyBoolType;
@@ -1490,6 +1495,28 @@ namespace Python.Runtime
         internal static nint PyTuple_Size(BorrowedReference pointer) => Delegates.PyTuple_Size(pointer);
 
 
+        //====================================================================
+        // Python slice API
+        //====================================================================
+
+        internal static bool PySlice_Check(BorrowedReference ob)
+        {
+            return PyObject_TYPE(ob) == PySliceType;
+        }
+
+        /// <summary>
+        /// Extracts start, stop and step of a slice object without clamping them to a sequence length.
+        /// </summary>
+        internal static int PySlice_Unpack(BorrowedReference slice, out nint start, out nint stop, out nint step)
+            => Delegates.PySlice_Unpack(slice, out start, out stop, out step);
+
+        /// <summary>
+        /// Adjusts slice bounds to a sequence of the given length. Returns the number of items in the slice.
+        /// </summary>
+        internal static nint PySlice_AdjustIndices(nint length, ref nint start, ref nint stop, nint step)
+            => Delegates.PySlice_AdjustIndices(length, ref start, ref stop, step);
+
+
         //====================================================================
         // Python iterator API
         //====================================================================
@@ -0,0 +1,124 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Connects .NET tasks with Python <c>asyncio</c>.
+    /// See <c>Mixins/tasks.py</c> for the Python side.
+    /// </summary>
+    internal static class TaskBridge
+    {
+        const string TasksModuleName = "clr._extras.tasks";
+
+        static bool loopStarted;
+
+        /// <summary>
+        /// Calls <paramref name="callback"/> without arguments, when <paramref name="task"/> completes.
+        /// The GIL is only acquired for the call.
+        /// </summary>
+        internal static void AddCompletionCallback(Task task, PyObject callback)
+        {
+            task.ContinueWith(static (_, state) =>
+            {
+                var callback = (PyObject)state!;
+                if (!PythonEngine.IsInitialized) return;
+
+                using (Py.GIL())
+                {
+                    try
+                    {
+                        callback.Invoke().Dispose();
+                    }
+                    catch (PythonException)
+                    {
+                        // the event loop was closed, nothing waits for the task anymore
+                    }
+                    finally
+                    {
+                        callback.Dispose();
+                    }
+                }
+            }, callback, CancellationToken.None, TaskContinuationOptions.ExecuteSynchronously, TaskScheduler.Default);
+        }
+
+        /// <summary>
+        /// Returns the result of a completed task, or <c>null</c> if it does not have one.
+        /// Exceptions of faulted tasks are rethrown without wrapping them in <see cref="AggregateException"/>.
+        /// </summary>
+        internal static object? GetResult(Task task)
+        {
+            task.GetAwaiter().GetResult();
+
+            for (Type? type = task.GetType(); type is not null; type = type.BaseType)
+            {
+                if (type.IsGenericType && type.GetGenericTypeDefinition() == typeof(Task<>))
+                {
+                    // async methods returning Task are implemented as Task<VoidTaskResult>
+                    if (type.GetGenericArguments()[0].FullName == "System.Threading.Tasks.VoidTaskResult")
+                        return null;
+                    return type.GetProperty(nameof(Task<object>.Result)).GetValue(task);
+                }
+            }
+            return null;
+        }
+
+        /// <summary>
+        /// Runs a Python coroutine on a dedicated event loop thread.
+        /// </summary>
+        internal static Task<PyObject> RunCoroutine(PyObject coroutine)
+        {
+            if (coroutine is null) throw new ArgumentNullException(nameof(coroutine));
+
+            var completion = new TaskCompletionSource<PyObject>(TaskCreationOptions.RunContinuationsAsynchronously);
+            using (Py.GIL())
+            {
+                if (!loopStarted)
+                {
+                    PythonEngine.AddShutdownHandler(StopLoop);
+                    loopStarted = true;
+                }
+
+                using var tasks = Py.Import(TasksModuleName);
+                using var pyCompletion = completion.ToPython();
+                tasks.InvokeMethod("run_coroutine", coroutine, pyCompletion).Dispose();
+            }
+            return completion.Task;
+        }
+
+        /// <summary>
+        /// Completes <paramref name="completion"/> from a done <c>concurrent.futures.Future</c>.
+        /// </summary>
+        internal static void Complete(TaskCompletionSource<PyObject> completion, PyObject future)
+        {
+            using (future)
+            {
+                try
+                {
+                    using var cancelled = future.InvokeMethod("cancelled");
+                    if (cancelled.IsTrue())
+                    {
+                        completion.TrySetCanceled();
+                        return;
+                    }
+                    completion.TrySetResult(future.InvokeMethod("result"));
+                }
+                catch (PythonException e)
+                {
+                    completion.TrySetException(e);
+                }
+            }
+        }
+
+        static void StopLoop()
+        {
+            loopStarted = false;
+            using (Py.GIL())
+            {
+                using var tasks = Py.Import(TasksModuleName);
+                tasks.InvokeMethod("stop_loop").Dispose();
+            }
+        }
+    }
+}
@@ -629,7 +629,10 @@ namespace Python.Runtime
         /// </summary>
         static void InheritSubstructs(IntPtr type)
         {
-            IntPtr substructAddress = type + TypeOffset.nb_add;
+            IntPtr substructAddress = type + TypeOffset.am_await;
+            Marshal.WriteIntPtr(type, TypeOffset.tp_as_async, substructAddress);
+
+            substructAddress = type + TypeOffset.nb_add;
             Marshal.WriteIntPtr(type, TypeOffset.tp_as_number, substructAddress);
 
             substructAddress = type + TypeOffset.sq_length;
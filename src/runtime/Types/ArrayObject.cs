@@ -13,10 +13,25 @@ namespace Python.Runtime
     [Serializable]
     internal sealed class ArrayObject : ClassBase
     {
+        [NonSerialized]
+        private ElementAccessor? elementAccessor;
+        [NonSerialized]
+        private bool elementAccessorCreated;
+
         internal ArrayObject(Type tp) : base(tp)
         {
         }
 
+        ElementAccessor? GetElementAccessor(Array items)
+        {
+            if (!elementAccessorCreated)
+            {
+                elementAccessor = type.Valid ? ElementAccessor.TryCreate(type.Value) : null;
+                elementAccessorCreated = true;
+            }
+            return elementAccessor is not null && elementAccessor.CanAccess(items) ? elementAccessor : null;
+        }
+
         internal override bool CanSubclass()
         {
             return false;
@@ -156,6 +171,11 @@ namespace Python.Runtime
             long index;
             object value;
 
+            if (IsSliceIndex(items, idx))
+            {
+                return GetSlice(items, idx);
+            }
+
             // Note that CLR 1.0 only supports int indexes - methods to
             // support long indices were introduced in 1.1. We could
             // support long indices automatically, but given that long
@@ -189,6 +209,11 @@ namespace Python.Runtime
                     return default;
                 }
 
+                if (arrObj.GetElementAccessor(items) is { } accessor)
+                {
+                    return accessor.GetItem(items, index);
+                }
+
                 value = items.GetValue(index);
 
                 return Converter.ToPython(value, itemType);
@@ -248,6 +273,7 @@ namespace Python.Runtime
         public static int mp_ass_subscript(BorrowedReference ob, BorrowedReference idx, BorrowedReference v)
         {
             var obj = (CLRObject)GetManagedObject(ob)!;
+            var arrObj = (ArrayObject)GetManagedObject(Runtime.PyObject_TYPE(ob))!;
             var items = (Array)obj.inst;
             Type itemType = obj.inst.GetType().GetElementType();
             int rank = items.Rank;
@@ -259,7 +285,21 @@ namespace Python.Runtime
                 return -1;
             }
 
-            if (!Converter.ToManaged(v, itemType, out object? value, true))
+            if (v.IsNull)
+            {
+                Exceptions.RaiseTypeError("array does not support item deletion");
+                return -1;
+            }
+
+            if (IsSliceIndex(items, idx))
+            {
+                return SetSlice(items, idx, v);
+            }
+
+            // typed accessors convert the value themselves
+            ElementAccessor? accessor = rank == 1 ? arrObj.GetElementAccessor(items) : null;
+            object? value = null;
+            if (accessor is null && !Converter.ToManaged(v, itemType, out value, true))
             {
                 return -1;
             }
@@ -290,6 +330,11 @@ namespace Python.Runtime
                     return -1;
                 }
 
+                if (accessor is not null)
+                {
+                    return accessor.TrySetItem(items, index, v) ? 0 : -1;
+                }
+
                 items.SetValue(value, index);
                 return 0;
             }
@@ -346,6 +391,428 @@ namespace Python.Runtime
             return Exceptions.RaiseTypeError($"array index has type {tpName}, expected an integer");
         }
 
+        #region Slicing
+        /// <summary>
+        /// Array elements selected by an index containing slices. Elements are
+        /// addressed by their flat (row-major) indexes in the array.
+        /// </summary>
+        sealed class Selection
+        {
+            /// <summary>Flat index of the first selected element</summary>
+            public long Offset;
+            /// <summary>Lengths of the sliced dimensions</summary>
+            public long[] Lengths = null!;
+            /// <summary>Distances between flat indexes of consecutive elements along sliced dimensions</summary>
+            public long[] Strides = null!;
+
+            public long Count
+            {
+                get
+                {
+                    long count = 1;
+                    foreach (long length in Lengths) count *= length;
+                    return count;
+                }
+            }
+
+            /// <summary>
+            /// Checks if selected elements are adjacent in the array and in the same order.
+            /// </summary>
+            public bool IsContiguous
+            {
+                get
+                {
+                    long expected = 1;
+                    for (int dim = Lengths.Length - 1; dim >= 0; dim--)
+                    {
+                        if (Lengths[dim] > 1 && Strides[dim] != expected) return false;
+                        expected *= Lengths[dim];
+                    }
+                    return true;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Checks if the index selects multiple elements: contains slices, or has
+        /// fewer integers than the array has dimensions.
+        /// </summary>
+        static bool IsSliceIndex(Array items, BorrowedReference idx)
+        {
+            if (Runtime.PySlice_Check(idx)) return true;
+            if (!Runtime.PyTuple_Check(idx)) return items.Rank > 1 && Runtime.PyInt_Check(idx);
+
+            nint count = Runtime.PyTuple_Size(idx);
+            if (count < items.Rank) return true;
+            for (nint i = 0; i < count; i++)
+            {
+                if (Runtime.PySlice_Check(Runtime.PyTuple_GetItem(idx, i))) return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Resolves an index like <c>[1:5]</c>, <c>[::2, 3]</c>, <c>[1:, :-1]</c> or <c>[1]</c>
+        /// of a multidimensional array.
+        /// Dimensions indexed by integers are dropped from the selection, and missing
+        /// trailing indexes select entire dimensions.
+        /// </summary>
+        /// <returns><c>null</c> with Python error set, if the index is invalid</returns>
+        static Selection? GetSelection(Array items, BorrowedReference idx)
+        {
+            int rank = items.Rank;
+            bool isTuple = Runtime.PyTuple_Check(idx);
+            nint count = isTuple ? Runtime.PyTuple_Size(idx) : 1;
+            if (count > rank)
+            {
+                Exceptions.SetError(Exceptions.IndexError, "too many indices for array");
+                return null;
+            }
+
+            var arrayStrides = new long[rank];
+            long arrayStride = 1;
+            for (int dim = rank - 1; dim >= 0; dim--)
+            {
+                arrayStrides[dim] = arrayStride;
+                arrayStride *= items.GetLongLength(dim);
+            }
+
+            var lengths = new List<long>(rank);
+            var strides = new List<long>(rank);
+            long offset = 0;
+            for (int dim = 0; dim < rank; dim++)
+            {
+                long length = items.GetLongLength(dim);
+                BorrowedReference op = dim >= count ? BorrowedReference.Null
+                    : isTuple ? Runtime.PyTuple_GetItem(idx, dim) : idx;
+
+                if (op.IsNull || Runtime.PySlice_Check(op))
+                {
+                    nint start = 0, stop = (nint)length, step = 1;
+                    if (!op.IsNull && Runtime.PySlice_Unpack(op, out start, out stop, out step) < 0)
+                    {
+                        return null;
+                    }
+                    lengths.Add(Runtime.PySlice_AdjustIndices((nint)length, ref start, ref stop, step));
+                    strides.Add(step * arrayStrides[dim]);
+                    offset += start * arrayStrides[dim];
+                    continue;
+                }
+
+                if (!Runtime.PyInt_Check(op))
+                {
+                    RaiseIndexMustBeIntegerError(op);
+                    return null;
+                }
+                long index = Runtime.PyLong_AsSignedSize_t(op);
+
+                if (index == -1 && Exceptions.ErrorOccurred())
+                {
+                    Exceptions.RaiseTypeError("invalid index value");
+                    return null;
+                }
+
+                if (index < 0)
+                {
+                    index = length + index;
+                }
+
+                if (index < 0 || index >= length)
+                {
+                    Exceptions.SetError(Exceptions.IndexError, "array index out of range");
+                    return null;
+                }
+
+                offset += index * arrayStrides[dim];
+            }
+
+            return new Selection
+            {
+                Offset = offset,
+                Lengths = lengths.ToArray(),
+                Strides = strides.ToArray(),
+            };
+        }
+
+        /// <summary>
+        /// Implements slicing, e.g. <c>arr[1:-1]</c>, which returns a new array.
+        /// </summary>
+        static NewReference GetSlice(Array items, BorrowedReference idx)
+        {
+            Selection? selection = GetSelection(items, idx);
+            if (selection is null)
+            {
+                return default;
+            }
+
+            Array result = Array.CreateInstance(items.GetType().GetElementType(), selection.Lengths);
+            CopySelection(items, selection, result, toItems: false);
+            return CLRObject.GetReference(result);
+        }
+
+        /// <summary>
+        /// Implements slice assignment, e.g. <c>arr[1:-1] = values</c>. Values must have
+        /// the shape of the selection, so it never changes array size.
+        /// </summary>
+        static int SetSlice(Array items, BorrowedReference idx, BorrowedReference value)
+        {
+            Selection? selection = GetSelection(items, idx);
+            if (selection is null)
+            {
+                return -1;
+            }
+
+            Type elementType = items.GetType().GetElementType();
+            if (GetManagedObject(value) is CLRObject { inst: Array source }
+                && source.GetType().GetElementType() == elementType)
+            {
+                if (!HasShape(source, selection))
+                {
+                    return RaiseShapeMismatch(source, selection);
+                }
+                // the source may overlap the selection
+                if (ReferenceEquals(source, items))
+                {
+                    source = (Array)source.Clone();
+                }
+                CopySelection(items, selection, source, toItems: true);
+                return 0;
+            }
+
+            if (TryCopyFromBuffer(items, selection, value))
+            {
+                return 0;
+            }
+            if (Exceptions.ErrorOccurred())
+            {
+                return -1;
+            }
+
+            // e.g. lists or buffers with items of other types
+            if (!Converter.ToManaged(value, elementType.MakeArrayType(), out object? converted, true))
+            {
+                return -1;
+            }
+            var values = (Array)converted!;
+            if (!HasShape(values, selection))
+            {
+                return RaiseShapeMismatch(values, selection);
+            }
+            CopySelection(items, selection, values, toItems: true);
+            return 0;
+        }
+
+        /// <summary>
+        /// Copies a Python buffer with the shape of the selection and items of the array
+        /// element type to the selected elements. Contiguous buffers are copied at once
+        /// to contiguous selections.
+        /// </summary>
+        /// <returns><c>false</c> if the value is not a compatible buffer</returns>
+        static bool TryCopyFromBuffer(Array items, Selection selection, BorrowedReference value)
+        {
+            Type elementType = items.GetType().GetElementType();
+            if (!elementType.IsPrimitive || !PyBuffer.IsSupportedBy(value))
+            {
+                return false;
+            }
+
+            using var exporter = new PyObject(value);
+            PyBuffer buffer;
+            try
+            {
+                buffer = new PyBuffer(exporter, PyBUF.FORMATS | PyBUF.STRIDES);
+            }
+            catch (PythonException)
+            {
+                return false;
+            }
+
+            using (buffer)
+            {
+                long[] shape = buffer.Shape ?? new[] { buffer.Length / buffer.ItemSize };
+                if (!buffer.HasItemsOf(elementType) || !ShapeEquals(shape, selection.Lengths))
+                {
+                    return false;
+                }
+                if (selection.Count == 0)
+                {
+                    return true;
+                }
+
+                int itemSize = GetItemSize(elementType);
+                // the buffer may expose the array itself, e.g. arr[1:] = memoryview(arr)[:-1]
+                bool direct = selection.IsContiguous && !Overlaps(buffer, items, itemSize);
+                Array target = direct
+                    ? items
+                    : Array.CreateInstance(elementType, selection.Lengths);
+                long offset = direct ? selection.Offset : 0;
+                var pin = GCHandle.Alloc(target, GCHandleType.Pinned);
+                try
+                {
+                    buffer.ToContiguous(pin.AddrOfPinnedObject() + checked((int)(offset * itemSize)), BufferOrderStyle.C);
+                }
+                finally
+                {
+                    pin.Free();
+                }
+
+                if (target != items)
+                {
+                    CopySelection(items, selection, target, toItems: true);
+                }
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// Checks if the memory of the buffer items overlaps the elements of the array.
+        /// </summary>
+        static bool Overlaps(PyBuffer buffer, Array items, int itemSize)
+        {
+            long bufferStart = (long)buffer.Buffer;
+            long bufferEnd = bufferStart + buffer.ItemSize;
+            if (buffer.Shape is { } shape && buffer.Strides is { } strides)
+            {
+                for (int dim = 0; dim < shape.Length; dim++)
+                {
+                    long extent = (shape[dim] - 1) * strides[dim];
+                    if (extent < 0) bufferStart += extent;
+                    else bufferEnd += extent;
+                }
+            }
+            else
+            {
+                bufferEnd = bufferStart + buffer.Length;
+            }
+
+            var pin = GCHandle.Alloc(items, GCHandleType.Pinned);
+            try
+            {
+                long start = (long)pin.AddrOfPinnedObject();
+                long end = start + items.LongLength * itemSize;
+                return bufferStart < end && start < bufferEnd;
+            }
+            finally
+            {
+                pin.Free();
+            }
+        }
+
+        static bool HasShape(Array array, Selection selection)
+        {
+            if (array.Rank != selection.Lengths.Length) return false;
+            for (int dim = 0; dim < array.Rank; dim++)
+            {
+                if (array.GetLongLength(dim) != selection.Lengths[dim]) return false;
+            }
+            return true;
+        }
+
+        static bool ShapeEquals(long[] shape, long[] lengths)
+        {
+            if (shape.Length != lengths.Length) return false;
+            for (int dim = 0; dim < shape.Length; dim++)
+            {
+                if (shape[dim] != lengths[dim]) return false;
+            }
+            return true;
+        }
+
+        static int RaiseShapeMismatch(Array values, Selection selection)
+        {
+            var shape = new long[values.Rank];
+            for (int dim = 0; dim < shape.Length; dim++)
+            {
+                shape[dim] = values.GetLongLength(dim);
+            }
+            Exceptions.SetError(Exceptions.ValueError,
+                $"could not assign values of shape ({string.Join(", ", shape)}) "
+                + $"to slice of shape ({string.Join(", ", selection.Lengths)})");
+            return -1;
+        }
+
+        /// <summary>
+        /// Copies selected elements of <paramref name="items"/> to <paramref name="other"/>,
+        /// or back if <paramref name="toItems"/> is set. <paramref name="other"/> holds the
+        /// elements in row-major order. Runs of adjacent elements are copied at once.
+        /// </summary>
+        static void CopySelection(Array items, Selection selection, Array other, bool toItems)
+        {
+            long count = selection.Count;
+            if (count == 0) return;
+
+            int rank = selection.Lengths.Length;
+            int lastDim = rank - 1;
+            long runLength = 1;
+            if (selection.IsContiguous)
+            {
+                runLength = count;
+            }
+            else if (selection.Strides[lastDim] == 1)
+            {
+                runLength = selection.Lengths[lastDim];
+                lastDim--;
+            }
+
+            var position = new long[rank];
+            long index = selection.Offset;
+            for (long copied = 0; copied < count; copied += runLength)
+            {
+                if (toItems)
+                    CopyRange(other, copied, items, index, runLength);
+                else
+                    CopyRange(items, index, other, copied, runLength);
+
+                for (int dim = lastDim; dim >= 0; dim--)
+                {
+                    index += selection.Strides[dim];
+                    if (++position[dim] < selection.Lengths[dim]) break;
+
+                    index -= selection.Strides[dim] * selection.Lengths[dim];
+                    position[dim] = 0;
+                }
+            }
+        }
+
+        static void CopyRange(Array source, long sourceIndex, Array destination, long destinationIndex, long length)
+        {
+            if (source.Rank == destination.Rank)
+            {
+                // multidimensional arrays are copied as if they were flattened
+                Array.Copy(source, sourceIndex, destination, destinationIndex, length);
+                return;
+            }
+
+            Type elementType = source.GetType().GetElementType();
+            if (elementType.IsPrimitive)
+            {
+                int itemSize = GetItemSize(elementType);
+                Buffer.BlockCopy(source, checked((int)(sourceIndex * itemSize)),
+                                 destination, checked((int)(destinationIndex * itemSize)),
+                                 checked((int)(length * itemSize)));
+                return;
+            }
+
+            for (long i = 0; i < length; i++)
+            {
+                object? item = source.GetValue(ToIndices(source, sourceIndex + i));
+                destination.SetValue(item, ToIndices(destination, destinationIndex + i));
+            }
+        }
+
+        static long[] ToIndices(Array array, long flatIndex)
+        {
+            var indices = new long[array.Rank];
+            for (int dim = array.Rank - 1; dim >= 0; dim--)
+            {
+                long length = array.GetLongLength(dim);
+                indices[dim] = flatIndex % length;
+                flatIndex /= length;
+            }
+            return indices;
+        }
+        #endregion
+
         /// <summary>
         /// Implements __contains__ for array types.
         /// </summary>
@@ -369,74 +836,121 @@ namespace Python.Runtime
         }
 
         #region Buffer protocol
+        /// <summary>
+        /// Arrays with exported buffers. All exports of an array share a single
+        /// pinned handle and shape/strides, which are released with the last export.
+        /// </summary>
+        /// <remarks>Only accessed while holding the GIL.</remarks>
+        static readonly Dictionary<Array, ExportedArray> exportedArrays = new();
+
+        sealed class ExportedArray
+        {
+            public GCHandle Pin;
+            /// <summary>Shape of the array, followed by its C-contiguous strides</summary>
+            public IntPtr Layout;
+            public int Exports;
+        }
+
         static int GetBuffer(BorrowedReference obj, out Py_buffer buffer, PyBUF flags)
         {
             buffer = default;
 
-            if (flags == PyBUF.SIMPLE)
-            {
-                Exceptions.SetError(Exceptions.BufferError, "SIMPLE not implemented");
-                return -1;
-            }
-            if ((flags & PyBUF.F_CONTIGUOUS) == PyBUF.F_CONTIGUOUS)
+            var self = (Array)((CLRObject)GetManagedObject(obj)!).inst;
+            Type itemType = self.GetType().GetElementType();
+
+            // single dimensional arrays are both C and Fortran contiguous
+            if ((flags & PyBUF.F_CONTIGUOUS) == PyBUF.F_CONTIGUOUS && self.Rank > 1)
             {
                 Exceptions.SetError(Exceptions.BufferError, "only C-contiguous supported");
                 return -1;
             }
-            var self = (Array)((CLRObject)GetManagedObject(obj)!).inst;
-            Type itemType = self.GetType().GetElementType();
 
             bool formatRequested = (flags & PyBUF.FORMATS) != 0;
-            string? format = GetFormat(itemType);
-            if (formatRequested && format is null)
+            IntPtr format = GetFormat(itemType);
+            if (formatRequested && format == IntPtr.Zero)
             {
                 Exceptions.SetError(Exceptions.BufferError, "unsupported element type: " + itemType.Name);
                 return -1;
             }
-            GCHandle gcHandle;
-            try
-            {
-                gcHandle = GCHandle.Alloc(self, GCHandleType.Pinned);
-            }
-            catch (ArgumentException ex)
+
+            int itemSize = GetItemSize(itemType);
+            if (!exportedArrays.TryGetValue(self, out var exported))
             {
-                Exceptions.SetError(Exceptions.BufferError, ex.Message);
-                return -1;
+                GCHandle pin;
+                try
+                {
+                    pin = GCHandle.Alloc(self, GCHandleType.Pinned);
+                }
+                catch (ArgumentException ex)
+                {
+                    Exceptions.SetError(Exceptions.BufferError, ex.Message);
+                    return -1;
+                }
+
+                exported = new ExportedArray
+                {
+                    Pin = pin,
+                    Layout = AllocateLayout(self, itemSize),
+                };
+                exportedArrays.Add(self, exported);
             }
+            exported.Exports++;
 
-            int itemSize = Marshal.SizeOf(itemType);
-            IntPtr[] shape = GetShape(self);
-            IntPtr[] strides = GetStrides(shape, itemSize);
+            bool shapeRequested = (flags & PyBUF.ND) == PyBUF.ND;
             buffer = new Py_buffer
             {
-                buf = gcHandle.AddrOfPinnedObject(),
+                buf = exported.Pin.AddrOfPinnedObject(),
                 obj = new NewReference(obj).DangerousMoveToPointer(),
                 len = (IntPtr)(self.LongLength * itemSize),
                 itemsize = (IntPtr)itemSize,
                 _readonly = false,
-                ndim = self.Rank,
-                format = format,
-                shape = ToUnmanaged(shape),
-                strides = (flags & PyBUF.STRIDES) == PyBUF.STRIDES ? ToUnmanaged(strides) : IntPtr.Zero,
+                ndim = shapeRequested ? self.Rank : 1,
+                format = formatRequested ? format : IntPtr.Zero,
+                shape = shapeRequested ? exported.Layout : IntPtr.Zero,
+                strides = (flags & PyBUF.STRIDES) == PyBUF.STRIDES
+                    ? exported.Layout + self.Rank * IntPtr.Size
+                    : IntPtr.Zero,
                 suboffsets = IntPtr.Zero,
-                _internal = (IntPtr)gcHandle,
             };
 
             return 0;
         }
+
         static void ReleaseBuffer(BorrowedReference obj, ref Py_buffer buffer)
         {
-            if (buffer._internal == IntPtr.Zero) return;
+            // the reference to buffer.obj is released by PyBuffer_Release
+            var self = (Array)((CLRObject)GetManagedObject(obj)!).inst;
+            if (!exportedArrays.TryGetValue(self, out var exported))
+                return;
 
-            UnmanagedFree(ref buffer.shape);
-            UnmanagedFree(ref buffer.strides);
-            UnmanagedFree(ref buffer.suboffsets);
+            if (--exported.Exports > 0)
+                return;
 
-            // TODO: decref buffer.obj?
+            exportedArrays.Remove(self);
+            UnmanagedFree(ref exported.Layout);
+            exported.Pin.Free();
+        }
+
+        /// <summary>
+        /// Size of array items in memory. Unlike <see cref="Marshal.SizeOf(Type)"/>,
+        /// which returns the size of the unmanaged counterpart, accounts for 1 byte
+        /// <see cref="bool"/> and 2 byte <see cref="char"/>.
+        /// </summary>
+        static int GetItemSize(Type itemType) => Type.GetTypeCode(itemType) switch
+        {
+            TypeCode.Boolean => sizeof(bool),
+            TypeCode.Char => sizeof(char),
+            _ => Marshal.SizeOf(itemType),
+        };
 
-            var gcHandle = (GCHandle)buffer._internal;
-            gcHandle.Free();
-            buffer._internal = IntPtr.Zero;
+        static IntPtr AllocateLayout(Array array, int itemSize)
+        {
+            IntPtr[] shape = GetShape(array);
+            IntPtr[] strides = GetStrides(shape, itemSize);
+            IntPtr result = Marshal.AllocHGlobal(2 * shape.Length * IntPtr.Size);
+            Marshal.Copy(shape, 0, result, shape.Length);
+            Marshal.Copy(strides, 0, result + shape.Length * IntPtr.Size, strides.Length);
+            return result;
         }
 
         static IntPtr[] GetStrides(IntPtr[] shape, long itemSize)
@@ -465,17 +979,6 @@ namespace Python.Runtime
             Marshal.FreeHGlobal(address);
             address = IntPtr.Zero;
         }
-        static unsafe IntPtr ToUnmanaged<T>(T[] array) where T : unmanaged
-        {
-            IntPtr result = Marshal.AllocHGlobal(checked(Marshal.SizeOf(typeof(T)) * array.Length));
-            fixed (T* ptr = array)
-            {
-                var @out = (T*)result;
-                for (int i = 0; i < array.Length; i++)
-                    @out[i] = ptr[i];
-            }
-            return result;
-        }
 
         static readonly Dictionary<Type, string> ItemFormats = new()
         {
@@ -500,8 +1003,22 @@ namespace Python.Runtime
             [typeof(double)] = "d",
         };
 
-        static string? GetFormat(Type elementType)
-            => ItemFormats.TryGetValue(elementType, out string result) ? result : null;
+        /// <summary>
+        /// Native copies of <see cref="ItemFormats"/>, that stay valid while buffers are exported.
+        /// </summary>
+        static readonly Dictionary<Type, IntPtr> NativeItemFormats = AllocateNativeItemFormats();
+        static Dictionary<Type, IntPtr> AllocateNativeItemFormats()
+        {
+            var result = new Dictionary<Type, IntPtr>();
+            foreach (var itemFormat in ItemFormats)
+            {
+                result[itemFormat.Key] = Marshal.StringToHGlobalAnsi(itemFormat.Value);
+            }
+            return result;
+        }
+
+        static IntPtr GetFormat(Type elementType)
+            => NativeItemFormats.TryGetValue(elementType, out IntPtr result) ? result : IntPtr.Zero;
 
         static readonly GetBufferProc getBufferProc = GetBuffer;
         static readonly ReleaseBufferProc releaseBufferProc = ReleaseBuffer;
@@ -531,5 +1048,50 @@ namespace Python.Runtime
                 Util.WriteIntPtr(type, offset, BufferProcsAddress);
             }
         }
+
+        /// <summary>
+        /// Reads and writes elements of single dimensional arrays of primitive
+        /// types without boxing them.
+        /// </summary>
+        abstract class ElementAccessor
+        {
+            public abstract bool CanAccess(Array items);
+            public abstract NewReference GetItem(Array items, long index);
+            /// <summary>
+            /// Returns <c>false</c> and sets a Python error if the value can not be converted.
+            /// </summary>
+            public abstract bool TrySetItem(Array items, long index, BorrowedReference value);
+
+            public static ElementAccessor? TryCreate(Type arrayType)
+            {
+                Type elementType = arrayType.GetElementType();
+                // multidimensional and non-zero based arrays can not be cast to T[]
+                if (!elementType.IsPrimitive || arrayType != elementType.MakeArrayType())
+                {
+                    return null;
+                }
+                var accessorType = typeof(ElementAccessor<>).MakeGenericType(elementType);
+                return (ElementAccessor)Activator.CreateInstance(accessorType);
+            }
+        }
+
+        sealed class ElementAccessor<T> : ElementAccessor
+        {
+            // the CLR allows casting e.g. uint[] to int[], so check the exact type
+            public override bool CanAccess(Array items) => items.GetType() == typeof(T[]);
+
+            public override NewReference GetItem(Array items, long index)
+                => Converter.ToPython(((T[])items)[index]);
+
+            public override bool TrySetItem(Array items, long index, BorrowedReference value)
+            {
+                if (!Converter.TryToManaged(value, out T converted, setError: true))
+                {
+                    return false;
+                }
+                ((T[])items)[index] = converted;
+                return true;
+            }
+        }
     }
 }
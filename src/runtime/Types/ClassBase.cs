@@ -219,37 +219,13 @@ namespace Python.Runtime
                 return Exceptions.RaiseTypeError("invalid object");
             }
 
-            IEnumerator? o;
-            if (co.inst is IEnumerable e)
+            var iterator = Iterator.Create(co.inst);
+            if (iterator is null)
             {
-                o = e.GetEnumerator();
-            }
-            else
-            {
-                o = co.inst as IEnumerator;
-
-                if (o == null)
-                {
-                    return Exceptions.RaiseTypeError("iteration over non-sequence");
-                }
-            }
-
-            var elemType = typeof(object);
-            var iterType = co.inst.GetType();
-            foreach (var ifc in iterType.GetInterfaces())
-            {
-                if (ifc.IsGenericType)
-                {
-                    var genTypeDef = ifc.GetGenericTypeDefinition();
-                    if (genTypeDef == typeof(IEnumerable<>) || genTypeDef == typeof(IEnumerator<>))
-                    {
-                        elemType = ifc.GetGenericArguments()[0];
-                        break;
-                    }
-                }
+                return Exceptions.RaiseTypeError("iteration over non-sequence");
             }
 
-            return new Iterator(o, elemType).Alloc();
+            return iterator.Alloc();
         }
 
 
@@ -2,6 +2,7 @@ using System;
 using System.Linq;
 using System.IO;
 using System.Reflection;
+using System.Threading.Tasks;
 
 namespace Python.Runtime
 {
@@ -194,5 +195,19 @@ namespace Python.Runtime
         [ModuleFunction]
         [ForbidPythonThreads]
         public static int _add_pending_namespaces() => ImportHook.AddPendingNamespaces();
+
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static void _add_task_callback(Task task, PyObject callback)
+            => TaskBridge.AddCompletionCallback(task, callback);
+
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static object? _get_task_result(Task task) => TaskBridge.GetResult(task);
+
+        [ModuleFunction]
+        [ForbidPythonThreads]
+        public static void _complete_task(TaskCompletionSource<PyObject> completion, PyObject future)
+            => TaskBridge.Complete(completion, future);
     }
 }
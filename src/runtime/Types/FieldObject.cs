@@ -11,12 +11,30 @@ namespace Python.Runtime
     internal class FieldObject : ExtensionType
     {
         private MaybeFieldInfo info;
+        [NonSerialized]
+        private MemberAccessor? accessor;
+        [NonSerialized]
+        private int accesses;
 
         public FieldObject(FieldInfo info)
         {
             this.info = new MaybeFieldInfo(info);
         }
 
+        /// <summary>
+        /// Returns the compiled accessor, once the field was accessed
+        /// often enough to make compiling it worthwhile.
+        /// </summary>
+        MemberAccessor? GetAccessor()
+        {
+            if (accessor is null && accesses <= MethodInvoker.CompilationThreshold
+                && ++accesses == MethodInvoker.CompilationThreshold)
+            {
+                accessor = MemberAccessor.TryCreate(info.Value);
+            }
+            return accessor;
+        }
+
         /// <summary>
         /// Descriptor __get__ implementation. This method returns the
         /// value of the field on the given object. The returned value
@@ -50,6 +68,10 @@ namespace Python.Runtime
                 }
                 try
                 {
+                    if (self.GetAccessor() is { } staticAccessor)
+                    {
+                        return staticAccessor.GetPython(null);
+                    }
                     result = info.GetValue(null);
                     return Converter.ToPython(result, info.FieldType);
                 }
@@ -68,6 +90,10 @@ namespace Python.Runtime
                     Exceptions.SetError(Exceptions.TypeError, "instance is not a clr object");
                     return default;
                 }
+                if (self.GetAccessor() is { } accessor && accessor.IsValidTarget(co.inst))
+                {
+                    return accessor.GetPython(co.inst);
+                }
                 result = info.GetValue(co.inst);
                 return Converter.ToPython(result, info.FieldType);
             }
@@ -112,6 +138,7 @@ namespace Python.Runtime
             }
 
             bool is_static = info.IsStatic;
+            object? target = null;
 
             if (ob == null || ob == Runtime.PyNone)
             {
@@ -121,28 +148,30 @@ namespace Python.Runtime
                     return -1;
                 }
             }
-
-            if (!Converter.ToManaged(val, info.FieldType, out var newval, true))
+            else if (!is_static)
             {
-                return -1;
+                var co = (CLRObject?)GetManagedObject(ob);
+                if (co == null)
+                {
+                    Exceptions.SetError(Exceptions.TypeError, "instance is not a clr object");
+                    return -1;
+                }
+                target = co.inst;
             }
 
             try
             {
-                if (!is_static)
+                if (self.GetAccessor() is { CanWrite: true } accessor && accessor.IsValidTarget(target))
                 {
-                    var co = (CLRObject?)GetManagedObject(ob);
-                    if (co == null)
-                    {
-                        Exceptions.SetError(Exceptions.TypeError, "instance is not a clr object");
-                        return -1;
-                    }
-                    info.SetValue(co.inst, newval);
+                    return accessor.TrySetPython(target, val) ? 0 : -1;
                 }
-                else
+
+                if (!Converter.ToManaged(val, info.FieldType, out var newval, true))
                 {
-                    info.SetValue(null, newval);
+                    return -1;
                 }
+
+                info.SetValue(is_static ? null : target, newval);
                 return 0;
             }
             catch (Exception e)
@@ -1,5 +1,8 @@
 using System;
 using System.Collections;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Reflection;
 
 namespace Python.Runtime
 {
@@ -7,17 +10,38 @@ namespace Python.Runtime
     /// Implements a generic Python iterator for IEnumerable objects and
     /// managed array objects. This supports 'for i in object:' in Python.
     /// </summary>
+    /// <remarks>
+    /// Items of arrays, <see cref="List{T}"/> and other <see cref="IEnumerable{T}"/>
+    /// are read and converted without boxing them.
+    /// </remarks>
     internal class Iterator : ExtensionType
     {
-        private readonly IEnumerator iter;
-        private readonly Type elemType;
+        delegate ItemReader ReaderFactory(object collection);
 
-        public Iterator(IEnumerator e, Type elemType)
+        static readonly ConcurrentDictionary<Type, ReaderFactory> readerFactories = new();
+        static readonly Func<Type, ReaderFactory> createReaderFactory = CreateReaderFactory;
+
+        private readonly ItemReader reader;
+
+        private Iterator(ItemReader reader)
         {
-            iter = e;
-            this.elemType = elemType;
+            this.reader = reader;
         }
 
+        /// <summary>
+        /// Creates a Python iterator over an <see cref="IEnumerable"/> or
+        /// <see cref="IEnumerator"/>. Returns <c>null</c> if <paramref name="collection"/> is neither.
+        /// </summary>
+        internal static Iterator? Create(object collection)
+        {
+            if (collection is not IEnumerable and not IEnumerator)
+            {
+                return null;
+            }
+
+            var factory = readerFactories.GetOrAdd(collection.GetType(), createReaderFactory);
+            return new Iterator(factory(collection));
+        }
 
         /// <summary>
         /// Implements support for the Python iteration protocol.
@@ -27,11 +51,8 @@ namespace Python.Runtime
             var self = (Iterator)GetManagedObject(ob)!;
             try
             {
-                if (!self.iter.MoveNext())
-                {
-                    Exceptions.SetError(Exceptions.StopIteration, Runtime.PyNone);
-                    return default;
-                }
+                // NULL without an exception set ends the iteration
+                return self.reader.Next();
             }
             catch (Exception e)
             {
@@ -42,10 +63,156 @@ namespace Python.Runtime
                 Exceptions.SetError(e);
                 return default;
             }
-            object item = self.iter.Current;
-            return Converter.ToPython(item, self.elemType);
         }
 
         public static NewReference tp_iter(BorrowedReference ob) => new (ob);
+
+        static ReaderFactory CreateReaderFactory(Type type)
+        {
+            Type elemType = GetElementType(type) ?? typeof(object);
+            string? factoryName = null;
+            // references are not boxed, and in shared generic code for reference
+            // types the checks in Converter.ToPython<T> are not eliminated
+            if (elemType.IsValueType)
+            {
+                bool isEnumerable = typeof(IEnumerable).IsAssignableFrom(type);
+                if (type == elemType.MakeArrayType())
+                {
+                    factoryName = nameof(CreateArrayReader);
+                }
+                else if (type == typeof(List<>).MakeGenericType(elemType))
+                {
+                    factoryName = nameof(CreateListReader);
+                }
+                else if (GetElementType(type, isEnumerable ? typeof(IEnumerable<>) : typeof(IEnumerator<>)) == elemType)
+                {
+                    factoryName = isEnumerable ? nameof(CreateEnumerableReader) : nameof(CreateEnumeratorReader);
+                }
+            }
+
+            if (factoryName is null)
+            {
+                return collection => new ObjectReader(GetEnumerator(collection), elemType);
+            }
+
+            MethodInfo create = typeof(Iterator)
+                .GetMethod(factoryName, BindingFlags.NonPublic | BindingFlags.Static)
+                .MakeGenericMethod(elemType);
+            return (ReaderFactory)Delegate.CreateDelegate(typeof(ReaderFactory), create);
+        }
+
+        /// <summary>
+        /// Returns T of the only <paramref name="genericInterface"/>&lt;T&gt;
+        /// implemented by <paramref name="type"/>.
+        /// </summary>
+        static Type? GetElementType(Type type, Type genericInterface)
+        {
+            Type? elemType = null;
+            foreach (var ifc in type.GetInterfaces())
+            {
+                if (ifc.IsGenericType && ifc.GetGenericTypeDefinition() == genericInterface)
+                {
+                    if (elemType is not null) return null;
+                    elemType = ifc.GetGenericArguments()[0];
+                }
+            }
+            return elemType;
+        }
+
+        static Type? GetElementType(Type type)
+        {
+            foreach (var ifc in type.GetInterfaces())
+            {
+                if (ifc.IsGenericType)
+                {
+                    var genTypeDef = ifc.GetGenericTypeDefinition();
+                    if (genTypeDef == typeof(IEnumerable<>) || genTypeDef == typeof(IEnumerator<>))
+                    {
+                        return ifc.GetGenericArguments()[0];
+                    }
+                }
+            }
+            return null;
+        }
+
+        static IEnumerator GetEnumerator(object collection)
+            => collection is IEnumerable enumerable ? enumerable.GetEnumerator() : (IEnumerator)collection;
+
+        static ItemReader CreateArrayReader<T>(object collection) => new ArrayReader<T>((T[])collection);
+        static ItemReader CreateListReader<T>(object collection) => new ListReader<T>((List<T>)collection);
+        static ItemReader CreateEnumerableReader<T>(object collection)
+            => new EnumeratorReader<T>(((IEnumerable<T>)collection).GetEnumerator());
+        static ItemReader CreateEnumeratorReader<T>(object collection)
+            => new EnumeratorReader<T>((IEnumerator<T>)collection);
+
+        /// <summary>
+        /// Reads the items of a collection, and converts them to Python.
+        /// </summary>
+        [Serializable]
+        abstract class ItemReader
+        {
+            /// <summary>
+            /// Returns the next item, or <c>null</c> with no Python error set
+            /// after the last one.
+            /// </summary>
+            public abstract NewReference Next();
+        }
+
+        /// <summary>
+        /// Indexes one-dimensional zero-based arrays directly.
+        /// </summary>
+        [Serializable]
+        sealed class ArrayReader<T> : ItemReader
+        {
+            private readonly T[] array;
+            private int index;
+
+            public ArrayReader(T[] array) => this.array = array;
+
+            public override NewReference Next()
+                => index < array.Length ? Converter.ToPython(array[index++]) : default;
+        }
+
+        /// <summary>
+        /// Uses the struct enumerator of <see cref="List{T}"/>, that, unlike
+        /// indexing, still fails if the list is modified during the iteration.
+        /// </summary>
+        [Serializable]
+        sealed class ListReader<T> : ItemReader
+        {
+            private List<T>.Enumerator enumerator;
+
+            public ListReader(List<T> list) => enumerator = list.GetEnumerator();
+
+            public override NewReference Next()
+                => enumerator.MoveNext() ? Converter.ToPython(enumerator.Current) : default;
+        }
+
+        [Serializable]
+        sealed class EnumeratorReader<T> : ItemReader
+        {
+            private readonly IEnumerator<T> enumerator;
+
+            public EnumeratorReader(IEnumerator<T> enumerator) => this.enumerator = enumerator;
+
+            public override NewReference Next()
+                => enumerator.MoveNext() ? Converter.ToPython(enumerator.Current) : default;
+        }
+
+        [Serializable]
+        sealed class ObjectReader : ItemReader
+        {
+            private readonly IEnumerator enumerator;
+            private readonly Type elemType;
+
+            public ObjectReader(IEnumerator enumerator, Type elemType)
+            {
+                this.enumerator = enumerator;
+                this.elemType = elemType;
+            }
+
+            public override NewReference Next()
+                => enumerator.MoveNext() ? Converter.ToPython(enumerator.Current, elemType) : default;
+        }
     }
 }
@@ -0,0 +1,140 @@
+using System;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Placeholder for a member of a reflected class, that creates the actual
+    /// member descriptor (e.g. <see cref="MethodObject"/>) on first access and
+    /// replaces itself in the class <c>__dict__</c> with it.
+    /// Used when <see cref="InteropConfiguration.LazyClassMembers"/> is enabled.
+    /// </summary>
+    [Serializable]
+    internal class LazyMemberObject : ExtensionType
+    {
+        readonly MaybeType type;
+        readonly string name;
+        // not preserved across domain reloads, which re-initialize classes
+        [NonSerialized]
+        Func<ExtensionType>? create;
+        [NonSerialized]
+        PyObject? member;
+
+        protected LazyMemberObject(MaybeType type, string name, Func<ExtensionType> create)
+        {
+            this.type = type;
+            this.name = name;
+            this.create = create;
+        }
+
+        /// <summary>
+        /// Creates a placeholder with the same descriptor kind (data or non-data)
+        /// as the member it stands for.
+        /// </summary>
+        internal static LazyMemberObject Create(Type type, string name, Func<ExtensionType> create, bool isDataDescriptor)
+            => isDataDescriptor
+                ? new LazyDataMemberObject(type, name, create)
+                : new LazyMemberObject(type, name, create);
+
+        /// <summary>
+        /// Returns the actual member, creating it and storing it in the class
+        /// <c>__dict__</c> in place of <paramref name="placeholder"/>, if needed.
+        /// </summary>
+        BorrowedReference GetMember(BorrowedReference placeholder)
+        {
+            if (member is not null)
+            {
+                return member.Reference;
+            }
+
+            if (create is null || !type.Valid)
+            {
+                Exceptions.SetError(Exceptions.AttributeError,
+                    type.Valid ? $"member '{name}' is no longer available" : type.DeletedMessage);
+                return default;
+            }
+
+            member = create().AllocObject();
+            create = null;
+
+            if (ClassManager.cache.TryGetValue(type, out var pyType))
+            {
+                using var dict = Runtime.PyObject_GenericGetDict(pyType.Reference);
+                if (Runtime.PyDict_GetItemString(dict.Borrow(), name) == placeholder)
+                {
+                    if (Runtime.PyDict_SetItemString(dict.Borrow(), name, member.Reference) != 0)
+                    {
+                        return default;
+                    }
+                    // invalidate the attribute cache of the type and its subclasses
+                    Runtime.PyType_Modified(pyType.Reference);
+                }
+            }
+            return member.Reference;
+        }
+
+        /// <summary>
+        /// Descriptor __get__ implementation, that forwards to the actual member.
+        /// </summary>
+        public static unsafe NewReference tp_descr_get(BorrowedReference ds, BorrowedReference ob, BorrowedReference tp)
+        {
+            var self = (LazyMemberObject)GetManagedObject(ds)!;
+            BorrowedReference member = self.GetMember(ds);
+            if (member.IsNull)
+            {
+                return default;
+            }
+
+            IntPtr get = Util.ReadIntPtr(Runtime.PyObject_TYPE(member), TypeOffset.tp_descr_get);
+            if (get == IntPtr.Zero)
+            {
+                return new NewReference(member);
+            }
+            return ((delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, NewReference>)get)
+                (member, ob, tp);
+        }
+
+        /// <summary>
+        /// Descriptor __set__ implementation, that forwards to the actual member.
+        /// </summary>
+        protected static unsafe int SetMember(BorrowedReference ds, BorrowedReference ob, BorrowedReference val)
+        {
+            var self = (LazyMemberObject)GetManagedObject(ds)!;
+            BorrowedReference member = self.GetMember(ds);
+            if (member.IsNull)
+            {
+                return -1;
+            }
+
+            IntPtr set = Util.ReadIntPtr(Runtime.PyObject_TYPE(member), TypeOffset.tp_descr_set);
+            if (set == IntPtr.Zero)
+            {
+                Exceptions.SetError(Exceptions.AttributeError, $"attribute '{self.name}' is read-only");
+                return -1;
+            }
+            return ((delegate* unmanaged[Cdecl]<BorrowedReference, BorrowedReference, BorrowedReference, int>)set)
+                (member, ob, val);
+        }
+
+        public static NewReference tp_repr(BorrowedReference ob)
+        {
+            var self = (LazyMemberObject)GetManagedObject(ob)!;
+            return Runtime.PyString_FromString($"<lazy member '{self.name}'>");
+        }
+    }
+
+    /// <summary>
+    /// <see cref="LazyMemberObject"/> for properties, fields and events,
+    /// which take precedence over instance attributes.
+    /// </summary>
+    [Serializable]
+    internal class LazyDataMemberObject : LazyMemberObject
+    {
+        internal LazyDataMemberObject(MaybeType type, string name, Func<ExtensionType> create)
+            : base(type, name, create)
+        {
+        }
+
+        public static int tp_descr_set(BorrowedReference ds, BorrowedReference ob, BorrowedReference val)
+            => SetMember(ds, ob, val);
+    }
+}
@@ -14,6 +14,9 @@ namespace Python.Runtime
     internal class ModuleObject : ExtensionType
     {
         private readonly Dictionary<string, PyObject> cache = new();
+        // names, that were not found as of AssemblyManager.Generation == missingGeneration
+        private readonly HashSet<string> missing = new();
+        private int missingGeneration;
 
         internal string moduleName;
         internal PyDict dict;
@@ -95,7 +98,19 @@ namespace Python.Runtime
                 return new NewReference(cached);
             }
 
-            Type type;
+            // scanning pending assemblies may advance the generation
+            AssemblyManager.ScanPendingAssemblies();
+            if (missingGeneration != AssemblyManager.Generation)
+            {
+                missing.Clear();
+                missingGeneration = AssemblyManager.Generation;
+            }
+            else if (missing.Contains(name))
+            {
+                return default;
+            }
+
+            Type? type;
 
             //if (AssemblyManager.IsValidNamespace(name))
             //{
@@ -124,7 +139,7 @@ namespace Python.Runtime
             // Look for a type in the current namespace. Note that this
             // includes types, delegates, enums, interfaces and structs.
             // Only public namespace members are exposed to Python.
-            type = AssemblyManager.LookupTypes(qname).FirstOrDefault(t => t.IsPublic);
+            type = AssemblyManager.LookupPublicType(qname, out bool cacheable);
             if (type != null)
             {
                 var c = ClassManager.GetClass(type);
@@ -151,6 +166,11 @@ namespace Python.Runtime
                         return o;
                     }
                 }
+
+                if (cacheable)
+                {
+                    missing.Add(name);
+                }
             }
 
             return default;
@@ -394,6 +414,7 @@ namespace Python.Runtime
             }
 
             cache.Clear();
+            missing.Clear();
             return context;
         }
 
@@ -16,6 +16,12 @@ namespace Python.Runtime
         private MethodInfo? getter;
         [NonSerialized]
         private MethodInfo? setter;
+        [NonSerialized]
+        private MemberAccessor? accessor;
+        [NonSerialized]
+        private int accesses;
+        [NonSerialized]
+        private bool releaseGIL;
 
         public PropertyObject(PropertyInfo md)
         {
@@ -28,6 +34,49 @@ namespace Python.Runtime
             PropertyInfo md = info.Value;
             getter = md.GetGetMethod(true) ?? md.GetBaseGetMethod(true);
             setter = md.GetSetMethod(true) ?? md.GetBaseSetMethod(true);
+            releaseGIL = ReleasesGIL(md);
+        }
+
+        /// <summary>
+        /// Checks if the GIL should be released while the property is accessed
+        /// (see <see cref="ReleaseGILAttribute"/>).
+        /// </summary>
+        static bool ReleasesGIL(PropertyInfo property)
+        {
+            Type? declaringType = property.DeclaringType;
+            if (property.IsDefined(typeof(ReleaseGILAttribute), inherit: false)
+                || declaringType is not null && declaringType.IsDefined(typeof(ReleaseGILAttribute), inherit: false))
+            {
+                return true;
+            }
+
+            Type? definition = declaringType is { IsGenericType: true } ? declaringType.GetGenericTypeDefinition() : null;
+            foreach (MemberInfo member in PythonEngine.InteropConfiguration.ReleaseGILMembers)
+            {
+                bool matches = member is Type type
+                    ? type == declaringType || type == definition
+                    // also matches the same property of other constructed generic types
+                    : member.MetadataToken == property.MetadataToken && member.Module == property.Module;
+                if (matches)
+                {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Returns the compiled accessor, once the property was accessed
+        /// often enough to make compiling it worthwhile.
+        /// </summary>
+        MemberAccessor? GetAccessor()
+        {
+            if (accessor is null && accesses <= MethodInvoker.CompilationThreshold
+                && ++accesses == MethodInvoker.CompilationThreshold)
+            {
+                accessor = MemberAccessor.TryCreate(info.Value, getter, setter);
+            }
+            return accessor;
         }
 
 
@@ -62,6 +111,14 @@ namespace Python.Runtime
 
                 try
                 {
+                    if (self.releaseGIL)
+                    {
+                        return MethodInvoker.InvokeToPython(getter, null, Array.Empty<object?>(), allowThreads: true);
+                    }
+                    if (self.GetAccessor() is { CanRead: true } staticAccessor)
+                    {
+                        return staticAccessor.GetPython(null);
+                    }
                     result = info.GetValue(null, null);
                     return Converter.ToPython(result, info.PropertyType);
                 }
@@ -79,12 +136,20 @@ namespace Python.Runtime
 
             try
             {
+                if (self.releaseGIL)
+                {
+                    return MethodInvoker.InvokeToPython(getter, co.inst, Array.Empty<object?>(), allowThreads: true);
+                }
+                if (self.GetAccessor() is { CanRead: true } accessor && accessor.IsValidTarget(co.inst))
+                {
+                    return accessor.GetPython(co.inst);
+                }
                 result = getter.Invoke(co.inst, Array.Empty<object>());
                 return Converter.ToPython(result, info.PropertyType);
             }
             catch (Exception e)
             {
-                if (e.InnerException != null)
+                if (e is TargetInvocationException && e.InnerException != null)
                 {
                     e = e.InnerException;
                 }
@@ -124,12 +189,8 @@ namespace Python.Runtime
             }
 
 
-            if (!Converter.ToManaged(val, info.PropertyType, out var newval, true))
-            {
-                return -1;
-            }
-
             bool is_static = setter.IsStatic;
+            object? target = null;
 
             if (ob == null || ob == Runtime.PyNone)
             {
@@ -139,18 +200,45 @@ namespace Python.Runtime
                     return -1;
                 }
             }
+            else if (!is_static)
+            {
+                var co = GetManagedObject(ob) as CLRObject;
+                if (co == null)
+                {
+                    Exceptions.RaiseTypeError("invalid target");
+                    return -1;
+                }
+                target = co.inst;
+            }
 
             try
             {
-                if (!is_static)
+                if (!self.releaseGIL
+                    && self.GetAccessor() is { CanWrite: true } accessor && accessor.IsValidTarget(target))
+                {
+                    return accessor.TrySetPython(target, val) ? 0 : -1;
+                }
+
+                if (!Converter.ToManaged(val, info.PropertyType, out var newval, true))
+                {
+                    return -1;
+                }
+
+                if (self.releaseGIL)
                 {
-                    var co = GetManagedObject(ob) as CLRObject;
-                    if (co == null)
+                    IntPtr ts = PythonEngine.BeginAllowThreads();
+                    try
+                    {
+                        MethodInvoker.Invoke(setter, target, new object?[] { newval });
+                    }
+                    finally
                     {
-                        Exceptions.RaiseTypeError("invalid target");
-                        return -1;
+                        PythonEngine.EndAllowThreads(ts);
                     }
-                    setter.Invoke(co.inst, new object?[] { newval });
+                }
+                else if (!is_static)
+                {
+                    setter.Invoke(target, new object?[] { newval });
                 }
                 else
                 {
@@ -160,7 +248,7 @@ namespace Python.Runtime
             }
             catch (Exception e)
             {
-                if (e.InnerException != null)
+                if (e is TargetInvocationException && e.InnerException != null)
                 {
                     e = e.InnerException;
                 }
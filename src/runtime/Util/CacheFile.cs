@@ -0,0 +1,85 @@
+using System;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using System.Text;
+
+namespace Python.Runtime
+{
+    /// <summary>
+    /// Reads and writes binary files, that cache reflection results between
+    /// processes. Files start with a magic string, a format version and the
+    /// full name of Python.Runtime, and are ignored when any of them differ.
+    /// </summary>
+    internal static class CacheFile
+    {
+        /// <summary>
+        /// Reads the cache file at <paramref name="path"/> with <paramref name="read"/>.
+        /// Returns <c>false</c>, if the file is missing, outdated or corrupted.
+        /// </summary>
+        public static bool TryRead(string path, string magic, int formatVersion, Action<BinaryReader> read)
+        {
+            try
+            {
+                if (!File.Exists(path)) return false;
+
+                using var reader = new BinaryReader(File.OpenRead(path));
+                byte[] expectedMagic = Encoding.ASCII.GetBytes(magic);
+                if (!reader.ReadBytes(expectedMagic.Length).SequenceEqual(expectedMagic)
+                    || reader.ReadInt32() != formatVersion
+                    || reader.ReadString() != typeof(CacheFile).Assembly.FullName)
+                {
+                    return false;
+                }
+
+                read(reader);
+                return true;
+            }
+            catch (Exception e)
+            {
+                // a corrupted cache must not prevent initialization
+                Debug.WriteLine("Error reading cache {0}. {1}", path, e);
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// Atomically replaces the cache file at <paramref name="path"/> with
+        /// the contents produced by <paramref name="write"/>.
+        /// </summary>
+        public static bool TryWrite(string path, string magic, int formatVersion, Action<BinaryWriter> write)
+        {
+            string tempPath = path + "." + Guid.NewGuid().ToString("N") + ".tmp";
+            try
+            {
+                string? directory = Path.GetDirectoryName(Path.GetFullPath(path));
+                if (directory is not null) Directory.CreateDirectory(directory);
+
+                using (var writer = new BinaryWriter(File.Create(tempPath)))
+                {
+                    writer.Write(Encoding.ASCII.GetBytes(magic));
+                    writer.Write(formatVersion);
+                    writer.Write(typeof(CacheFile).Assembly.FullName);
+                    write(writer);
+                }
+                // other processes may be reading or writing the same cache, so
+                // the file is never deleted, and readers see the old or the new one
+                if (File.Exists(path))
+                {
+                    File.Replace(tempPath, path, destinationBackupFileName: null);
+                }
+                else
+                {
+                    File.Move(tempPath, path);
+                }
+                return true;
+            }
+            catch (Exception e) when (e is IOException or UnauthorizedAccessException)
+            {
+                Debug.WriteLine("Error writing cache {0}. {1}", path, e);
+                try { File.Delete(tempPath); } catch (IOException) { } catch (UnauthorizedAccessException) { }
+                return false;
+            }
+        }
+    }
+}
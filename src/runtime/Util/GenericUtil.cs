@@ -1,5 +1,6 @@
 using System.Linq;
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Resources;
 
@@ -8,17 +9,19 @@ namespace Python.Runtime
     /// <summary>
     /// This class is responsible for efficiently maintaining the bits
     /// of information we need to support aliases with 'nice names'.
+    /// Types may be registered from multiple threads, as assemblies get loaded.
     /// </summary>
     internal static class GenericUtil
     {
         /// <summary>
-        /// Maps namespace -> generic base name -> list of generic type names
+        /// Maps namespace -> generic base name -> list of generic type names.
+        /// Lists are locked while being accessed.
         /// </summary>
-        private static Dictionary<string, Dictionary<string, List<string>>> mapping = new();
+        private static ConcurrentDictionary<string, ConcurrentDictionary<string, List<string>>> mapping = new();
 
         public static void Reset()
         {
-            mapping = new Dictionary<string, Dictionary<string, List<string>>>();
+            mapping = new ConcurrentDictionary<string, ConcurrentDictionary<string, List<string>>>();
         }
 
         /// <summary>
@@ -32,18 +35,20 @@ namespace Python.Runtime
                 return;
             }
 
-            if (!mapping.TryGetValue(t.Namespace, out var nsmap))
-            {
-                nsmap = new Dictionary<string, List<string>>();
-                mapping[t.Namespace] = nsmap;
-            }
-            string basename = GetBasename(t.Name);
-            if (!nsmap.TryGetValue(basename, out var gnames))
+            Register(t.Namespace, t.Name);
+        }
+
+        /// <summary>
+        /// Register a generic type definition by its namespace and name (e.g. <c>List`1</c>).
+        /// </summary>
+        internal static void Register(string ns, string name)
+        {
+            var nsmap = mapping.GetOrAdd(ns, _ => new ConcurrentDictionary<string, List<string>>());
+            var gnames = nsmap.GetOrAdd(GetBasename(name), _ => new List<string>());
+            lock (gnames)
             {
-                gnames = new List<string>();
-                nsmap[basename] = gnames;
+                gnames.Add(name);
             }
-            gnames.Add(t.Name);
         }
 
         /// <summary>
@@ -71,10 +76,16 @@ namespace Python.Runtime
         /// </summary>
         public static Type? GenericByName(string ns, string basename, int paramCount)
         {
+            AssemblyManager.ScanPendingAssemblies();
             if (mapping.TryGetValue(ns, out var nsmap))
             {
-                if (nsmap.TryGetValue(GetBasename(basename), out var names))
+                if (nsmap.TryGetValue(GetBasename(basename), out var gnames))
                 {
+                    string[] names;
+                    lock (gnames)
+                    {
+                        names = gnames.ToArray();
+                    }
                     foreach (string name in names)
                     {
                         string qname = $"{ns}.{name}";
@@ -96,10 +107,15 @@ namespace Python.Runtime
         {
             if (mapping.TryGetValue(ns, out var nsmap))
             {
-                nsmap.TryGetValue(name, out var gnames);
-                if (gnames?.Count > 0)
+                if (nsmap.TryGetValue(name, out var gnames))
                 {
-                    return gnames[0];
+                    lock (gnames)
+                    {
+                        if (gnames.Count > 0)
+                        {
+                            return gnames[0];
+                        }
+                    }
                 }
             }
             return null;
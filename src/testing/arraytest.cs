@@ -1,3 +1,5 @@
+using System;
+
 namespace Python.Test
 {
     /// <summary>
@@ -326,4 +328,49 @@ namespace Python.Test
         public float X { get; set; }
         public float Y { get; set; }
     }
+
+    public class SpanTest
+    {
+        public int this[ReadOnlySpan<byte> values] => values.Length;
+
+        public static double Sum(ReadOnlySpan<double> values)
+        {
+            double sum = 0;
+            foreach (double value in values)
+            {
+                sum += value;
+            }
+            return sum;
+        }
+
+        public static void Fill(Span<int> values, int value)
+        {
+            values.Fill(value);
+        }
+
+        public static int GetLength(Memory<byte> memory)
+        {
+            return memory.Length;
+        }
+
+        public static byte First(ReadOnlyMemory<byte> memory)
+        {
+            return memory.Span[0];
+        }
+
+        public static void Clear(Span<byte> values)
+        {
+            values.Clear();
+        }
+
+        public static int Count(ReadOnlySpan<byte> values)
+        {
+            return values.Length;
+        }
+
+        public static int Count(ReadOnlySpan<byte> values, int start = 0)
+        {
+            return values.Length - start;
+        }
+    }
 }
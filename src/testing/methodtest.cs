@@ -185,6 +185,26 @@ namespace Python.Test
             return "Got int-object";
         }
 
+        public static string TestRepeatedOverload(int i)
+        {
+            return "Got int";
+        }
+
+        public static string TestRepeatedOverload(double d)
+        {
+            return "Got double";
+        }
+
+        public static string TestRepeatedOverload(char c)
+        {
+            return "Got char";
+        }
+
+        public static string TestRepeatedOverload(string s)
+        {
+            return "Got string";
+        }
+
         public static bool TestStringOutParams(string s, out string s1)
         {
             s1 = "output string";
@@ -754,6 +774,16 @@ namespace Python.Test
         public string Foo(int a) { return "Arity 1"; }
         public string Foo(int a, int b) { return "Arity 2"; }
     }
+
+    public struct MutableStruct
+    {
+        public int Value;
+
+        public void Increment()
+        {
+            Value++;
+        }
+    }
 }
 
 namespace PlainOldNamespace
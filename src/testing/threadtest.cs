@@ -1,4 +1,5 @@
 using System;
+using System.Runtime.InteropServices;
 using Python.Runtime;
 
 namespace Python.Test
@@ -46,6 +47,45 @@ namespace Python.Test
             }
         }
 
+        public static bool GILHeldInProperty => Py.IsGILHeld;
+
+        [ReleaseGIL]
+        public static bool GILHeldInReleasingProperty => Py.IsGILHeld;
+
+        public static bool GILHeldInSetter;
+
+        [ReleaseGIL]
+        public bool ReleasingProperty
+        {
+            get => Py.IsGILHeld;
+            set => GILHeldInSetter = Py.IsGILHeld;
+        }
+
+        [UnmanagedFunctionPointer(CallingConvention.Cdecl)]
+        delegate int NativeCallback();
+
+        static readonly NativeCallback gilHeldCallback = () =>
+        {
+            using (Py.GIL())
+            {
+                return Runtime.Runtime.PyGILState_Check();
+            }
+        };
+
+        /// <summary>
+        /// Passes a function pointer to <paramref name="callNative"/>, that checks
+        /// if <see cref="Py.GIL"/> takes the GIL, when native code released it.
+        /// </summary>
+        public static bool CallNativeWithGIL(PyObject callNative)
+        {
+            using (Py.GIL())
+            {
+                IntPtr callback = Marshal.GetFunctionPointerForDelegate(gilHeldCallback);
+                using var result = callNative.Invoke(new PyInt(callback.ToInt64()));
+                return result.As<int>() != 0;
+            }
+        }
+
         public static string CallEchoString2(string arg)
         {
             using (Py.GIL())
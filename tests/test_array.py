@@ -6,6 +6,7 @@ import clr
 import Python.Test as Test
 import System
 import pytest
+import sys
 
 from collections import UserList
 from System import Single as float32
@@ -1405,3 +1406,241 @@ def test_dict_keys_to_array():
     assert arr[1] == "b"
     assert arr[2] == "c"
 
+
+
+def test_buffer_to_array():
+    """Test conversion of objects supporting the buffer protocol to arrays."""
+    import array
+    from System import Array, Byte, SByte, Double, Int32, Int64
+
+    arr = Array[Double](array.array('d', [0.5, 1.5, 2.5]))
+    assert list(arr) == [0.5, 1.5, 2.5]
+
+    arr = Array[Int32](array.array('i', [-1, 2, 3]))
+    assert list(arr) == [-1, 2, 3]
+
+    arr = Array[Byte](b"\x01\xff")
+    assert list(arr) == [1, 255]
+
+    arr = Array[Double](array.array('d'))
+    assert len(arr) == 0
+
+    # non-contiguous views are gathered by PyBuffer_ToContiguous
+    arr = Array[Double](memoryview(array.array('d', range(6)))[::2])
+    assert list(arr) == [0.0, 2.0, 4.0]
+
+    # buffers of different item types are converted item by item
+    arr = Array[Int64](array.array('i', [1, 2]))
+    assert list(arr) == [1, 2]
+
+    with pytest.raises(OverflowError):
+        _ = Array[SByte](b"\xff")
+
+
+def test_buffer_to_span():
+    """Test passing buffers and arrays to span and memory parameters."""
+    import array
+    from System import Array, Double, Int32
+    from Python.Test import SpanTest
+
+    values = array.array('d', [0.5, 1.5, 2.5])
+    for _ in range(5):
+        assert SpanTest.Sum(values) == 4.5
+
+    assert SpanTest.Sum(Array[Double]([1.0, 2.0])) == 3.0
+
+    # writable spans share memory with the buffer
+    items = array.array('i', [0, 0, 0])
+    SpanTest.Fill(items, 7)
+    assert list(items) == [7, 7, 7]
+
+    clr_items = Array[Int32]([1, 2])
+    SpanTest.Fill(clr_items, 3)
+    assert list(clr_items) == [3, 3]
+
+    assert SpanTest.GetLength(bytearray(b"abc")) == 3
+    assert SpanTest.First(b"xyz") == ord("x")
+
+    # bytes are read-only
+    with pytest.raises(TypeError):
+        SpanTest.GetLength(b"abc")
+
+    # item types must match
+    with pytest.raises(TypeError):
+        SpanTest.Sum(array.array('f', [1.0]))
+
+
+def test_span_buffer_released_after_call():
+    """Test that buffers passed to span and memory parameters are released
+    when the call returns, so that their exporters can be resized."""
+    import array
+    from Python.Test import SpanTest
+
+    data = bytearray(b"abc")
+    SpanTest.Clear(data)
+    data.append(1)
+    assert data == bytearray(b"\0\0\0\1")
+
+    assert SpanTest.GetLength(data) == 4
+    data.extend(b"de")
+
+    # the overload, that needs a default value, is converted too, but not called
+    assert SpanTest.Count(data) == 6
+    data.append(2)
+
+    assert SpanTest()[data] == 7
+    data.append(3)
+
+    items = array.array('i', [1, 2])
+    SpanTest.Fill(items, 3)
+    items.extend([4])
+    assert list(items) == [3, 3, 4]
+
+
+def test_array_buffer_export():
+    """Test exporting the memory of .NET arrays through the buffer protocol."""
+    from System import Array, Boolean, Double, Int32
+
+    items = Array[Double]([0.0, 1.0, 2.0])
+    view = memoryview(items)
+    assert view.format == 'd'
+    assert view.shape == (3,)
+    assert not view.readonly
+
+    # the view shares memory with the array
+    view[0] = 5.0
+    assert items[0] == 5.0
+    items[1] = 6.0
+    assert view[1] == 6.0
+
+    # concurrent exports share the pinned array
+    other = memoryview(items)
+    view.release()
+    other[2] = 7.0
+    assert items[2] == 7.0
+    other.release()
+
+    assert bytes(Array[Int32]([1])) == (1).to_bytes(4, sys.byteorder)
+    assert memoryview(Array[Boolean]([True, False])).tolist() == [True, False]
+
+    grid = Array.CreateInstance(Int32, 2, 3)
+    grid[1, 2] = 4
+    view = memoryview(grid)
+    assert view.shape == (2, 3)
+    assert view.strides == (12, 4)
+    assert view[1, 2] == 4
+
+
+def test_array_slicing():
+    """Test getting slices of arrays."""
+    from System import Array, Int32, String
+
+    items = Array[Int32](range(10))
+    result = items[2:5]
+    assert isinstance(result, Array[Int32])
+    assert list(result) == [2, 3, 4]
+    assert list(items[::3]) == [0, 3, 6, 9]
+    assert list(items[::-4]) == [9, 5, 1]
+    assert list(items[-2:]) == [8, 9]
+    assert len(items[5:2]) == 0
+
+    # slices are copies
+    result[0] = 100
+    assert items[2] == 2
+
+    strings = Array[String](["a", "b", "c"])
+    assert list(strings[1:]) == ["b", "c"]
+
+    grid = Array.CreateInstance(Int32, 3, 4)
+    for i in range(3):
+        for j in range(4):
+            grid[i, j] = i * 10 + j
+
+    block = grid[1:, ::2]
+    assert block.Rank == 2
+    assert (block.GetLength(0), block.GetLength(1)) == (2, 2)
+    assert [block[0, 0], block[0, 1], block[1, 0], block[1, 1]] == [10, 12, 20, 22]
+
+    # integer indexes drop dimensions
+    assert list(grid[1, :]) == [10, 11, 12, 13]
+    assert list(grid[:, 3]) == [3, 13, 23]
+    assert list(grid[2]) == [20, 21, 22, 23]
+
+    column = Array.CreateInstance(String, 2, 2)
+    column[0, 1] = "x"
+    column[1, 1] = "y"
+    assert list(column[:, 1]) == ["x", "y"]
+
+    with pytest.raises(IndexError):
+        _ = grid[0:1, 0:1, 0:1]
+
+    with pytest.raises(TypeError):
+        _ = grid["a", :]
+
+
+def test_array_slice_assignment():
+    """Test assigning to slices of arrays."""
+    import array
+    from System import Array, Double, Int32, Int64, String
+
+    items = Array[Int32](range(6))
+    items[1:3] = [10, 20]
+    assert list(items) == [0, 10, 20, 3, 4, 5]
+
+    items[::2] = Array[Int32]([7, 8, 9])
+    assert list(items) == [7, 10, 8, 3, 9, 5]
+
+    # buffers are copied at once
+    items[3:] = array.array('i', [1, 2, 3])
+    assert list(items) == [7, 10, 8, 1, 2, 3]
+    items[::-2] = array.array('i', [4, 5, 6])
+    assert list(items) == [7, 6, 8, 5, 2, 4]
+    items[:2] = array.array('q', [0, 1])
+    assert list(items) == [0, 1, 8, 5, 2, 4]
+
+    # overlapping source
+    items[1:] = items[:-1]
+    assert list(items) == [0, 0, 1, 8, 5, 2]
+    items[1:] = memoryview(items)[:-1]
+    assert list(items) == [0, 0, 0, 1, 8, 5]
+    items[:] = memoryview(items)[::-1]
+    assert list(items) == [5, 8, 1, 0, 0, 0]
+
+    strings = Array[String](["a", "b", "c"])
+    strings[:2] = ["x", "y"]
+    assert list(strings) == ["x", "y", "c"]
+
+    grid = Array.CreateInstance(Double, 2, 3)
+    grid[:, 1:] = _grid(Double, [[1.0, 2.0], [3.0, 4.0]])
+    assert [grid[i, j] for i in range(2) for j in range(3)] == [0, 1, 2, 0, 3, 4]
+    grid[1, :] = [5.0, 6.0, 7.0]
+    assert [grid[1, j] for j in range(3)] == [5, 6, 7]
+    grid[0] = memoryview(array.array('d', [8.0, 9.0, 10.0]))
+    assert [grid[0, j] for j in range(3)] == [8, 9, 10]
+
+    with pytest.raises(ValueError):
+        items[1:3] = [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        grid[:, 1:] = [1.0, 2.0, 3.0, 4.0]
+
+    with pytest.raises(TypeError):
+        items[1:3] = ["a", "b"]
+
+    with pytest.raises(TypeError):
+        del items[1:3]
+
+    arr = Array[Int64]([1, 2])
+    with pytest.raises(OverflowError):
+        arr[:] = [1, 2 ** 64]
+
+
+def _grid(element_type, rows):
+    """Creates a two dimensional .NET array from a list of rows."""
+    from System import Array
+
+    result = Array.CreateInstance(element_type, len(rows), len(rows[0]))
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            result[i, j] = value
+    return result
@@ -176,6 +176,47 @@ def test_ienumerator_iteration():
     for item in chars:
         assert item in 'test string'
 
+
+def test_generic_collection_iteration():
+    """Test iteration over arrays, lists and other generic collections."""
+    from System import Array, DayOfWeek, Int64
+    from System.Collections.Generic import HashSet, List
+
+    items = List[Int64]()
+    for i in range(5):
+        items.Add(i)
+    assert list(items) == [0, 1, 2, 3, 4]
+    assert list(items.ToArray()) == [0, 1, 2, 3, 4]
+    assert set(HashSet[Int64](items)) == {0, 1, 2, 3, 4}
+    assert list(items.GetEnumerator()) == [0, 1, 2, 3, 4]
+
+    flags = List[bool]()
+    flags.Add(True)
+    assert [type(flag) for flag in flags] == [bool]
+
+    days = Array[DayOfWeek]([DayOfWeek.Monday])
+    assert list(days) == [DayOfWeek.Monday]
+
+    names = List[str]()
+    names.Add("a")
+    names.Add(None)
+    assert list(names) == ["a", None]
+
+
+def test_modified_list_iteration():
+    """Test that modifying a list during the iteration raises."""
+    from System import InvalidOperationException
+    from System.Collections.Generic import List
+
+    items = List[int]()
+    items.Add(1)
+    items.Add(2)
+
+    with pytest.raises(InvalidOperationException):
+        for item in items:
+            items.Add(item)
+
+
 def test_iterable():
     """Test what objects are Iterable"""
     from collections.abc import Iterable
@@ -755,3 +755,42 @@ def test_explicit_conversion():
         assert int(t(123.4)) == 123
         with pytest.raises(TypeError):
             index(t(123.4))
+
+
+def test_repeated_typed_conversions():
+    """Test that conversions of statically typed primitive values behave the
+    same once member accessors and method invokers are compiled."""
+    ob = ConversionTest()
+    items = System.Array[System.Int32]([0, 1, 2])
+    for _ in range(10):
+        ob.Int32Field = 42
+        assert ob.Int32Field == 42
+        ob.Int32Field = System.Int32(7)
+        assert ob.Int32Field == 7
+
+        ob.SingleField = 0.5
+        assert ob.SingleField == 0.5
+        ob.BooleanField = True
+        assert ob.BooleanField is True
+
+        with pytest.raises(TypeError):
+            ob.Int32Field = "spam"
+        with pytest.raises(OverflowError):
+            ob.Int32Field = 2147483648
+        with pytest.raises(OverflowError):
+            ob.SingleField = 3.402824e38
+        with pytest.raises(TypeError):
+            ob.BooleanField = 1
+
+        items[1] = 5
+        assert items[1] == 5
+        assert type(items[1]) is int
+        with pytest.raises(OverflowError):
+            items[0] = 2147483648
+        with pytest.raises(TypeError):
+            items[0] = "wrong"
+
+        result = System.Int32.Parse("12")
+        assert result == 12
+        assert type(result) is int
+        assert System.Convert.ToBoolean(1) is True
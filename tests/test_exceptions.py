@@ -230,6 +230,21 @@ def test_catch_exception_from_managed_property():
     assert isinstance(e, OverflowException)
 
 
+def test_catch_exception_from_frequently_accessed_property():
+    """Test catching an exception from a property, that is accessed
+    often enough to be compiled."""
+    from Python.Test import ExceptionTest
+    from System import OverflowException
+
+    ob = ExceptionTest()
+    for _ in range(10):
+        with pytest.raises(OverflowException):
+            _ = ob.ThrowProperty
+
+        with pytest.raises(OverflowException):
+            ob.ThrowProperty = 1
+
+
 def test_catch_exception_managed_class():
     """Test catching the managed class of an exception."""
     from System import OverflowException
@@ -380,6 +395,16 @@ def test_chained_exceptions():
         assert exc.__cause__ == exc.InnerException
         exc = exc.__cause__
 
+def test_repeated_chained_exceptions():
+    """Test that the outermost exception is raised once the method
+    is no longer invoked through reflection."""
+    from Python.Test import ExceptionTest
+
+    for _ in range(10):
+        with pytest.raises(Exception) as cm:
+            ExceptionTest.ThrowChainedExceptions()
+        assert cm.value.Message == "Outer exception"
+
 def test_iteration_exception():
     from Python.Test import ExceptionTest
     from System import OverflowException
@@ -390,3 +390,38 @@ def test_nullable_field():
 
     with pytest.raises(TypeError):
         FieldTest().EnumField = None
+
+
+def test_frequently_accessed_fields():
+    """Test fields, that are accessed often enough to be compiled."""
+    from Python.Test import MutableStruct, ShortEnum
+
+    ob = FieldTest()
+    for i in range(10):
+        ob.Int32Field = i
+        assert ob.Int32Field == i
+        ob.Int64Field = 2 ** 40 + i
+        assert ob.Int64Field == 2 ** 40 + i
+        ob.UInt64Field = 2 ** 64 - 1
+        assert ob.UInt64Field == 2 ** 64 - 1
+        ob.DoubleField = i / 2
+        assert ob.DoubleField == i / 2
+        ob.BooleanField = i % 2 == 0
+        assert ob.BooleanField is (i % 2 == 0)
+        ob.CharField = 'B'
+        assert ob.CharField == 'B'
+        ob.StringField = None
+        assert ob.StringField is None
+        ob.EnumField = ShortEnum.One
+        assert ob.EnumField == ShortEnum.One
+        FieldTest.PublicStaticField = i
+        assert FieldTest.PublicStaticField == i
+        assert FieldTest.ConstField == 0
+
+        with pytest.raises(TypeError):
+            ob.Int32Field = None
+
+    value = MutableStruct()
+    for i in range(10):
+        value.Value = i
+        assert value.Value == i
@@ -341,6 +341,25 @@ def test_value_ref_params():
         MethodTest.TestValueRefParams("hi", None)
 
 
+def test_repeated_byref_params():
+    """Test byref parameters of frequently called methods."""
+    for i in range(10):
+        assert MethodTest.TestValueRefParams("hi", i) == (True, 42)
+        assert MethodTest.TestVoidSingleOutParam() == 42
+        assert MethodTest.TestStringOutParams("hi", None) == (True, "output string")
+
+
+def test_repeated_value_type_instance_method():
+    """Test that frequently called mutating methods of value types
+    modify the wrapped value."""
+    from Python.Test import MutableStruct
+
+    ob = MutableStruct()
+    for _ in range(10):
+        ob.Increment()
+    assert ob.Value == 10
+
+
 def test_object_out_params():
     """Test use of object out-parameters."""
     result = MethodTest.TestObjectOutParams("hi", MethodTest())
@@ -918,6 +937,26 @@ def test_object_in_multiparam_exception():
     c = e.__cause__
     assert c.GetType().FullName == 'System.AggregateException'
     assert len(c.InnerExceptions) == 2
+    for inner in c.InnerExceptions:
+        assert "in method System.String TestOverloadedObjectThree" in inner.Message
+        assert inner.InnerException is not None
+
+
+def test_mismatch_cause_from_first_conversion():
+    """Test that arguments are converted only once to report, why no overload matches"""
+    calls = []
+
+    class Items:
+        def __iter__(self):
+            calls.append(self)
+            raise ValueError("not iterable")
+
+    with pytest.raises(TypeError) as excinfo:
+        MethodTest.TestNonParamsArrayInLastPlace(1, Items())
+
+    assert len(calls) == 1
+    cause = excinfo.value.__cause__.InnerExceptions[0].InnerException
+    assert "to System.Int32[]" in cause.Message
 
 def test_case_sensitive():
     """Test that case-sensitivity is respected. GH#81"""
@@ -1218,6 +1257,12 @@ def test_keyword_arg_method_resolution():
     ob = MethodArityTest()
     assert ob.Foo(1, b=2) == "Arity 2"
 
+def test_keyword_arg_not_interned():
+    # keyword names built at runtime are not interned by Python
+    name = "".join(["params", "Array"])
+    res = MethodTest.ParamsArrayOverloaded(1, **{name: []})
+    assert res == "with params-array"
+
 def test_params_array_overload():
     res = MethodTest.ParamsArrayOverloaded()
     assert res == "without params-array"
@@ -1243,6 +1288,18 @@ def test_params_array_overload():
     res = MethodTest.ParamsArrayOverloaded(1, 2, 3, i=1)
     assert res == "with params-array"
 
+def test_repeated_overload_selection_depends_on_values():
+    """Test that overloads selected before for the same argument types
+    do not override value-dependent overload resolution."""
+    for _ in range(3):
+        assert MethodTest.TestRepeatedOverload(5) == "Got int"
+        # does not fit into int
+        assert MethodTest.TestRepeatedOverload(2 ** 40) == "Got double"
+        assert MethodTest.TestRepeatedOverload(1.5) == "Got double"
+        assert MethodTest.TestRepeatedOverload("ab") == "Got string"
+        # single character strings convert to char
+        assert MethodTest.TestRepeatedOverload("a") == "Got char"
+
 @pytest.mark.skip(reason="FIXME: incorrectly failing")
 def test_params_array_overloaded_failing():
     res = MethodTest.ParamsArrayOverloaded(1, 2, i=1)
@@ -294,6 +294,39 @@ def test_module_get_attr():
         _ = getattr(System, 1)
 
 
+def test_module_get_attr_after_assembly_load():
+    """Test that missing module attributes are found once an assembly
+    exporting them is loaded."""
+    import clr
+    import System
+
+    loaded = [a.GetName().Name for a in System.AppDomain.CurrentDomain.GetAssemblies()]
+    if "System.Console" in loaded:
+        pytest.skip("System.Console is already loaded")
+
+    for _ in range(2):
+        assert not hasattr(System, "Console")
+
+    clr.AddReference("System.Console")
+    assert is_clr_class(System.Console)
+
+
+def test_module_get_attr_defined_in_dynamic_assembly():
+    """Test that missing module attributes are found once a dynamic
+    assembly defines them."""
+    from System.Reflection import AssemblyName, TypeAttributes
+    from System.Reflection.Emit import AssemblyBuilder, AssemblyBuilderAccess
+    import Python.Test as Test
+
+    builder = AssemblyBuilder.DefineDynamicAssembly(
+        AssemblyName("DynamicModuleTest"), AssemblyBuilderAccess.Run)
+    module = builder.DefineDynamicModule("DynamicModuleTest")
+
+    assert not hasattr(Test, "DynamicModuleTest")
+    module.DefineType("Python.Test.DynamicModuleTest", TypeAttributes.Public).CreateType()
+    assert is_clr_class(Test.DynamicModuleTest)
+
+
 def test_module_attr_abuse():
     """Test handling of attempts to set module attributes."""
 
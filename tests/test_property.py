@@ -137,6 +137,22 @@ def test_property_descriptor_abuse():
         desc.__set__(0, 0)
 
 
+def test_frequently_accessed_properties():
+    """Test properties, that are accessed often enough to be compiled."""
+    ob = PropertyTest()
+    for i in range(10):
+        ob.PublicProperty = i
+        assert ob.PublicProperty == i
+
+        PropertyTest.PublicStaticProperty = i
+        assert PropertyTest.PublicStaticProperty == i
+
+        with pytest.raises(TypeError):
+            ob.PublicProperty = "spam"
+
+    PropertyTest.PublicStaticProperty = 0
+
+
 def test_interface_property():
     """Test properties of interfaces. Added after a bug report
        that an IsAbstract check was inappropriate and prevented
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""Test awaiting .NET tasks from asyncio and running coroutines from .NET."""
+
+import asyncio
+
+import pytest
+import System
+from System.Threading.Tasks import Task, TaskCompletionSource
+from Python.Runtime import Py
+
+
+def test_await_completed_task():
+    async def main():
+        return await Task.FromResult[int](42)
+
+    assert asyncio.run(main()) == 42
+
+
+def test_await_pending_task():
+    completion = TaskCompletionSource[str]()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, completion.SetResult, "done")
+        return await completion.Task
+
+    assert asyncio.run(main()) == "done"
+
+
+def test_await_task_without_result():
+    async def main():
+        return await Task.Delay(10)
+
+    assert asyncio.run(main()) is None
+
+
+def test_await_does_not_block_event_loop():
+    order = []
+
+    async def other():
+        order.append("other")
+
+    async def main():
+        pending = asyncio.ensure_future(other())
+        await Task.Delay(50)
+        order.append("task")
+        await pending
+
+    asyncio.run(main())
+    assert order == ["other", "task"]
+
+
+def test_await_faulted_task():
+    async def main():
+        await Task.FromException(System.InvalidOperationException("failed"))
+
+    with pytest.raises(System.InvalidOperationException):
+        asyncio.run(main())
+
+
+def test_await_canceled_task():
+    completion = TaskCompletionSource[int]()
+    completion.SetCanceled()
+
+    async def main():
+        await completion.Task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main())
+
+
+def test_await_value_task():
+    try:
+        from System.Threading.Tasks import ValueTask
+    except ImportError:
+        pytest.skip("ValueTask requires System.Threading.Tasks.Extensions")
+
+    async def main():
+        return await ValueTask[int](7)
+
+    assert asyncio.run(main()) == 7
+
+
+def test_run_coroutine():
+    async def compute():
+        await asyncio.sleep(0.01)
+        return 6 * 7
+
+    async def main():
+        return await Py.RunCoroutine(compute())
+
+    assert asyncio.run(main()) == 42
+
+
+def test_run_coroutine_exception():
+    async def fail():
+        raise ValueError("failed")
+
+    task = Py.RunCoroutine(fail())
+    with pytest.raises(ValueError):
+        asyncio.run(_await(task))
+
+
+async def _await(task):
+    return await task
@@ -30,6 +30,32 @@ def test_double_callback_to_python():
     dprint("thread %s DoubleCallBack ret" % thread.get_ident())
 
 
+def test_release_gil_property():
+    """Test that properties marked with ReleaseGIL release the GIL."""
+    from Python.Test import ThreadTest
+
+    assert ThreadTest.GILHeldInProperty
+    assert not ThreadTest.GILHeldInReleasingProperty
+
+    ob = ThreadTest()
+    assert not ob.ReleasingProperty
+    ThreadTest.GILHeldInSetter = True
+    ob.ReleasingProperty = True
+    assert not ThreadTest.GILHeldInSetter
+
+
+def test_gil_released_by_native_code():
+    """Test acquiring the GIL in callbacks from native code, that released it."""
+    import ctypes
+    from Python.Test import ThreadTest
+
+    def call_native(callback):
+        # ctypes releases the GIL while calling foreign functions
+        return ctypes.CFUNCTYPE(ctypes.c_int)(callback)()
+
+    assert ThreadTest.CallNativeWithGIL(call_native)
+
+
 def test_python_thread_calls_to_clr():
     """Test calls by Python-spawned threads into managed code."""
     # This test is very likely to hang if something is wrong ;)